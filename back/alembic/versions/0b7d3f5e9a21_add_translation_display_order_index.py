@@ -0,0 +1,40 @@
+"""add_translation_display_order_index
+
+Replaces idx_translations_entry_id with a composite index in display order
+(entry_id, is_preferred DESC, created_at, id). Listing pages load the
+translations of a page of entries with one ordered IN query, or the first N
+per entry through LATERAL, and both read this index in order without a sort.
+
+Revision ID: 0b7d3f5e9a21
+Revises: e2a4c6b81f37
+Create Date: 2026-10-17 16:48:03.271554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b7d3f5e9a21'
+down_revision: Union[str, Sequence[str], None] = 'e2a4c6b81f37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_translations_entry_display_order',
+        'translations',
+        ['entry_id', sa.text('is_preferred DESC'), 'created_at', 'id']
+    )
+    # Covered by the new index's leading column
+    op.drop_index('idx_translations_entry_id', table_name='translations')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_translations_entry_id', 'translations', ['entry_id'])
+    op.drop_index('idx_translations_entry_display_order', table_name='translations')
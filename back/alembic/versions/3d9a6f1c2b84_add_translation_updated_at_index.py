@@ -0,0 +1,31 @@
+"""add_translation_updated_at_index
+
+The typeahead index reads the translations changed since its last refresh
+(translations.updated_at >= watermark) every few seconds, and the newest
+translation update; both need an index on updated_at instead of a scan.
+
+Revision ID: 3d9a6f1c2b84
+Revises: 0b7d3f5e9a21
+Create Date: 2026-10-17 19:12:44.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d9a6f1c2b84'
+down_revision: Union[str, Sequence[str], None] = '0b7d3f5e9a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_translations_updated_at', 'translations', ['updated_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_translations_updated_at', table_name='translations')
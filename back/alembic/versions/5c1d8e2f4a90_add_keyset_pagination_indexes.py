@@ -0,0 +1,43 @@
+"""add_keyset_pagination_indexes
+
+Adds composite (sort column, id) indexes on entries so that keyset pagination
+over every sortable column of GET /entries is an index range scan.
+
+Revision ID: 5c1d8e2f4a90
+Revises: b6e0f1f302b3
+Create Date: 2026-10-17 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1d8e2f4a90'
+down_revision: Union[str, Sequence[str], None] = 'b6e0f1f302b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SORT_COLUMNS = [
+    'primary_name',
+    'original_script',
+    'language_code',
+    'entry_type',
+    'is_verified',
+    'created_at',
+    'updated_at',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in SORT_COLUMNS:
+        op.create_index(f'idx_entries_{column}_id', 'entries', [column, 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in reversed(SORT_COLUMNS):
+        op.drop_index(f'idx_entries_{column}_id', table_name='entries')
@@ -0,0 +1,141 @@
+"""add_normalized_name_search
+
+Adds an accent-, case- and script-insensitive key of each entry's names to
+entry_search_documents, for the "normalized" search mode:
+
+- fold_text(): lower case, NFD, combining marks removed. Drops Greek accents,
+  breathings and iota subscripts as well as Latin macrons and diacritics.
+- name_search_key(): fold_text() plus Greek-to-Latin transliteration and a few
+  spelling merges (k/c, kh/ch, y/u, ou/u, j/i, v/u, rh/r, initial h), so that
+  Ἀχιλλεύς, Achilleus and Akhilleus share the key "achilleus".
+
+names_key holds the key of primary_name, original_script and
+alternative_names (trigram-indexed for fuzzy matching), names_document the
+same as a 'simple' tsvector (GIN-indexed for full-text matching). Both are
+maintained by refresh_entry_search_document() like the existing document.
+
+Revision ID: 6f2c8e4a1d57
+Revises: 3d9a6f1c2b84
+Create Date: 2026-10-17 21:05:37.114902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f2c8e4a1d57'
+down_revision: Union[str, Sequence[str], None] = '3d9a6f1c2b84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(r"""
+    CREATE OR REPLACE FUNCTION fold_text(value text) RETURNS text AS $$
+        SELECT regexp_replace(normalize(lower(value), NFD), '[\u0300-\u036f]', '', 'g');
+    $$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+    """)
+
+    op.execute(r"""
+    CREATE OR REPLACE FUNCTION name_search_key(value text) RETURNS text AS $$
+        SELECT regexp_replace(
+            replace(replace(replace(replace(
+                translate(
+                    replace(replace(replace(replace(replace(replace(replace(replace(
+                        fold_text(value),
+                        'γγ', 'ng'), 'γκ', 'nk'), 'γχ', 'nch'), 'γξ', 'nx'),
+                        'θ', 'th'), 'φ', 'ph'), 'χ', 'ch'), 'ψ', 'ps'),
+                    'αβγδεζηικλμνξοπρσςτυωjvy',
+                    'abgdezeiklmnxoprsstuoiuu'
+                ),
+                'kh', 'ch'), 'k', 'c'), 'rh', 'r'), 'ou', 'u'),
+            '(^|[^a-z])h', '\1', 'g'
+        );
+    $$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+    """)
+
+    op.add_column(
+        'entry_search_documents',
+        sa.Column('names_key', sa.Text(), nullable=False, server_default='')
+    )
+    op.add_column(
+        'entry_search_documents',
+        sa.Column('names_document', TSVECTOR, nullable=False, server_default=sa.text("''::tsvector"))
+    )
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_entry_search_document(p_entry_id uuid) RETURNS void AS $$
+    BEGIN
+        INSERT INTO entry_search_documents (entry_id, document, names_key, names_document, updated_at)
+        SELECT e.id,
+            e.search_vector ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.translated_name, ' '), '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.notes, ' '), '')), 'D'),
+            k.names_key,
+            to_tsvector('simple', k.names_key),
+            NOW()
+        FROM entries e
+        CROSS JOIN LATERAL (
+            SELECT name_search_key(concat_ws(' ',
+                e.primary_name, e.original_script, array_to_string(e.alternative_names, ' ')
+            )) AS names_key
+        ) k
+        LEFT JOIN translations t ON t.entry_id = e.id
+        WHERE e.id = p_entry_id
+        GROUP BY e.id, k.names_key
+        ON CONFLICT (entry_id) DO UPDATE
+            SET document = EXCLUDED.document,
+                names_key = EXCLUDED.names_key,
+                names_document = EXCLUDED.names_document,
+                updated_at = EXCLUDED.updated_at;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    # Populate existing entries (scripts/backfill_search_documents.py rebuilds in batches)
+    op.execute("SELECT refresh_entry_search_document(id) FROM entries;")
+
+    op.create_index(
+        'idx_entry_search_documents_names_document', 'entry_search_documents', ['names_document'],
+        postgresql_using='gin'
+    )
+    op.create_index(
+        'idx_entry_search_documents_names_key_trgm', 'entry_search_documents', ['names_key'],
+        postgresql_using='gin', postgresql_ops={'names_key': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_entry_search_documents_names_key_trgm', table_name='entry_search_documents')
+    op.drop_index('idx_entry_search_documents_names_document', table_name='entry_search_documents')
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_entry_search_document(p_entry_id uuid) RETURNS void AS $$
+    BEGIN
+        INSERT INTO entry_search_documents (entry_id, document, updated_at)
+        SELECT e.id,
+            e.search_vector ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.translated_name, ' '), '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.notes, ' '), '')), 'D'),
+            NOW()
+        FROM entries e
+        LEFT JOIN translations t ON t.entry_id = e.id
+        WHERE e.id = p_entry_id
+        GROUP BY e.id
+        ON CONFLICT (entry_id) DO UPDATE
+            SET document = EXCLUDED.document, updated_at = EXCLUDED.updated_at;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.drop_column('entry_search_documents', 'names_document')
+    op.drop_column('entry_search_documents', 'names_key')
+
+    op.execute("DROP FUNCTION IF EXISTS name_search_key(text);")
+    op.execute("DROP FUNCTION IF EXISTS fold_text(text);")
@@ -0,0 +1,227 @@
+"""add_chinese_bigram_search
+
+Adds a Chinese search document to entry_search_documents. The english
+configuration keeps a whole run of Han characters as one token, so a
+substring of a translated name never matched.
+
+- fold_hanzi(): maps common Traditional characters to their Simplified form.
+- han_bigram_document(): tsvector of the overlapping character bigrams of
+  every Han run (plus the last character of each run), with positions, after
+  fold_hanzi(). Runs are one position apart, so bigrams never chain across them.
+- han_tsquery(): the matching query, the bigrams of each Han run of the
+  search text chained with <-> (a single character becomes a prefix match).
+
+han_document holds the translated names (A) and notes (D) of the entry, is
+GIN-indexed and maintained by refresh_entry_search_document().
+
+Revision ID: 9c4e1b7a2f63
+Revises: 6f2c8e4a1d57
+Create Date: 2026-10-17 23:12:48.530271
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e1b7a2f63'
+down_revision: Union[str, Sequence[str], None] = '6f2c8e4a1d57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# One-to-one Traditional -> Simplified character pairs for fold_hanzi()
+TRADITIONAL = (
+    "國學們個來時為這說會對過後與萬經發開問間關門長東車馬鳥魚龍風飛書畫話語讀詞譯記論"
+    "認識議變歷曆聖羅爾亞歐蘭臘薩維農諾瑪納紐約陽陰陸隊際麗麥黃齊齒龜靈戰戲劇創劍勞勢"
+    "勝區華單嚴園圓圖團報場塊墳壓壞壯聲處備頭夢奪奮婦媽孫寧實審寫將專尋導屬島峽嶺巖幣"
+    "帥師帳帶幫廣廟廠張彈強歸當錄徑從復徵憶應懷戀戶擇擊據擴攝敗敵數斷於無舊顯晉朧條極"
+    "構樂標樣橋機權歡歲殘殺殼氣漢溝滅湯溫滿漁潔澤濟灣燈爐點熱爭爺狀獄獨獎獸環現產畢異"
+    "療盡監盤眾礎禮禱離種稱穩窮競筆節範築簡糧紀純紙級紅細終組結給絕統絲綠網線練總織繼"
+    "續義習聯聞職肅腦臉興舉艦藝葉蒼蘇號蟲蠻術衛衝補裝製複見規視親覺觀計訂訓託許設訴診"
+    "證評詩試誠誤誰課調談請諸謀講謝護讓豐貝負財貢貨貴買費貿資賊賓賜賞賢賣質購贊趙趕跡"
+    "踐軍軌軟載輕輪輸轉辦辭邊遠遲選遺還邏郵鄉鄭醫釋針銀銅鋼錢錯鍵鐘鐵鑰閃閉閒閣閱闊陣"
+    "陳階隨險隱雖雙雜雞難雲電霧靜韓頁頂項順須預頓領顆題額顏願類顧飯飲餘館駐騎驗驚體髮"
+    "鬥鬧魯鮮鳳鴨鵝鷹鹽麼黨倫偉傑傳傷億僅優價儀兒內兩凱劉厲嗎嚕奧婭嬰宮壽彌徹恆愛慶憲"
+    "擬榮毆滬濤瀾災烏猶璽甕畝瘋皚盧矯碩穌竇紹絡綏緹繆聶膠臺舖莊萊蓋蓮藍蘆裏襪覓訶謨譚"
+    "賀賴軻輝邁鄧釐錫鎊閔闌頗颯馮騰鮑鴻齋喬遜瓊賽幾蓀蘿諦達遼邇鐸鑒鏡綺緬濕堯嬌憂懼拋"
+    "掃擁擔擺攜敘斂暢暫樞樓檢櫃殲氈沒洶淚渦滯漲潛澀濱瀉瀕灑燒燭爛牆犧獵琺癒盜睏矚碼確"
+    "礙祕禍穀窩竊筍簽籃籤粵糾紋紛紡絞綁綜綢緊緒緣編緩縣縮績繩繪繞纏罰罷聰聽脅脈腳膚膽"
+    "艱芻莖薦薑藥蘊虛虜蝦螞蠟襲觸訊詐詢該詳誇誌誕誘誡誦諒諧諭謊謎謙謹譜譽讚豎豬貓貞貪"
+    "貫責貳賦賬賭賺贈贏趨躍軀較輔輩輯轄轟辯迴連週進運違遙遞適遷鄰醜釘鈴鉛鉤銘銳鋒鋪錦"
+    "鍊鍋鎖鎮鏈鐲鑄鑽閘閩閻闆闖隸雋雛韋韌響頌頒頸頻顫颱飄飢飼飽飾餅養餓餵饒馳馴駕駝駱"
+    "騙騷驅驕驢骯髒鬆鬚鯨鳴鴉鴿鵬鶴鸚麵黴齡龐傘倆側偵僑儉償剛劃劑動務勵勸匯協卻厭參叢"
+    "吳員啟喚嘗嘆噴嚇囑圍執堅塵墜墮壇壘壩夠夾奐奬妝姦婁媯嫗嬪寢寶層屢岡崗嵐巔巒幀庫廢"
+    "廳彎彙恥悅惡惱惻愴慘慚慣慮憐懇懶戔挾捨掛採揚換揮損搖搶摯撥撫撲撿擠攔攤斃斬暈曉曠"
+    "枴棧棟棲楊楓榪槍樁橫櫻欄歎毀氫決沖況淒淨淵淺渾湧溼滄滌滷漚漸潑潰澆濁濃濾瀅瀟灘烴"
+    "煉煩熾燉營爍牘犢狹狽猙獅獲玆瑣瑤璣瓏疊瘡癢皺盞眥睞瞞瞭磚礦祿禪秈稅稈穢窯竄筧篩篤"
+    "簍籌籠粧糞糰紉紗紳絃絨綱綴緝緞緯縫縱繃繡繭纓纖罈罌羋羥翹耬聳脹腫膩膿臨艙艷芧茲荊"
+    "莢萇蒞蔔蔣蕭薈薊藎藹蘋蘚虧蛺蜆蝕蝸螢蠅蠱衊袞裊褲褸襖覽觴訐訛訝訟詛詠詼誅誨諂諄諮"
+    "諱謄謠譏譴讒豈豔貶貸賄賈賒賠贅贓趲踴蹟蹤躉軒軛軸輓輛輿轎辮邐鄒鄖醞醬釀釣鈍鈔鈞鉀"
+    "鉅銜銷鋁鋸錘錚錠鍍鍾鎂鎔鏟鐮鑑閡閨閥闡陘隕隴霽靂靄靦鞏韁韜頑頰頹顛顱飆餞餡饑饞駁"
+    "駒駭騁騾驟鬱魘鯉鰭鱗鳩鴛鴦鵲鶯鷗鸞麩黌黷鼇齜龕"
+)
+
+SIMPLIFIED = (
+    "国学们个来时为这说会对过后与万经发开问间关门长东车马鸟鱼龙风飞书画话语读词译记论"
+    "认识议变历历圣罗尔亚欧兰腊萨维农诺玛纳纽约阳阴陆队际丽麦黄齐齿龟灵战戏剧创剑劳势"
+    "胜区华单严园圆图团报场块坟压坏壮声处备头梦夺奋妇妈孙宁实审写将专寻导属岛峡岭岩币"
+    "帅师帐带帮广庙厂张弹强归当录径从复征忆应怀恋户择击据扩摄败敌数断于无旧显晋胧条极"
+    "构乐标样桥机权欢岁残杀壳气汉沟灭汤温满渔洁泽济湾灯炉点热争爷状狱独奖兽环现产毕异"
+    "疗尽监盘众础礼祷离种称稳穷竞笔节范筑简粮纪纯纸级红细终组结给绝统丝绿网线练总织继"
+    "续义习联闻职肃脑脸兴举舰艺叶苍苏号虫蛮术卫冲补装制复见规视亲觉观计订训托许设诉诊"
+    "证评诗试诚误谁课调谈请诸谋讲谢护让丰贝负财贡货贵买费贸资贼宾赐赏贤卖质购赞赵赶迹"
+    "践军轨软载轻轮输转办辞边远迟选遗还逻邮乡郑医释针银铜钢钱错键钟铁钥闪闭闲阁阅阔阵"
+    "陈阶随险隐虽双杂鸡难云电雾静韩页顶项顺须预顿领颗题额颜愿类顾饭饮余馆驻骑验惊体发"
+    "斗闹鲁鲜凤鸭鹅鹰盐么党伦伟杰传伤亿仅优价仪儿内两凯刘厉吗噜奥娅婴宫寿弥彻恒爱庆宪"
+    "拟荣殴沪涛澜灾乌犹玺瓮亩疯皑卢矫硕稣窦绍络绥缇缪聂胶台铺庄莱盖莲蓝芦里袜觅诃谟谭"
+    "贺赖轲辉迈邓厘锡镑闵阑颇飒冯腾鲍鸿斋乔逊琼赛几荪萝谛达辽迩铎鉴镜绮缅湿尧娇忧惧抛"
+    "扫拥担摆携叙敛畅暂枢楼检柜歼毡没汹泪涡滞涨潜涩滨泻濒洒烧烛烂墙牺猎珐愈盗困瞩码确"
+    "碍秘祸谷窝窃笋签篮签粤纠纹纷纺绞绑综绸紧绪缘编缓县缩绩绳绘绕缠罚罢聪听胁脉脚肤胆"
+    "艰刍茎荐姜药蕴虚虏虾蚂蜡袭触讯诈询该详夸志诞诱诫诵谅谐谕谎谜谦谨谱誉赞竖猪猫贞贪"
+    "贯责贰赋账赌赚赠赢趋跃躯较辅辈辑辖轰辩回连周进运违遥递适迁邻丑钉铃铅钩铭锐锋铺锦"
+    "炼锅锁镇链镯铸钻闸闽阎板闯隶隽雏韦韧响颂颁颈频颤台飘饥饲饱饰饼养饿喂饶驰驯驾驼骆"
+    "骗骚驱骄驴肮脏松须鲸鸣鸦鸽鹏鹤鹦面霉龄庞伞俩侧侦侨俭偿刚划剂动务励劝汇协却厌参丛"
+    "吴员启唤尝叹喷吓嘱围执坚尘坠堕坛垒坝够夹奂奖妆奸娄妫妪嫔寝宝层屡冈岗岚巅峦帧库废"
+    "厅弯汇耻悦恶恼恻怆惨惭惯虑怜恳懒戋挟舍挂采扬换挥损摇抢挚拨抚扑捡挤拦摊毙斩晕晓旷"
+    "拐栈栋栖杨枫杩枪桩横樱栏叹毁氢决冲况凄净渊浅浑涌湿沧涤卤沤渐泼溃浇浊浓滤滢潇滩烃"
+    "炼烦炽炖营烁牍犊狭狈狰狮获兹琐瑶玑珑叠疮痒皱盏眦睐瞒了砖矿禄禅籼税秆秽窑窜笕筛笃"
+    "篓筹笼妆粪团纫纱绅弦绒纲缀缉缎纬缝纵绷绣茧缨纤坛罂芈羟翘耧耸胀肿腻脓临舱艳苎兹荆"
+    "荚苌莅卜蒋萧荟蓟荩蔼苹藓亏蛱蚬蚀蜗萤蝇蛊蔑衮袅裤褛袄览觞讦讹讶讼诅咏诙诛诲谄谆咨"
+    "讳誊谣讥谴谗岂艳贬贷贿贾赊赔赘赃趱踊迹踪趸轩轭轴挽辆舆轿辫逦邹郧酝酱酿钓钝钞钧钾"
+    "巨衔销铝锯锤铮锭镀钟镁熔铲镰鉴阂闺阀阐陉陨陇霁雳霭腼巩缰韬顽颊颓颠颅飙饯馅饥馋驳"
+    "驹骇骋骡骤郁魇鲤鳍鳞鸠鸳鸯鹊莺鸥鸾麸黉黩鳌龇龛"
+)
+
+HAN_RUN = r'[㐀-䶿一-鿿豈-﫿]+'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION fold_hanzi(value text) RETURNS text AS $$
+        SELECT translate(value, '{TRADITIONAL}', '{SIMPLIFIED}');
+    $$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+    """)
+
+    # Positions above 16383 are clamped by tsvector; only very long notes get there
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION han_bigram_document(value text) RETURNS tsvector AS $$
+        WITH runs AS (
+            SELECT r.m[1] AS run, r.n
+            FROM regexp_matches(fold_hanzi(value), '{HAN_RUN}', 'g') WITH ORDINALITY AS r(m, n)
+        ),
+        placed AS (
+            SELECT run, sum(length(run) + 1) OVER (ORDER BY n) - length(run) - 1 AS start
+            FROM runs
+        )
+        SELECT COALESCE(string_agg(
+            substr(run, i, 2) || ':' || least(start + i, 16383), ' '
+        ), '')::tsvector
+        FROM placed, generate_series(1, length(run)) AS i;
+    $$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+    """)
+
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION han_tsquery(value text) RETURNS tsquery AS $$
+        SELECT string_agg(
+            CASE WHEN length(run) = 1 THEN run || ':*'
+            ELSE (
+                SELECT string_agg(substr(run, i, 2), ' <-> ' ORDER BY i)
+                FROM generate_series(1, length(run) - 1) AS i
+            ) END,
+            ' & ' ORDER BY n
+        )::tsquery
+        FROM (
+            SELECT r.m[1] AS run, r.n
+            FROM regexp_matches(fold_hanzi(value), '{HAN_RUN}', 'g') WITH ORDINALITY AS r(m, n)
+        ) runs;
+    $$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+    """)
+
+    op.add_column(
+        'entry_search_documents',
+        sa.Column('han_document', TSVECTOR, nullable=False, server_default=sa.text("''::tsvector"))
+    )
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_entry_search_document(p_entry_id uuid) RETURNS void AS $$
+    BEGIN
+        INSERT INTO entry_search_documents (entry_id, document, names_key, names_document, han_document, updated_at)
+        SELECT e.id,
+            e.search_vector ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.translated_name, ' '), '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.notes, ' '), '')), 'D'),
+            k.names_key,
+            to_tsvector('simple', k.names_key),
+            setweight(han_bigram_document(COALESCE(string_agg(t.translated_name, ' '), '')), 'A') ||
+            setweight(han_bigram_document(COALESCE(string_agg(t.notes, ' '), '')), 'D'),
+            NOW()
+        FROM entries e
+        CROSS JOIN LATERAL (
+            SELECT name_search_key(concat_ws(' ',
+                e.primary_name, e.original_script, array_to_string(e.alternative_names, ' ')
+            )) AS names_key
+        ) k
+        LEFT JOIN translations t ON t.entry_id = e.id
+        WHERE e.id = p_entry_id
+        GROUP BY e.id, k.names_key
+        ON CONFLICT (entry_id) DO UPDATE
+            SET document = EXCLUDED.document,
+                names_key = EXCLUDED.names_key,
+                names_document = EXCLUDED.names_document,
+                han_document = EXCLUDED.han_document,
+                updated_at = EXCLUDED.updated_at;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    # Populate existing entries (scripts/backfill_search_documents.py rebuilds in batches)
+    op.execute("SELECT refresh_entry_search_document(id) FROM entries;")
+
+    op.create_index(
+        'idx_entry_search_documents_han_document', 'entry_search_documents', ['han_document'],
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_entry_search_documents_han_document', table_name='entry_search_documents')
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_entry_search_document(p_entry_id uuid) RETURNS void AS $$
+    BEGIN
+        INSERT INTO entry_search_documents (entry_id, document, names_key, names_document, updated_at)
+        SELECT e.id,
+            e.search_vector ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.translated_name, ' '), '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.notes, ' '), '')), 'D'),
+            k.names_key,
+            to_tsvector('simple', k.names_key),
+            NOW()
+        FROM entries e
+        CROSS JOIN LATERAL (
+            SELECT name_search_key(concat_ws(' ',
+                e.primary_name, e.original_script, array_to_string(e.alternative_names, ' ')
+            )) AS names_key
+        ) k
+        LEFT JOIN translations t ON t.entry_id = e.id
+        WHERE e.id = p_entry_id
+        GROUP BY e.id, k.names_key
+        ON CONFLICT (entry_id) DO UPDATE
+            SET document = EXCLUDED.document,
+                names_key = EXCLUDED.names_key,
+                names_document = EXCLUDED.names_document,
+                updated_at = EXCLUDED.updated_at;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.drop_column('entry_search_documents', 'han_document')
+
+    op.execute("DROP FUNCTION IF EXISTS han_tsquery(text);")
+    op.execute("DROP FUNCTION IF EXISTS han_bigram_document(text);")
+    op.execute("DROP FUNCTION IF EXISTS fold_hanzi(text);")
@@ -0,0 +1,116 @@
+"""add_entry_search_documents
+
+Adds entry_search_documents, one tsvector per entry combining the entry's
+weighted search_vector with all of its translated names (weight B) and notes
+(weight D), kept current by triggers on entries and translations. Full-text
+search then needs a single GIN index scan instead of OR-ing the entries index
+with a correlated EXISTS over translations.
+
+Revision ID: 9e3b7a6c2d15
+Revises: 5c1d8e2f4a90
+Create Date: 2026-10-17 11:02:18.530117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e3b7a6c2d15'
+down_revision: Union[str, Sequence[str], None] = '5c1d8e2f4a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'entry_search_documents',
+        sa.Column('entry_id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('document', TSVECTOR, nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['entry_id'], ['entries.id'], ondelete='CASCADE'),
+    )
+
+    # Rebuild the document of one entry (no-op if the entry no longer exists)
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_entry_search_document(p_entry_id uuid) RETURNS void AS $$
+    BEGIN
+        INSERT INTO entry_search_documents (entry_id, document, updated_at)
+        SELECT e.id,
+            e.search_vector ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.translated_name, ' '), '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.notes, ' '), '')), 'D'),
+            NOW()
+        FROM entries e
+        LEFT JOIN translations t ON t.entry_id = e.id
+        WHERE e.id = p_entry_id
+        GROUP BY e.id
+        ON CONFLICT (entry_id) DO UPDATE
+            SET document = EXCLUDED.document, updated_at = EXCLUDED.updated_at;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION entry_search_document_entry_trigger() RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM refresh_entry_search_document(NEW.id);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION entry_search_document_translation_trigger() RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM refresh_entry_search_document(OLD.entry_id);
+        END IF;
+        IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.entry_id IS DISTINCT FROM OLD.entry_id) THEN
+            PERFORM refresh_entry_search_document(NEW.entry_id);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    # Only text changes touch the document; vote and flag updates skip it
+    op.execute("""
+    CREATE TRIGGER entry_search_document_entry_trigger
+        AFTER INSERT OR UPDATE OF primary_name, original_script, alternative_names,
+            etymology, definition, historical_context
+        ON entries
+        FOR EACH ROW EXECUTE FUNCTION entry_search_document_entry_trigger();
+    """)
+
+    op.execute("""
+    CREATE TRIGGER entry_search_document_translation_trigger
+        AFTER INSERT OR DELETE OR UPDATE OF entry_id, translated_name, notes
+        ON translations
+        FOR EACH ROW EXECUTE FUNCTION entry_search_document_translation_trigger();
+    """)
+
+    # Populate existing entries (scripts/backfill_search_documents.py rebuilds in batches)
+    op.execute("SELECT refresh_entry_search_document(id) FROM entries;")
+
+    op.create_index(
+        'idx_entry_search_documents_document', 'entry_search_documents', ['document'],
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS entry_search_document_translation_trigger ON translations;")
+    op.execute("DROP TRIGGER IF EXISTS entry_search_document_entry_trigger ON entries;")
+
+    op.execute("DROP FUNCTION IF EXISTS entry_search_document_translation_trigger();")
+    op.execute("DROP FUNCTION IF EXISTS entry_search_document_entry_trigger();")
+    op.execute("DROP FUNCTION IF EXISTS refresh_entry_search_document(uuid);")
+
+    op.drop_index('idx_entry_search_documents_document', table_name='entry_search_documents')
+    op.drop_table('entry_search_documents')
@@ -0,0 +1,45 @@
+"""drop_translation_vote_deltas
+
+Drops translation_vote_deltas. Write-behind voting now sums the counter
+deltas in the worker's memory and flushes them in one UPDATE, instead of
+inserting a queue row with every vote. The vote rows remain the durable
+record: deltas lost with a worker are rebuilt by vote reconciliation.
+
+Revision ID: a3f7c1e5d8b2
+Revises: d9b4c2e7f6a3
+Create Date: 2026-10-20 15:32:07.184529
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f7c1e5d8b2'
+down_revision: Union[str, Sequence[str], None] = 'd9b4c2e7f6a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('idx_translation_vote_deltas_translation_id', table_name='translation_vote_deltas')
+    op.drop_table('translation_vote_deltas')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table(
+        'translation_vote_deltas',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('translation_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('upvotes', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('downvotes', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['translation_id'], ['translations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_translation_vote_deltas_translation_id', 'translation_vote_deltas', ['translation_id'])
@@ -0,0 +1,35 @@
+"""add_primary_name_trigram_gist_index
+
+Adds a GiST trigram index on entries.primary_name. Unlike the GIN one it
+can return rows in distance order (primary_name <-> q, q <<-> primary_name),
+so the knn and word fuzzy modes of GET /entries read only the nearest names
+instead of scoring and sorting every match.
+
+Revision ID: a71c9e3d5b28
+Revises: d83a5f2c6e19
+Create Date: 2026-10-18 14:27:53.904162
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a71c9e3d5b28'
+down_revision: Union[str, Sequence[str], None] = 'd83a5f2c6e19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_entries_primary_name_trgm_gist', 'entries', ['primary_name'],
+        postgresql_using='gist', postgresql_ops={'primary_name': 'gist_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_entries_primary_name_trgm_gist', table_name='entries')
@@ -0,0 +1,107 @@
+"""add_user_stats
+
+Adds user_stats, the per-user contribution counts shown by
+/users/{id}/metadata, so a profile view reads one row instead of counting
+entries and translations.
+
+refresh_user_stats() recomputes every user's row in one statement: one
+grouped COUNT(*) FILTER pass per table for created rows, one for rows
+updated by someone other than their creator. The app runs it periodically
+(USER_STATS_REFRESH_SECONDS); rows older than USER_STATS_MAX_AGE_SECONDS
+are not used, the crud falls back to counting that user's rows live.
+
+Also indexes translations by creator (with created_at, for the newest
+translations of a user) and entries and translations by updater, which that
+live count and the refresh use.
+
+Revision ID: a8d4e2c7f315
+Revises: f1c3a7e29d64
+Create Date: 2026-10-18 19:02:51.667420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d4e2c7f315'
+down_revision: Union[str, Sequence[str], None] = 'f1c3a7e29d64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_translations_created_by', 'translations', ['created_by', 'created_at'])
+    op.create_index('idx_translations_updated_by', 'translations', ['updated_by'])
+    op.create_index('idx_entries_updated_by', 'entries', ['updated_by'])
+
+    op.create_table(
+        'user_stats',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('entries_created', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('entries_updated', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('translations_created', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('translations_updated', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('entries_created_last_30_days', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('translations_created_last_30_days', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_user_stats() RETURNS void AS $$
+        INSERT INTO user_stats (
+            user_id, entries_created, entries_updated, translations_created, translations_updated,
+            entries_created_last_30_days, translations_created_last_30_days, refreshed_at
+        )
+        SELECT u.id,
+            COALESCE(ec.total, 0), COALESCE(eu.total, 0),
+            COALESCE(tc.total, 0), COALESCE(tu.total, 0),
+            COALESCE(ec.recent, 0), COALESCE(tc.recent, 0),
+            NOW()
+        FROM users u
+        LEFT JOIN (
+            SELECT created_by AS user_id, COUNT(*) AS total,
+                COUNT(*) FILTER (WHERE created_at >= NOW() - INTERVAL '30 days') AS recent
+            FROM entries GROUP BY created_by
+        ) ec ON ec.user_id = u.id
+        LEFT JOIN (
+            SELECT updated_by AS user_id, COUNT(*) AS total
+            FROM entries WHERE updated_by <> created_by GROUP BY updated_by
+        ) eu ON eu.user_id = u.id
+        LEFT JOIN (
+            SELECT created_by AS user_id, COUNT(*) AS total,
+                COUNT(*) FILTER (WHERE created_at >= NOW() - INTERVAL '30 days') AS recent
+            FROM translations GROUP BY created_by
+        ) tc ON tc.user_id = u.id
+        LEFT JOIN (
+            SELECT updated_by AS user_id, COUNT(*) AS total
+            FROM translations WHERE updated_by <> created_by GROUP BY updated_by
+        ) tu ON tu.user_id = u.id
+        ON CONFLICT (user_id) DO UPDATE
+            SET entries_created = EXCLUDED.entries_created,
+                entries_updated = EXCLUDED.entries_updated,
+                translations_created = EXCLUDED.translations_created,
+                translations_updated = EXCLUDED.translations_updated,
+                entries_created_last_30_days = EXCLUDED.entries_created_last_30_days,
+                translations_created_last_30_days = EXCLUDED.translations_created_last_30_days,
+                refreshed_at = EXCLUDED.refreshed_at;
+    $$ LANGUAGE sql;
+    """)
+
+    op.execute("SELECT refresh_user_stats();")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP FUNCTION IF EXISTS refresh_user_stats();")
+    op.drop_table('user_stats')
+
+    op.drop_index('idx_entries_updated_by', table_name='entries')
+    op.drop_index('idx_translations_updated_by', table_name='translations')
+    op.drop_index('idx_translations_created_by', table_name='translations')
@@ -0,0 +1,197 @@
+"""incremental_user_stats
+
+Keeps the all-time counts of user_stats current with triggers instead of
+recomputing every user's row periodically:
+
+- count_user_contribution() runs after every insert and delete of entries
+  and translations, and after updates that change created_by or updated_by.
+  add_user_contribution() moves the creator's (and a different updater's)
+  counters by one, creating the user's row on their first contribution.
+- refresh_user_recent_stats() recomputes only the last-30-days counts, which
+  change as rows age out of the window, from the rows created in the window
+  (read through the created_at indexes), and only writes rows whose values
+  changed. The app runs it every USER_STATS_REFRESH_SECONDS.
+
+refresh_user_stats() and refreshed_at go: the all-time counts are exact at
+commit, and the 30-day counts are at most one refresh interval old.
+
+Revision ID: b2d6e9f4c1a7
+Revises: a3f7c1e5d8b2
+Create Date: 2026-10-21 10:27:44.903516
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d6e9f4c1a7'
+down_revision: Union[str, Sequence[str], None] = 'a3f7c1e5d8b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_translations_created_at', 'translations', ['created_at'])
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION add_user_contribution(
+        is_entry boolean, creator uuid, updater uuid, created timestamptz, delta integer
+    ) RETURNS void AS $$
+    DECLARE
+        recent integer := CASE WHEN created >= NOW() - INTERVAL '30 days' THEN delta ELSE 0 END;
+    BEGIN
+        INSERT INTO user_stats AS s (
+            user_id, entries_created, translations_created,
+            entries_created_last_30_days, translations_created_last_30_days
+        )
+        VALUES (
+            creator,
+            CASE WHEN is_entry THEN delta ELSE 0 END, CASE WHEN is_entry THEN 0 ELSE delta END,
+            CASE WHEN is_entry THEN recent ELSE 0 END, CASE WHEN is_entry THEN 0 ELSE recent END
+        )
+        ON CONFLICT (user_id) DO UPDATE
+            SET entries_created = s.entries_created + EXCLUDED.entries_created,
+                translations_created = s.translations_created + EXCLUDED.translations_created,
+                entries_created_last_30_days = s.entries_created_last_30_days + EXCLUDED.entries_created_last_30_days,
+                translations_created_last_30_days = s.translations_created_last_30_days + EXCLUDED.translations_created_last_30_days;
+
+        IF updater IS NOT NULL AND updater IS DISTINCT FROM creator THEN
+            INSERT INTO user_stats AS s (user_id, entries_updated, translations_updated)
+            VALUES (updater, CASE WHEN is_entry THEN delta ELSE 0 END, CASE WHEN is_entry THEN 0 ELSE delta END)
+            ON CONFLICT (user_id) DO UPDATE
+                SET entries_updated = s.entries_updated + EXCLUDED.entries_updated,
+                    translations_updated = s.translations_updated + EXCLUDED.translations_updated;
+        END IF;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION count_user_contribution() RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM add_user_contribution(
+                TG_TABLE_NAME = 'entries', OLD.created_by, OLD.updated_by, OLD.created_at, -1
+            );
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM add_user_contribution(
+                TG_TABLE_NAME = 'entries', NEW.created_by, NEW.updated_by, NEW.created_at, 1
+            );
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    for table in ('entries', 'translations'):
+        op.execute(f"""
+        CREATE TRIGGER count_{table}_user_contribution_trigger
+            AFTER INSERT OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION count_user_contribution();
+        """)
+        # Edits by the row's last updater change neither column
+        op.execute(f"""
+        CREATE TRIGGER count_{table}_user_contribution_update_trigger
+            AFTER UPDATE OF created_by, updated_by ON {table}
+            FOR EACH ROW
+            WHEN (OLD.created_by IS DISTINCT FROM NEW.created_by OR OLD.updated_by IS DISTINCT FROM NEW.updated_by)
+            EXECUTE FUNCTION count_user_contribution();
+        """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_user_recent_stats() RETURNS integer AS $$
+        WITH recent AS (
+            SELECT user_id, SUM(entries)::int AS entries, SUM(translations)::int AS translations
+            FROM (
+                SELECT created_by AS user_id, COUNT(*) AS entries, 0 AS translations
+                FROM entries WHERE created_at >= NOW() - INTERVAL '30 days'
+                GROUP BY created_by
+                UNION ALL
+                SELECT created_by, 0, COUNT(*)
+                FROM translations WHERE created_at >= NOW() - INTERVAL '30 days'
+                GROUP BY created_by
+            ) counts
+            GROUP BY user_id
+        ),
+        fixed AS (
+            UPDATE user_stats s
+            SET entries_created_last_30_days = COALESCE(r.entries, 0),
+                translations_created_last_30_days = COALESCE(r.translations, 0)
+            FROM user_stats current
+            LEFT JOIN recent r ON r.user_id = current.user_id
+            WHERE s.user_id = current.user_id
+              AND (s.entries_created_last_30_days, s.translations_created_last_30_days)
+                  IS DISTINCT FROM (COALESCE(r.entries, 0), COALESCE(r.translations, 0))
+            RETURNING 1
+        )
+        SELECT COUNT(*)::int FROM fixed;
+    $$ LANGUAGE sql;
+    """)
+
+    # Start from exact counts; the triggers keep them from here
+    op.execute("SELECT refresh_user_stats();")
+    op.execute("DROP FUNCTION IF EXISTS refresh_user_stats();")
+    op.drop_column('user_stats', 'refreshed_at')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column(
+        'user_stats',
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False)
+    )
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_user_stats() RETURNS void AS $$
+        INSERT INTO user_stats (
+            user_id, entries_created, entries_updated, translations_created, translations_updated,
+            entries_created_last_30_days, translations_created_last_30_days, refreshed_at
+        )
+        SELECT u.id,
+            COALESCE(ec.total, 0), COALESCE(eu.total, 0),
+            COALESCE(tc.total, 0), COALESCE(tu.total, 0),
+            COALESCE(ec.recent, 0), COALESCE(tc.recent, 0),
+            NOW()
+        FROM users u
+        LEFT JOIN (
+            SELECT created_by AS user_id, COUNT(*) AS total,
+                COUNT(*) FILTER (WHERE created_at >= NOW() - INTERVAL '30 days') AS recent
+            FROM entries GROUP BY created_by
+        ) ec ON ec.user_id = u.id
+        LEFT JOIN (
+            SELECT updated_by AS user_id, COUNT(*) AS total
+            FROM entries WHERE updated_by <> created_by GROUP BY updated_by
+        ) eu ON eu.user_id = u.id
+        LEFT JOIN (
+            SELECT created_by AS user_id, COUNT(*) AS total,
+                COUNT(*) FILTER (WHERE created_at >= NOW() - INTERVAL '30 days') AS recent
+            FROM translations GROUP BY created_by
+        ) tc ON tc.user_id = u.id
+        LEFT JOIN (
+            SELECT updated_by AS user_id, COUNT(*) AS total
+            FROM translations WHERE updated_by <> created_by GROUP BY updated_by
+        ) tu ON tu.user_id = u.id
+        ON CONFLICT (user_id) DO UPDATE
+            SET entries_created = EXCLUDED.entries_created,
+                entries_updated = EXCLUDED.entries_updated,
+                translations_created = EXCLUDED.translations_created,
+                translations_updated = EXCLUDED.translations_updated,
+                entries_created_last_30_days = EXCLUDED.entries_created_last_30_days,
+                translations_created_last_30_days = EXCLUDED.translations_created_last_30_days,
+                refreshed_at = EXCLUDED.refreshed_at;
+    $$ LANGUAGE sql;
+    """)
+
+    for table in ('entries', 'translations'):
+        op.execute(f"DROP TRIGGER IF EXISTS count_{table}_user_contribution_update_trigger ON {table};")
+        op.execute(f"DROP TRIGGER IF EXISTS count_{table}_user_contribution_trigger ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS refresh_user_recent_stats();")
+    op.execute("DROP FUNCTION IF EXISTS count_user_contribution();")
+    op.execute("DROP FUNCTION IF EXISTS add_user_contribution(boolean, uuid, uuid, timestamptz, integer);")
+    op.execute("SELECT refresh_user_stats();")
+
+    op.drop_index('idx_translations_created_at', table_name='translations')
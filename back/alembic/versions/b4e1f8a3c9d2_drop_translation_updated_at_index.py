@@ -0,0 +1,33 @@
+"""drop_translation_updated_at_index
+
+Drops idx_translations_updated_at. Every vote bumps translations.updated_at
+(through the counters and the updated_at trigger), and with an index on it
+none of those updates can be HOT, so each vote also wrote to every index of
+translations. The typeahead index now finds changed entries through
+activity_events, which vote counter updates do not write to.
+
+Revision ID: b4e1f8a3c9d2
+Revises: a8d4e2c7f315
+Create Date: 2026-10-19 10:27:15.340871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e1f8a3c9d2'
+down_revision: Union[str, Sequence[str], None] = 'a8d4e2c7f315'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('idx_translations_updated_at', table_name='translations')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_translations_updated_at', 'translations', ['updated_at'])
@@ -0,0 +1,137 @@
+"""column_aware_search_vector_triggers
+
+Recreates the search_vector triggers from 473d33eae1aa so they only fire when
+a text column that feeds the vector is in the UPDATE's SET list, and return
+early when those columns did not actually change. Vote counter updates on
+translations and flag updates on entries (verify, bulk update) no longer run
+to_tsvector. Also lowers the translations fillfactor so vote updates have room
+for HOT (heap-only tuple) updates on the same page.
+
+Revision ID: c47f0e91ab38
+Revises: 9e3b7a6c2d15
+Create Date: 2026-10-17 13:40:55.902311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47f0e91ab38'
+down_revision: Union[str, Sequence[str], None] = '9e3b7a6c2d15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+    CREATE OR REPLACE FUNCTION update_entry_search_vector() RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE'
+            AND NEW.primary_name IS NOT DISTINCT FROM OLD.primary_name
+            AND NEW.original_script IS NOT DISTINCT FROM OLD.original_script
+            AND NEW.alternative_names IS NOT DISTINCT FROM OLD.alternative_names
+            AND NEW.etymology IS NOT DISTINCT FROM OLD.etymology
+            AND NEW.definition IS NOT DISTINCT FROM OLD.definition
+            AND NEW.historical_context IS NOT DISTINCT FROM OLD.historical_context
+        THEN
+            RETURN NEW;
+        END IF;
+
+        NEW.search_vector :=
+            setweight(to_tsvector('english', COALESCE(NEW.primary_name, '')), 'A') ||
+            setweight(to_tsvector('english', COALESCE(NEW.original_script, '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(array_to_string(NEW.alternative_names, ' '), '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(NEW.etymology, '')), 'C') ||
+            setweight(to_tsvector('english', COALESCE(NEW.definition, '')), 'C') ||
+            setweight(to_tsvector('english', COALESCE(NEW.historical_context, '')), 'C');
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION update_translation_search_vector() RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE'
+            AND NEW.translated_name IS NOT DISTINCT FROM OLD.translated_name
+            AND NEW.notes IS NOT DISTINCT FROM OLD.notes
+        THEN
+            RETURN NEW;
+        END IF;
+
+        NEW.search_vector :=
+            setweight(to_tsvector('english', COALESCE(NEW.translated_name, '')), 'A') ||
+            setweight(to_tsvector('english', COALESCE(NEW.notes, '')), 'B');
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS update_entry_search_vector_trigger ON entries;")
+    op.execute("""
+    CREATE TRIGGER update_entry_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF primary_name, original_script, alternative_names,
+            etymology, definition, historical_context
+        ON entries
+        FOR EACH ROW EXECUTE FUNCTION update_entry_search_vector();
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS update_translation_search_vector_trigger ON translations;")
+    op.execute("""
+    CREATE TRIGGER update_translation_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF translated_name, notes
+        ON translations
+        FOR EACH ROW EXECUTE FUNCTION update_translation_search_vector();
+    """)
+
+    # Leave free space on each page so counter updates can stay HOT.
+    # Applies to newly written pages; a VACUUM FULL rewrites existing ones.
+    op.execute("ALTER TABLE translations SET (fillfactor = 90);")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE translations RESET (fillfactor);")
+
+    op.execute("DROP TRIGGER IF EXISTS update_translation_search_vector_trigger ON translations;")
+    op.execute("""
+    CREATE TRIGGER update_translation_search_vector_trigger
+        BEFORE INSERT OR UPDATE ON translations
+        FOR EACH ROW EXECUTE FUNCTION update_translation_search_vector();
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS update_entry_search_vector_trigger ON entries;")
+    op.execute("""
+    CREATE TRIGGER update_entry_search_vector_trigger
+        BEFORE INSERT OR UPDATE ON entries
+        FOR EACH ROW EXECUTE FUNCTION update_entry_search_vector();
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION update_entry_search_vector() RETURNS TRIGGER AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', COALESCE(NEW.primary_name, '')), 'A') ||
+            setweight(to_tsvector('english', COALESCE(NEW.original_script, '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(array_to_string(NEW.alternative_names, ' '), '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(NEW.etymology, '')), 'C') ||
+            setweight(to_tsvector('english', COALESCE(NEW.definition, '')), 'C') ||
+            setweight(to_tsvector('english', COALESCE(NEW.historical_context, '')), 'C');
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION update_translation_search_vector() RETURNS TRIGGER AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', COALESCE(NEW.translated_name, '')), 'A') ||
+            setweight(to_tsvector('english', COALESCE(NEW.notes, '')), 'B');
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
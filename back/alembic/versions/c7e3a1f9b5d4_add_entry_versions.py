@@ -0,0 +1,93 @@
+"""add_entry_versions
+
+Adds entry_versions, one counter per entry that triggers bump on every
+insert or update of the entry and every insert, update or delete of its
+translations (vote counters included). The cached GET /entries/{id} bodies
+are validated against it.
+
+The updated_at columns it replaces as a version are transaction start
+times, so a transaction that started earlier but committed after a read
+could leave the newest updated_at unchanged. The counter changes when the
+write commits, whenever it started.
+
+It lives in its own table because bumping a column of entries from the
+translation triggers would fire the entries updated_at trigger.
+
+Revision ID: c7e3a1f9b5d4
+Revises: b4e1f8a3c9d2
+Create Date: 2026-10-19 11:48:30.912604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e3a1f9b5d4'
+down_revision: Union[str, Sequence[str], None] = 'b4e1f8a3c9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'entry_versions',
+        sa.Column('entry_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['entry_id'], ['entries.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('entry_id')
+    )
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION bump_entry_version() RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO entry_versions (entry_id) VALUES (NEW.id);
+        ELSE
+            UPDATE entry_versions SET version = version + 1 WHERE entry_id = NEW.id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION bump_translation_entry_version() RETURNS TRIGGER AS $$
+    BEGIN
+        -- On a cascaded entry delete the row may already be gone; nothing to do then
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE entry_versions SET version = version + 1 WHERE entry_id = OLD.entry_id;
+        END IF;
+        IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.entry_id IS DISTINCT FROM OLD.entry_id) THEN
+            UPDATE entry_versions SET version = version + 1 WHERE entry_id = NEW.entry_id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE TRIGGER bump_entry_version_trigger
+        AFTER INSERT OR UPDATE ON entries
+        FOR EACH ROW EXECUTE FUNCTION bump_entry_version();
+    """)
+    op.execute("""
+    CREATE TRIGGER bump_translation_entry_version_trigger
+        AFTER INSERT OR UPDATE OR DELETE ON translations
+        FOR EACH ROW EXECUTE FUNCTION bump_translation_entry_version();
+    """)
+
+    op.execute("INSERT INTO entry_versions (entry_id) SELECT id FROM entries;")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS bump_translation_entry_version_trigger ON translations;")
+    op.execute("DROP TRIGGER IF EXISTS bump_entry_version_trigger ON entries;")
+    op.execute("DROP FUNCTION IF EXISTS bump_translation_entry_version();")
+    op.execute("DROP FUNCTION IF EXISTS bump_entry_version();")
+    op.drop_table('entry_versions')
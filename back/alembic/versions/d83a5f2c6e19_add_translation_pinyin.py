@@ -0,0 +1,151 @@
+"""add_translation_pinyin
+
+Adds toneless pinyin keys to translations for sorting and pinyin search:
+pinyin_full ("a ka liu si") and pinyin_initials ("akls"). They are computed
+in Python (pypinyin) by the crud on every write, so existing rows stay NULL
+here; fill them with scripts/backfill_pinyin.py.
+
+entry_search_documents.preferred_pinyin copies pinyin_full of the entry's
+first translation in display order (preferred first, then oldest), so entries
+can be sorted by it through one index. The translation trigger now also fires
+on is_preferred and pinyin_full changes to keep it current.
+
+Revision ID: d83a5f2c6e19
+Revises: 9c4e1b7a2f63
+Create Date: 2026-10-18 10:41:06.287415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd83a5f2c6e19'
+down_revision: Union[str, Sequence[str], None] = '9c4e1b7a2f63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('translations', sa.Column('pinyin_full', sa.Text(), nullable=True))
+    op.add_column('translations', sa.Column('pinyin_initials', sa.Text(), nullable=True))
+    op.add_column('entry_search_documents', sa.Column('preferred_pinyin', sa.Text(), nullable=True))
+
+    op.create_index(
+        'idx_translations_pinyin_initials', 'translations', ['pinyin_initials'],
+        postgresql_ops={'pinyin_initials': 'text_pattern_ops'}
+    )
+    op.create_index(
+        'idx_translations_pinyin_compact', 'translations',
+        [sa.text("replace(pinyin_full, ' ', '') text_pattern_ops")]
+    )
+    op.create_index(
+        'idx_entry_search_documents_preferred_pinyin', 'entry_search_documents',
+        [sa.text('preferred_pinyin COLLATE "C"'), 'entry_id']
+    )
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_entry_search_document(p_entry_id uuid) RETURNS void AS $$
+    BEGIN
+        INSERT INTO entry_search_documents (
+            entry_id, document, names_key, names_document, han_document, preferred_pinyin, updated_at
+        )
+        SELECT e.id,
+            e.search_vector ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.translated_name, ' '), '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.notes, ' '), '')), 'D'),
+            k.names_key,
+            to_tsvector('simple', k.names_key),
+            setweight(han_bigram_document(COALESCE(string_agg(t.translated_name, ' '), '')), 'A') ||
+            setweight(han_bigram_document(COALESCE(string_agg(t.notes, ' '), '')), 'D'),
+            p.pinyin_full,
+            NOW()
+        FROM entries e
+        CROSS JOIN LATERAL (
+            SELECT name_search_key(concat_ws(' ',
+                e.primary_name, e.original_script, array_to_string(e.alternative_names, ' ')
+            )) AS names_key
+        ) k
+        LEFT JOIN LATERAL (
+            SELECT tp.pinyin_full
+            FROM translations tp
+            WHERE tp.entry_id = e.id
+            ORDER BY tp.is_preferred DESC, tp.created_at, tp.id
+            LIMIT 1
+        ) p ON true
+        LEFT JOIN translations t ON t.entry_id = e.id
+        WHERE e.id = p_entry_id
+        GROUP BY e.id, k.names_key, p.pinyin_full
+        ON CONFLICT (entry_id) DO UPDATE
+            SET document = EXCLUDED.document,
+                names_key = EXCLUDED.names_key,
+                names_document = EXCLUDED.names_document,
+                han_document = EXCLUDED.han_document,
+                preferred_pinyin = EXCLUDED.preferred_pinyin,
+                updated_at = EXCLUDED.updated_at;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    # The first translation (and so preferred_pinyin) also changes with is_preferred
+    op.execute("DROP TRIGGER IF EXISTS entry_search_document_translation_trigger ON translations;")
+    op.execute("""
+    CREATE TRIGGER entry_search_document_translation_trigger
+        AFTER INSERT OR DELETE OR UPDATE OF entry_id, translated_name, notes, is_preferred, pinyin_full
+        ON translations
+        FOR EACH ROW EXECUTE FUNCTION entry_search_document_translation_trigger();
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS entry_search_document_translation_trigger ON translations;")
+    op.execute("""
+    CREATE TRIGGER entry_search_document_translation_trigger
+        AFTER INSERT OR DELETE OR UPDATE OF entry_id, translated_name, notes
+        ON translations
+        FOR EACH ROW EXECUTE FUNCTION entry_search_document_translation_trigger();
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_entry_search_document(p_entry_id uuid) RETURNS void AS $$
+    BEGIN
+        INSERT INTO entry_search_documents (entry_id, document, names_key, names_document, han_document, updated_at)
+        SELECT e.id,
+            e.search_vector ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.translated_name, ' '), '')), 'B') ||
+            setweight(to_tsvector('english', COALESCE(string_agg(t.notes, ' '), '')), 'D'),
+            k.names_key,
+            to_tsvector('simple', k.names_key),
+            setweight(han_bigram_document(COALESCE(string_agg(t.translated_name, ' '), '')), 'A') ||
+            setweight(han_bigram_document(COALESCE(string_agg(t.notes, ' '), '')), 'D'),
+            NOW()
+        FROM entries e
+        CROSS JOIN LATERAL (
+            SELECT name_search_key(concat_ws(' ',
+                e.primary_name, e.original_script, array_to_string(e.alternative_names, ' ')
+            )) AS names_key
+        ) k
+        LEFT JOIN translations t ON t.entry_id = e.id
+        WHERE e.id = p_entry_id
+        GROUP BY e.id, k.names_key
+        ON CONFLICT (entry_id) DO UPDATE
+            SET document = EXCLUDED.document,
+                names_key = EXCLUDED.names_key,
+                names_document = EXCLUDED.names_document,
+                han_document = EXCLUDED.han_document,
+                updated_at = EXCLUDED.updated_at;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.drop_index('idx_entry_search_documents_preferred_pinyin', table_name='entry_search_documents')
+    op.drop_index('idx_translations_pinyin_compact', table_name='translations')
+    op.drop_index('idx_translations_pinyin_initials', table_name='translations')
+
+    op.drop_column('entry_search_documents', 'preferred_pinyin')
+    op.drop_column('translations', 'pinyin_initials')
+    op.drop_column('translations', 'pinyin_full')
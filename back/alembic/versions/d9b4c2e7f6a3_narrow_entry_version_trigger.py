@@ -0,0 +1,47 @@
+"""narrow_entry_version_trigger
+
+Limits bump_translation_entry_version_trigger to updates of the columns the
+cached entry body is built from, leaving out upvotes and downvotes. Every
+vote updated the counters and so bumped the entry's one entry_versions row,
+which made concurrent votes on any translation of an entry wait on each
+other. The counters (and the updated_at the votes touch) are now read fresh
+and overlaid on the cached body instead.
+
+Revision ID: d9b4c2e7f6a3
+Revises: c7e3a1f9b5d4
+Create Date: 2026-10-20 09:14:52.371845
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b4c2e7f6a3'
+down_revision: Union[str, Sequence[str], None] = 'c7e3a1f9b5d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS bump_translation_entry_version_trigger ON translations;")
+    op.execute("""
+    CREATE TRIGGER bump_translation_entry_version_trigger
+        AFTER INSERT OR DELETE OR UPDATE OF
+            entry_id, translated_name, notes, source_id, is_preferred,
+            pinyin_full, pinyin_initials, created_by, updated_by
+        ON translations
+        FOR EACH ROW EXECUTE FUNCTION bump_translation_entry_version();
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS bump_translation_entry_version_trigger ON translations;")
+    op.execute("""
+    CREATE TRIGGER bump_translation_entry_version_trigger
+        AFTER INSERT OR UPDATE OR DELETE ON translations
+        FOR EACH ROW EXECUTE FUNCTION bump_translation_entry_version();
+    """)
@@ -0,0 +1,46 @@
+"""add_translation_vote_deltas
+
+Adds translation_vote_deltas, the durable queue of vote counter changes used
+by write-behind voting. Each vote writes its delta here in its own
+transaction; a flush claims queued rows with DELETE ... RETURNING and applies
+their sum to translations, so a delta is applied exactly once even if the
+process that recorded it dies before flushing.
+
+Revision ID: e2a4c6b81f37
+Revises: c47f0e91ab38
+Create Date: 2026-10-17 14:05:21.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a4c6b81f37'
+down_revision: Union[str, Sequence[str], None] = 'c47f0e91ab38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'translation_vote_deltas',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('translation_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('upvotes', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('downvotes', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['translation_id'], ['translations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_translation_vote_deltas_translation_id', 'translation_vote_deltas', ['translation_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_translation_vote_deltas_translation_id', table_name='translation_vote_deltas')
+    op.drop_table('translation_vote_deltas')
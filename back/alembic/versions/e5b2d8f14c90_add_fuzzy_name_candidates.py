@@ -0,0 +1,87 @@
+"""add_fuzzy_name_candidates
+
+Gives every name that fuzzy_search looks at its own trigram index:
+
+- entry_alternative_names: one row per element of entries.alternative_names,
+  kept in sync by a trigger on entries, with a GIN trigram index on name
+  (an array column cannot be trigram-indexed per element).
+- a GIN trigram index on translations.translated_name.
+
+primary_name already has one, so the fuzzy candidate set is three trigram
+index scans merged per entry.
+
+Revision ID: e5b2d8f14c90
+Revises: a71c9e3d5b28
+Create Date: 2026-10-18 16:52:19.638051
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2d8f14c90'
+down_revision: Union[str, Sequence[str], None] = 'a71c9e3d5b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'entry_alternative_names',
+        sa.Column('entry_id', UUID(as_uuid=True), sa.ForeignKey('entries.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('name', sa.Text(), primary_key=True),
+    )
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION sync_entry_alternative_names() RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' THEN
+            DELETE FROM entry_alternative_names WHERE entry_id = NEW.id;
+        END IF;
+        INSERT INTO entry_alternative_names (entry_id, name)
+        SELECT DISTINCT NEW.id, name
+        FROM unnest(NEW.alternative_names) AS name
+        WHERE name IS NOT NULL AND name <> '';
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE TRIGGER sync_entry_alternative_names_trigger
+        AFTER INSERT OR UPDATE OF alternative_names
+        ON entries
+        FOR EACH ROW EXECUTE FUNCTION sync_entry_alternative_names();
+    """)
+
+    op.execute("""
+    INSERT INTO entry_alternative_names (entry_id, name)
+    SELECT DISTINCT e.id, name
+    FROM entries e, unnest(e.alternative_names) AS name
+    WHERE name IS NOT NULL AND name <> '';
+    """)
+
+    op.create_index(
+        'idx_entry_alternative_names_name_trgm', 'entry_alternative_names', ['name'],
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'idx_translations_name_trgm', 'translations', ['translated_name'],
+        postgresql_using='gin', postgresql_ops={'translated_name': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_translations_name_trgm', table_name='translations')
+    op.drop_index('idx_entry_alternative_names_name_trgm', table_name='entry_alternative_names')
+
+    op.execute("DROP TRIGGER IF EXISTS sync_entry_alternative_names_trigger ON entries;")
+    op.execute("DROP FUNCTION IF EXISTS sync_entry_alternative_names();")
+
+    op.drop_table('entry_alternative_names')
@@ -0,0 +1,216 @@
+"""add_activity_events
+
+Adds activity_events, an append-only feed of writes to entries, translations,
+comments and translation_votes. Rows are inserted by AFTER triggers, so every
+event commits (or rolls back) with the write it records, whichever code path
+made it. Updates only count when a user-facing column changed: vote counter
+updates on translations and search document refreshes do not add events.
+
+The feed is read newest first through idx_activity_events_created_at, with
+(created_at, id) as keyset; idx_activity_events_entry_id serves the feed of
+one entry and the ON DELETE CASCADE from entries.
+
+Existing entries, translations, comments and votes are seeded as *_created /
+vote_cast events at their created_at.
+
+Revision ID: f1c3a7e29d64
+Revises: e5b2d8f14c90
+Create Date: 2026-10-18 17:34:06.204719
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c3a7e29d64'
+down_revision: Union[str, Sequence[str], None] = 'e5b2d8f14c90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'activity_events',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('event_type', sa.String(length=30), nullable=False),
+        sa.Column('entry_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('translation_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('comment_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('details', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.CheckConstraint(
+            "event_type IN ('entry_created', 'entry_updated', 'translation_created', "
+            "'translation_updated', 'comment_created', 'comment_updated', 'vote_cast')",
+            name='activity_events_event_type_check'
+        ),
+        sa.ForeignKeyConstraint(['entry_id'], ['entries.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION record_entry_activity() RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE'
+            AND NEW.primary_name IS NOT DISTINCT FROM OLD.primary_name
+            AND NEW.original_script IS NOT DISTINCT FROM OLD.original_script
+            AND NEW.language_code IS NOT DISTINCT FROM OLD.language_code
+            AND NEW.entry_type IS NOT DISTINCT FROM OLD.entry_type
+            AND NEW.alternative_names IS NOT DISTINCT FROM OLD.alternative_names
+            AND NEW.other_language_codes IS NOT DISTINCT FROM OLD.other_language_codes
+            AND NEW.etymology IS NOT DISTINCT FROM OLD.etymology
+            AND NEW.definition IS NOT DISTINCT FROM OLD.definition
+            AND NEW.historical_context IS NOT DISTINCT FROM OLD.historical_context
+            AND NEW.is_verified IS NOT DISTINCT FROM OLD.is_verified
+            AND NEW.verification_notes IS NOT DISTINCT FROM OLD.verification_notes
+        THEN
+            RETURN NULL;
+        END IF;
+
+        INSERT INTO activity_events (event_type, entry_id, user_id, details)
+        VALUES (
+            CASE TG_OP WHEN 'INSERT' THEN 'entry_created' ELSE 'entry_updated' END,
+            NEW.id,
+            NEW.updated_by,
+            jsonb_build_object('primary_name', NEW.primary_name)
+        );
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION record_translation_activity() RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE'
+            AND NEW.translated_name IS NOT DISTINCT FROM OLD.translated_name
+            AND NEW.notes IS NOT DISTINCT FROM OLD.notes
+            AND NEW.source_id IS NOT DISTINCT FROM OLD.source_id
+            AND NEW.is_preferred IS NOT DISTINCT FROM OLD.is_preferred
+        THEN
+            RETURN NULL;
+        END IF;
+
+        INSERT INTO activity_events (event_type, entry_id, translation_id, user_id, details)
+        VALUES (
+            CASE TG_OP WHEN 'INSERT' THEN 'translation_created' ELSE 'translation_updated' END,
+            NEW.entry_id,
+            NEW.id,
+            NEW.updated_by,
+            jsonb_build_object('translated_name', NEW.translated_name)
+        );
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION record_comment_activity() RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' AND NEW.content IS NOT DISTINCT FROM OLD.content THEN
+            RETURN NULL;
+        END IF;
+
+        INSERT INTO activity_events (event_type, entry_id, comment_id, user_id, details)
+        VALUES (
+            CASE TG_OP WHEN 'INSERT' THEN 'comment_created' ELSE 'comment_updated' END,
+            NEW.entry_id,
+            NEW.id,
+            NEW.user_id,
+            jsonb_build_object('excerpt', left(NEW.content, 200))
+        );
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION record_vote_activity() RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' AND NEW.vote_type IS NOT DISTINCT FROM OLD.vote_type THEN
+            RETURN NULL;
+        END IF;
+
+        INSERT INTO activity_events (event_type, entry_id, translation_id, user_id, details)
+        SELECT 'vote_cast', t.entry_id, t.id, NEW.user_id,
+            jsonb_build_object('translated_name', t.translated_name, 'vote_type', NEW.vote_type)
+        FROM translations t
+        WHERE t.id = NEW.translation_id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE TRIGGER record_entry_activity_trigger
+        AFTER INSERT OR UPDATE ON entries
+        FOR EACH ROW EXECUTE FUNCTION record_entry_activity();
+    """)
+    op.execute("""
+    CREATE TRIGGER record_translation_activity_trigger
+        AFTER INSERT OR UPDATE OF translated_name, notes, source_id, is_preferred ON translations
+        FOR EACH ROW EXECUTE FUNCTION record_translation_activity();
+    """)
+    op.execute("""
+    CREATE TRIGGER record_comment_activity_trigger
+        AFTER INSERT OR UPDATE OF content ON comments
+        FOR EACH ROW EXECUTE FUNCTION record_comment_activity();
+    """)
+    op.execute("""
+    CREATE TRIGGER record_vote_activity_trigger
+        AFTER INSERT OR UPDATE OF vote_type ON translation_votes
+        FOR EACH ROW EXECUTE FUNCTION record_vote_activity();
+    """)
+
+    # Seed the feed with what already exists
+    op.execute("""
+    INSERT INTO activity_events (event_type, entry_id, translation_id, comment_id, user_id, details, created_at)
+    SELECT 'entry_created', e.id, NULL::uuid, NULL::uuid, e.created_by,
+        jsonb_build_object('primary_name', e.primary_name), COALESCE(e.created_at, NOW())
+    FROM entries e
+    UNION ALL
+    SELECT 'translation_created', t.entry_id, t.id, NULL, t.created_by,
+        jsonb_build_object('translated_name', t.translated_name), COALESCE(t.created_at, NOW())
+    FROM translations t
+    UNION ALL
+    SELECT 'comment_created', c.entry_id, NULL, c.id, c.user_id,
+        jsonb_build_object('excerpt', left(c.content, 200)), COALESCE(c.created_at, NOW())
+    FROM comments c
+    UNION ALL
+    SELECT 'vote_cast', t.entry_id, t.id, NULL, v.user_id,
+        jsonb_build_object('translated_name', t.translated_name, 'vote_type', v.vote_type),
+        COALESCE(v.created_at, NOW())
+    FROM translation_votes v
+    JOIN translations t ON t.id = v.translation_id
+    ORDER BY 7;
+    """)
+
+    op.create_index(
+        'idx_activity_events_created_at', 'activity_events',
+        [sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+    op.create_index(
+        'idx_activity_events_entry_id', 'activity_events',
+        ['entry_id', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS record_vote_activity_trigger ON translation_votes;")
+    op.execute("DROP TRIGGER IF EXISTS record_comment_activity_trigger ON comments;")
+    op.execute("DROP TRIGGER IF EXISTS record_translation_activity_trigger ON translations;")
+    op.execute("DROP TRIGGER IF EXISTS record_entry_activity_trigger ON entries;")
+    op.execute("DROP FUNCTION IF EXISTS record_vote_activity();")
+    op.execute("DROP FUNCTION IF EXISTS record_comment_activity();")
+    op.execute("DROP FUNCTION IF EXISTS record_translation_activity();")
+    op.execute("DROP FUNCTION IF EXISTS record_entry_activity();")
+
+    op.drop_index('idx_activity_events_entry_id', table_name='activity_events')
+    op.drop_index('idx_activity_events_created_at', table_name='activity_events')
+    op.drop_table('activity_events')
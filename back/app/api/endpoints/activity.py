@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from uuid import UUID
+
+from app.core.database import get_async_db
+from app.crud import activity as crud_activity
+from app.crud.entries import InvalidCursorError
+from app.schemas.activity import ActivityEventType, PaginatedActivity
+
+router = APIRouter()
+
+
+@router.get("/", response_model=PaginatedActivity)
+async def get_activity(
+    limit: int = Query(50, ge=1, le=200, description="Number of events per page"),
+    cursor: Optional[str] = Query(
+        None, description="Opaque next_cursor from a previous page"
+    ),
+    event_type: Optional[List[ActivityEventType]] = Query(
+        None, description="Only these event types (repeatable)"
+    ),
+    entry_id: Optional[UUID] = Query(None, description="Only events of this entry"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Recent changes to entries, translations, comments and votes, newest first.
+    Pass next_cursor back as cursor to read further back.
+    """
+    try:
+        return await crud_activity.aget_activity(
+            db,
+            limit=limit,
+            cursor=cursor,
+            event_types=[t.value for t in event_type] if event_type else None,
+            entry_id=entry_id
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
@@ -1,10 +1,10 @@
 import re
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.core.config import settings
 from app.core.security import (
     create_access_token,
@@ -21,12 +21,12 @@ security = HTTPBearer()
 
 
 @router.post("/login", response_model=dict)
-async def login(request: LoginRequest, db: Session = Depends(get_db)):
+async def login(request: LoginRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Send verification code to user's email.
     In dev mode, always use code "123456".
     """
-    user = crud_users.get_user_by_email(db, email=request.email)
+    user = await crud_users.aget_user_by_email(db, email=request.email)
 
     if not user:
         raise HTTPException(
@@ -50,7 +50,7 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
 
 
     # Store verification code in database
-    crud_users.create_verification_code(db, user_id=str(user.id), code=code)
+    await crud_users.acreate_verification_code(db, user_id=str(user.id), code=code)
 
     return {
         "message": "Verification code sent to your email",
@@ -59,11 +59,11 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/verify", response_model=Token)
-async def verify_code(request: VerifyCodeRequest, db: Session = Depends(get_db)):
+async def verify_code(request: VerifyCodeRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Verify the 6-digit code and return access token.
     """
-    user = crud_users.get_user_by_email(db, email=request.email)
+    user = await crud_users.aget_user_by_email(db, email=request.email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -71,7 +71,7 @@ async def verify_code(request: VerifyCodeRequest, db: Session = Depends(get_db))
         )
 
     # Check verification code
-    verification_code = crud_users.get_valid_verification_code(
+    verification_code = await crud_users.aget_valid_verification_code(
         db, user_id=str(user.id), code=request.code
     )
 
@@ -82,11 +82,11 @@ async def verify_code(request: VerifyCodeRequest, db: Session = Depends(get_db))
         )
 
     # Mark code as used
-    crud_users.mark_verification_code_used(db, verification_code)
+    await crud_users.amark_verification_code_used(db, verification_code)
 
     # Activate user if not already activated
     if not user.is_activated:
-        crud_users.activate_user(db, user_id=str(user.id))
+        await crud_users.aactivate_user(db, user_id=str(user.id))
 
     # Create access token
     access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
@@ -102,7 +102,7 @@ async def verify_code(request: VerifyCodeRequest, db: Session = Depends(get_db))
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> UserResponse:
     """
     Get current authenticated user from token.
@@ -121,11 +121,11 @@ async def get_current_user(
     except Exception:
         raise credentials_exception
 
-    user = crud_users.get_user(db, user_id=user_id)
+    user = await crud_users.aget_principal(db, user_id=user_id)
     if user is None:
         raise credentials_exception
 
-    return UserResponse.model_validate(user)
+    return user
 
 
 @router.get("/me", response_model=UserResponse)
@@ -1,25 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.crud import entries as crud_entries
-from app.models.models import Comment, User
+from app.crud import comments as crud_comments
 from app.schemas.comments import CommentCreate, CommentUpdate, CommentResponse, CommentWithUser
 from app.schemas.auth import UserResponse
 from app.api.endpoints.auth import get_current_user
-import uuid
 
 router = APIRouter()
 
 
 @router.get("/entry/{entry_id}", response_model=List[CommentWithUser])
-async def get_entry_comments(entry_id: str, db: Session = Depends(get_db)):
+async def get_entry_comments(entry_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Get all comments for an entry with user information.
     """
     # Check if entry exists
-    entry = crud_entries.get_entry(db, entry_id=entry_id)
+    entry = await crud_entries.aget_entry(db, entry_id=entry_id)
     if not entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -37,11 +36,7 @@ async def get_entry_comments(entry_id: str, db: Session = Depends(get_db)):
         )
 
     # Query comments with eagerly loaded user information
-    comments = db.query(Comment).options(
-        joinedload(Comment.user)
-    ).filter(
-        Comment.entry_id == uuid_entry_id
-    ).order_by(Comment.created_at).all()
+    comments = await crud_comments.aget_entry_comments(db, entry_id=uuid_entry_id)
 
     # Debug: Check if we found any comments
     print(f"Found {len(comments)} comments for entry {entry_id}")
@@ -56,14 +51,14 @@ async def get_entry_comments(entry_id: str, db: Session = Depends(get_db)):
 @router.post("/", response_model=CommentResponse)
 async def create_comment(
     comment: CommentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Create new comment.
     """
     # Check if entry exists
-    entry = crud_entries.get_entry(db, entry_id=comment.entry_id)
+    entry = await crud_entries.aget_entry(db, entry_id=comment.entry_id)
     if not entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -72,26 +67,14 @@ async def create_comment(
 
     # Check if parent comment exists (if specified)
     if comment.parent_comment_id:
-        parent_comment = db.query(Comment).filter(
-            Comment.id == comment.parent_comment_id
-        ).first()
+        parent_comment = await crud_comments.aget_comment(db, comment_id=comment.parent_comment_id)
         if not parent_comment:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Parent comment not found"
             )
 
-    db_comment = Comment(
-        id=uuid.uuid4(),
-        entry_id=comment.entry_id,
-        user_id=current_user.id,
-        parent_comment_id=comment.parent_comment_id,
-        content=comment.content
-    )
-
-    db.add(db_comment)
-    db.commit()
-    db.refresh(db_comment)
+    db_comment = await crud_comments.acreate_comment(db, comment=comment, user_id=current_user.id)
 
     return CommentResponse.model_validate(db_comment)
 
@@ -100,13 +83,13 @@ async def create_comment(
 async def update_comment(
     comment_id: str,
     comment_update: CommentUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Update comment. Only creator can update.
     """
-    db_comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    db_comment = await crud_comments.aget_comment(db, comment_id=comment_id)
     if not db_comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -120,22 +103,7 @@ async def update_comment(
             detail="Not enough permissions"
         )
 
-    # Store old content in edit history if updating content
-    if comment_update.content and comment_update.content != db_comment.content:
-        edit_history = db_comment.edit_history or {}
-        edit_history[str(len(edit_history))] = {
-            "old_content": db_comment.content,
-            "edited_at": str(uuid.uuid4())  # Using uuid as timestamp placeholder
-        }
-        db_comment.edit_history = edit_history
-        db_comment.is_edited = True
-
-    update_data = comment_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_comment, field, value)
-
-    db.commit()
-    db.refresh(db_comment)
+    db_comment = await crud_comments.aupdate_comment(db, db_comment, comment_update=comment_update)
 
     return CommentResponse.model_validate(db_comment)
 
@@ -143,13 +111,13 @@ async def update_comment(
 @router.delete("/{comment_id}")
 async def delete_comment(
     comment_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Delete comment. Only creator or admins can delete.
     """
-    db_comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    db_comment = await crud_comments.aget_comment(db, comment_id=comment_id)
     if not db_comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -164,7 +132,6 @@ async def delete_comment(
             detail="Not enough permissions"
         )
 
-    db.delete(db_comment)
-    db.commit()
+    await crud_comments.adelete_comment(db, db_comment)
 
     return {"message": "Comment deleted successfully"}
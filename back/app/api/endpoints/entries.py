@@ -1,28 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, Query
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import FrozenSet, List, Optional
+import hashlib
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.crud import entries as crud_entries
 from app.crud import translation_votes as crud_votes
 from app.schemas.entries import (
     EntryCreate, EntryUpdate, EntryResponse, EntryWithTranslations, EntryWithTranslationsAndVotes,
-    EntryMetadata, PaginatedEntries, EntryWithComment, BulkEntryUpdateRequest
+    EntryMetadata, EntryFacets, PaginatedEntries, AnnotateRequest, AnnotationResponse, EntrySuggestion, BulkEntryUpdateRequest, CountMode, SearchMode, FuzzyMode,
+    entry_fields_model
 )
 from app.schemas.translations import TranslationResponse
-from app.schemas.comments import CommentResponse, CommentWithUser
+from app.schemas.comments import CommentResponse
 from app.schemas.auth import UserResponse
 from app.api.endpoints.auth import get_current_user, get_current_admin_user
 from app.core.security import verify_token
 from app.crud import users as crud_users
+from app.services.entry_suggester import entry_suggester
+from app.services.metadata_snapshot import metadata_snapshot
 
 router = APIRouter()
 security = HTTPBearer(auto_error=False)
 
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Optional[UserResponse]:
     """
     Get current user from token if provided, otherwise return None.
@@ -37,15 +42,41 @@ async def get_current_user_optional(
         if not user_id:
             return None
 
-        user = crud_users.get_user(db, user_id=user_id)
-        if not user:
-            return None
-
-        return UserResponse.model_validate(user)
+        return await crud_users.aget_principal(db, user_id=user_id)
     except:
         return None
 
 
+SEARCH_MODE_DESCRIPTION = (
+    "'english' (full entry document), 'normalized' (names only, ignoring accents and Greek/Latin script) "
+    "'chinese' (substrings of translated names and notes, Traditional or Simplified) "
+    "or 'pinyin' (toneless pinyin of a translation, as initials or in full, e.g. 'akl')"
+)
+FUZZY_MODE_DESCRIPTION = (
+    "'similarity' (primary, alternative and translated names, best match first), "
+    "'word' (the same, also matching within longer names) or "
+    "'knn' (primary_name only, nearest first via the GiST index, fastest for short queries)"
+)
+FIELDS_DESCRIPTION = "Comma-separated entry fields to return (id is always included), e.g. primary_name,language_code"
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[FrozenSet[str]]:
+    """
+    Parse a sparse fieldset parameter. Returns None when all fields are wanted.
+    """
+    if not fields:
+        return None
+
+    requested = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    unknown = requested - set(EntryWithTranslations.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return requested
+
+
 @router.get("/", response_model=PaginatedEntries)
 async def list_entries(
     skip: int = 0,
@@ -54,6 +85,13 @@ async def list_entries(
     fuzzy_search: Optional[str] = Query(
         None, description="Fuzzy search using trigrams"
     ),
+    search_mode: SearchMode = Query(
+        SearchMode.ENGLISH, description=SEARCH_MODE_DESCRIPTION
+    ),
+    fuzzy_mode: FuzzyMode = Query(FuzzyMode.SIMILARITY, description=FUZZY_MODE_DESCRIPTION),
+    fuzzy_threshold: Optional[float] = Query(
+        None, ge=0, le=1, description="Minimum trigram similarity for fuzzy_search (default 0.3, 0.6 for word)"
+    ),
     language_code: Optional[str] = Query(
         None, description="Filter by primary language"
     ),
@@ -62,65 +100,70 @@ async def list_entries(
     ),
     entry_type: Optional[str] = Query(None, description="Filter by entry type"),
     include_translations: bool = Query(True, description="Include translations in response"),
+    translations_limit: Optional[int] = Query(
+        None, ge=1, description="Only include the first N translations per entry (preferred first)"
+    ),
     sorted_by: Optional[str] = Query(None, description="Sort by field"),
     sort_direction: Optional[str] = Query("asc", description="Sort direction: 'asc' or 'desc'"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(
+        None, description="Opaque next_cursor from a previous page (keyset pagination, skip is ignored)"
+    ),
+    count: CountMode = Query(
+        CountMode.EXACT, description="Total count strategy: 'exact', 'estimate' or 'none' (only has_more)"
+    ),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List entries with optional filtering and search.
     Supports both full-text search and fuzzy trigram search.
     Can filter by primary language_code or other_language_codes.
+    Pages can be fetched by offset (skip) or by passing back next_cursor.
+    With fields only the listed entry fields are loaded and returned.
     """
-    result = crud_entries.get_entries(
-        db,
-        skip=skip,
-        limit=limit,
-        search=search,
-        fuzzy_search=fuzzy_search,
-        language_code=language_code,
-        other_language_code=other_language_code,
-        entry_type=entry_type,
-        sorted_by=sorted_by,
-        sort_direction=sort_direction,
-        include_translations=include_translations
-    )
+    field_set = _parse_fields(fields)
+    try:
+        result = await crud_entries.aget_entries(
+            db,
+            skip=skip,
+            limit=limit,
+            search=search,
+            fuzzy_search=fuzzy_search,
+            search_mode=search_mode,
+            fuzzy_mode=fuzzy_mode,
+            fuzzy_threshold=fuzzy_threshold,
+            language_code=language_code,
+            other_language_code=other_language_code,
+            entry_type=entry_type,
+            sorted_by=sorted_by,
+            sort_direction=sort_direction,
+            include_translations=include_translations,
+            cursor=cursor,
+            count=count,
+            translations_limit=translations_limit,
+            fields=field_set
+        )
+    except crud_entries.InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
-    if include_translations:
-        result["items"] = [EntryWithTranslations.model_validate(entry) for entry in result["items"]]
-    else:
-        result["items"] = [EntryResponse.model_validate(entry) for entry in result["items"]]
+    item_schema = EntryWithTranslations if include_translations else EntryResponse
+    if field_set is not None:
+        # Trimmed items do not satisfy PaginatedEntries, so they are serialized
+        # here and returned as is
+        item_schema = entry_fields_model(item_schema, field_set)
+        result["items"] = [
+            item_schema.model_validate(entry).model_dump(mode="json") for entry in result["items"]
+        ]
+        return JSONResponse(content=result)
 
+    result["items"] = [item_schema.model_validate(entry) for entry in result["items"]]
     return result
 
-def _map_entry_with_comment(entry) -> EntryWithComment:
-    """
-    Helper function to map Entry model with dynamic comment to EntryWithComment schema.
-    """
-    # Convert entry to dict first
-    entry_data = {
-        'id': entry.id,
-        'primary_name': entry.primary_name,
-        'original_script': entry.original_script,
-        'language_code': entry.language_code,
-        'entry_type': entry.entry_type,
-        'alternative_names': entry.alternative_names,
-        'other_language_codes': entry.other_language_codes,
-        'etymology': entry.etymology,
-        'definition': entry.definition,
-        'historical_context': entry.historical_context,
-        'created_by': entry.created_by,
-        'updated_by': entry.updated_by,
-        'is_verified': entry.is_verified,
-        'verification_notes': entry.verification_notes,
-        'created_at': entry.created_at,
-        'updated_at': entry.updated_at,
-        'newest_comment': CommentWithUser.model_validate(entry.newest_comment) if hasattr(entry, 'newest_comment') and entry.newest_comment else None
-    }
-    return EntryWithComment.model_validate(entry_data)
-
-
 @router.get("/metadata", response_model=EntryMetadata)
-async def get_entries_metadata(db: Session = Depends(get_db)):
+async def get_entries_metadata():
     """
     Get comprehensive metadata about entries including:
     - Total number of entries
@@ -129,95 +172,172 @@ async def get_entries_metadata(db: Session = Depends(get_db)):
     - 20 translations with newest comments
 
     This endpoint provides overview data useful for dashboards and activity feeds.
+
+    Served from a snapshot kept in memory; it reflects writes made through
+    this worker within a few seconds, and any write within
+    METADATA_MAX_AGE_SECONDS.
     """
-    metadata = crud_entries.get_entries_metadata(db)
-
-    # Convert the raw data to proper schema models
-    processed_metadata = EntryMetadata(
-        total_entries=metadata['total_entries'],
-        recently_updated_count=metadata['recently_updated_count'],
-        newest_updated_entries=[
-            EntryWithTranslations.model_validate(entry)
-            for entry in metadata['newest_updated_entries']
-        ],
-        entries_with_newest_translations=[
-            EntryWithTranslations.model_validate(entry)
-            for entry in metadata['entries_with_newest_translations']
-        ],
-        entries_with_newest_comments=[
-            _map_entry_with_comment(entry)
-            for entry in metadata['entries_with_newest_comments']
-        ]
+    return Response(content=await metadata_snapshot.get(), media_type="application/json")
+
+
+@router.get("/stats", response_model=EntryFacets)
+async def get_entry_facets(
+    search: Optional[str] = Query(None, description="Full-text search"),
+    fuzzy_search: Optional[str] = Query(
+        None, description="Fuzzy search using trigrams"
+    ),
+    search_mode: SearchMode = Query(
+        SearchMode.ENGLISH, description=SEARCH_MODE_DESCRIPTION
+    ),
+    fuzzy_mode: FuzzyMode = Query(FuzzyMode.SIMILARITY, description=FUZZY_MODE_DESCRIPTION),
+    fuzzy_threshold: Optional[float] = Query(
+        None, ge=0, le=1, description="Minimum trigram similarity for fuzzy_search (default 0.3, 0.6 for word)"
+    ),
+    language_code: Optional[str] = Query(
+        None, description="Filter by primary language"
+    ),
+    other_language_code: Optional[str] = Query(
+        None, description="Filter by other language codes"
+    ),
+    entry_type: Optional[str] = Query(None, description="Filter by entry type"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get entry counts per language_code, entry_type, is_verified and
+    other_language_codes, e.g. for filter dropdowns.
+    Accepts the same filters as the entry listing.
+    """
+    return await crud_entries.aget_entry_facets(
+        db,
+        search=search,
+        fuzzy_search=fuzzy_search,
+        search_mode=search_mode,
+        fuzzy_mode=fuzzy_mode,
+        fuzzy_threshold=fuzzy_threshold,
+        language_code=language_code,
+        other_language_code=other_language_code,
+        entry_type=entry_type
     )
 
-    return processed_metadata
+
+@router.get("/suggest", response_model=List[EntrySuggestion])
+async def suggest_entries(
+    q: str = Query(..., max_length=200, description="Prefix of an entry, alternative or translated name"),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """
+    Typeahead suggestions: entries with a name starting with q, ignoring
+    case and accents, verified and popular entries first.
+    Served from an in-memory index without a database round trip; changes
+    show up within a few seconds.
+    """
+    return entry_suggester.suggest(q, limit=limit)
 
 
-@router.get("/{entry_id}")
+ANNOTATE_MAX_CHARS = 100_000
+
+
+@router.post("/annotate", response_model=AnnotationResponse)
+async def annotate_text(
+    payload: AnnotateRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Find every known entry name (primary name, original script or
+    alternative name) in a passage, ignoring case and accents.
+    Returns non-overlapping spans (character offsets into the text) with the
+    matching entries and their preferred translation.
+    """
+    if len(payload.text) > ANNOTATE_MAX_CHARS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Text is longer than {ANNOTATE_MAX_CHARS} characters"
+        )
+
+    spans = await crud_entries.aannotate_text(db, text=payload.text)
+    return {"spans": spans}
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header lists `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def _not_modified(etag: str, cache_control: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control, "Vary": "Authorization"},
+    )
+
+
+@router.get("/{entry_id}", response_model=EntryWithTranslationsAndVotes)
 async def get_entry(
     entry_id: str,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[UserResponse] = Depends(get_current_user_optional)
 ):
     """
     Get entry by ID.
+
+    Responses carry an ETag and answer If-None-Match with 304 Not Modified.
+    The body is cached per worker and checked against the entry's
+    entry_versions counter on every request; the vote counters, which do
+    not bump that counter, are read fresh and overlaid on it, and so are a
+    logged-in user's own votes.
     """
-    # if include_translations:
-    entry = crud_entries.get_entry_with_translations(db, entry_id=entry_id)
-    if not entry:
+    field_set = _parse_fields(fields)
+    detail = await crud_entries.aget_entry_detail(db, entry_id=entry_id, fields=field_set)
+    if not detail:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Entry not found"
         )
 
-    if current_user:
-        # Enrich translations with user vote data
-        enriched_translations = crud_votes.enrich_translations_with_user_votes(
-            entry.translations, current_user.id, db
+    if not current_user:
+        if _etag_matches(if_none_match, detail.etag):
+            return _not_modified(detail.etag, "no-cache")
+        return Response(
+            content=detail.content,
+            media_type="application/json",
+            headers={"ETag": detail.etag, "Cache-Control": "no-cache", "Vary": "Authorization"},
         )
-        # Create entry with enriched translations
-        entry_dict = {
-            'id': entry.id,
-            'primary_name': entry.primary_name,
-            'original_script': entry.original_script,
-            'language_code': entry.language_code,
-            'entry_type': entry.entry_type,
-            'alternative_names': entry.alternative_names,
-            'other_language_codes': entry.other_language_codes,
-            'etymology': entry.etymology,
-            'definition': entry.definition,
-            'historical_context': entry.historical_context,
-            'created_by': entry.created_by,
-            'updated_by': entry.updated_by,
-            'is_verified': entry.is_verified,
-            'verification_notes': entry.verification_notes,
-            'created_at': entry.created_at,
-            'updated_at': entry.updated_at,
-            'translations': enriched_translations
-        }
-        return EntryWithTranslationsAndVotes(**entry_dict)
-    else:
-        return EntryWithTranslations.model_validate(entry)
-    # else:
-    #     entry = crud_entries.get_entry(db, entry_id=entry_id)
-    #     if not entry:
-    #         raise HTTPException(
-    #             status_code=status.HTTP_404_NOT_FOUND,
-    #             detail="Entry not found"
-    #         )
-    #     return EntryResponse.model_validate(entry)
+
+    translation_ids = [translation["id"] for translation in detail.body.get("translations", [])]
+    user_votes = await crud_votes.aget_user_votes_for_translations(
+        db, translation_ids=translation_ids, user_id=current_user.id
+    ) if translation_ids else {}
+    vote_key = ",".join(f"{translation_id}={vote}" for translation_id, vote in sorted(user_votes.items()))
+    etag = '"' + hashlib.sha256(f"{detail.etag}|{current_user.id}|{vote_key}".encode()).hexdigest()[:32] + '"'
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag, "private, no-cache")
+
+    body = dict(detail.body)
+    if "translations" in body:
+        body["translations"] = [
+            {**translation, "user_vote": user_votes.get(translation["id"])}
+            for translation in body["translations"]
+        ]
+    return JSONResponse(
+        content=body,
+        headers={"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Authorization"},
+    )
 
 
 @router.post("/", response_model=EntryResponse)
 async def create_entry(
     entry: EntryCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Create new entry.
     """
-    created_entry = crud_entries.create_entry(
+    created_entry = await crud_entries.acreate_entry(
         db, entry=entry, user_id=current_user.id
     )
     return EntryResponse.model_validate(created_entry)
@@ -225,7 +345,7 @@ async def create_entry(
 @router.put("/bulk", response_model=List[EntryResponse])
 async def bulk_update_entries(
     payload: BulkEntryUpdateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
@@ -238,8 +358,8 @@ async def bulk_update_entries(
             detail="No entry IDs provided."
         )
 
-    updated_entries = crud_entries.bulk_update_entries(
-        db=db,
+    updated_entries = await crud_entries.abulk_update_entries(
+        db,
         entry_ids=payload.entry_ids,
         updates=payload.updates,
         verify_user_id=None if current_user.role in ["admin", "verified_translator"] else current_user.id
@@ -258,13 +378,13 @@ async def bulk_update_entries(
 async def update_entry(
     entry_id: str,
     entry_update: EntryUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Update entry. Only creator or admins can update.
     """
-    existing_entry = crud_entries.get_entry(db, entry_id=entry_id)
+    existing_entry = await crud_entries.aget_entry(db, entry_id=entry_id)
     if not existing_entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -279,7 +399,7 @@ async def update_entry(
             detail="Not enough permissions"
         )
 
-    updated_entry = crud_entries.update_entry(
+    updated_entry = await crud_entries.aupdate_entry(
         db, entry_id=entry_id, entry_update=entry_update, user_id=current_user.id
     )
     return EntryResponse.model_validate(updated_entry)
@@ -288,13 +408,13 @@ async def update_entry(
 @router.delete("/{entry_id}")
 async def delete_entry(
     entry_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Delete entry. Only creator or admins can delete.
     """
-    existing_entry = crud_entries.get_entry(db, entry_id=entry_id)
+    existing_entry = await crud_entries.aget_entry(db, entry_id=entry_id)
     if not existing_entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -309,7 +429,7 @@ async def delete_entry(
             detail="Not enough permissions"
         )
 
-    success = crud_entries.delete_entry(db, entry_id=entry_id)
+    success = await crud_entries.adelete_entry(db, entry_id=entry_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -323,13 +443,13 @@ async def delete_entry(
 async def verify_entry(
     entry_id: str,
     notes: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_admin_user)
 ):
     """
     Verify entry. Admin or verified translator only.
     """
-    verified_entry = crud_entries.verify_entry(
+    verified_entry = await crud_entries.averify_entry(
         db, entry_id=entry_id, user_id=current_user.id, notes=notes
     )
     if not verified_entry:
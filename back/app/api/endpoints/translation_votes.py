@@ -1,20 +1,75 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from uuid import UUID
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_async_db
 from app.crud import translation_votes as crud_votes
-from app.schemas.translations import VoteCreate, VoteResponse
+from app.schemas.translations import VoteCreate, VoteResponse, VoteReconciliationReport
 from app.schemas.auth import UserResponse
 from app.api.endpoints.auth import get_current_user
 
 router = APIRouter()
 
+# Drifted translations listed in one reconciliation report
+MAX_DRIFT_SAMPLE = 100
+
+
+@router.post("/translations/recalculate-votes", response_model=VoteReconciliationReport)
+async def reconcile_votes(
+    after_id: Optional[UUID] = Query(None, description="Continue after this translation id"),
+    batch_size: int = Query(1000, ge=1, le=10000),
+    max_batches: int = Query(10, ge=1, le=100, description="Stop after this many batches"),
+    dry_run: bool = Query(False, description="Only report drifted translations"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    """
+    Recompute vote counts of translations (admin only).
+    Runs at most `max_batches` batches of `batch_size` translations, each in
+    its own short transaction, and reports how many translations had drifted
+    with the first MAX_DRIFT_SAMPLE of them. Call again with `next_after_id`
+    as `after_id` until it comes back null.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    if not dry_run:
+        # Deltas still pending in this worker would be counted twice otherwise
+        await crud_votes.vote_flusher.flush_now()
+
+    checked = 0
+    drifted_count = 0
+    drifted = []
+    batches = 0
+    while batches < max_batches:
+        last_id, batch_checked, batch_drifted = await crud_votes.areconcile_vote_counts(
+            db, after_id=after_id, batch_size=batch_size, dry_run=dry_run
+        )
+        if last_id is None:
+            after_id = None
+            break
+        after_id = last_id
+        checked += batch_checked
+        drifted_count += len(batch_drifted)
+        drifted.extend(batch_drifted[:MAX_DRIFT_SAMPLE - len(drifted)])
+        batches += 1
+
+    return VoteReconciliationReport(
+        checked=checked, drifted_count=drifted_count, drifted=drifted, dry_run=dry_run,
+        next_after_id=after_id
+    )
+
 
 @router.post("/translations/{translation_id}/vote", response_model=VoteResponse)
 async def vote_on_translation(
     translation_id: str,
     vote: VoteCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
@@ -22,43 +77,55 @@ async def vote_on_translation(
     If user already voted, this will update their existing vote.
     """
     # The create_or_update_vote function already handles both creating new votes and updating existing ones
-    db_vote = crud_votes.create_or_update_vote(
-        db, translation_id=translation_id, user_id=current_user.id, vote=vote
+    db_vote = await crud_votes.acreate_or_update_vote(
+        db, translation_id=translation_id, user_id=current_user.id, vote=vote,
+        deferred=settings.vote_write_behind
     )
+    if db_vote is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Translation not found"
+        )
     return VoteResponse.model_validate(db_vote)
 
 
 @router.delete("/translations/{translation_id}/vote")
 async def remove_vote(
     translation_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Remove user's vote from a translation.
     """
-    success = crud_votes.delete_vote(
-        db, translation_id=translation_id, user_id=current_user.id
+    counts = await crud_votes.adelete_vote(
+        db, translation_id=translation_id, user_id=current_user.id,
+        deferred=settings.vote_write_behind
     )
-    if not success:
+    if counts is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Vote not found"
         )
 
-    return {"message": "Vote removed successfully"}
+    upvotes, downvotes = counts
+    return {
+        "message": "Vote removed successfully",
+        "upvotes": upvotes,
+        "downvotes": downvotes
+    }
 
 
 @router.get("/translations/{translation_id}/vote", response_model=VoteResponse)
 async def get_user_vote(
     translation_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Get current user's vote on a translation.
     """
-    vote = crud_votes.get_user_vote(
+    vote = await crud_votes.aget_user_vote(
         db, translation_id=translation_id, user_id=current_user.id
     )
     if not vote:
@@ -73,7 +140,7 @@ async def get_user_vote(
 @router.post("/translations/{translation_id}/recalculate-votes")
 async def recalculate_votes(
     translation_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
@@ -87,7 +154,7 @@ async def recalculate_votes(
             detail="Admin access required"
         )
 
-    upvotes, downvotes = crud_votes.recalculate_vote_counts(db, translation_id)
+    upvotes, downvotes = await crud_votes.arecalculate_vote_counts(db, translation_id)
 
     return {
         "message": "Vote counts recalculated",
@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.crud import entries as crud_entries
-from app.models.models import Translation
+from app.crud import translations as crud_translations
 from app.schemas.translations import (
     TranslationCreate,
     TranslationUpdate,
@@ -12,61 +12,50 @@ from app.schemas.translations import (
 )
 from app.schemas.auth import UserResponse
 from app.api.endpoints.auth import get_current_user
-import uuid
 
 router = APIRouter()
 
 
 @router.get("/entry/{entry_id}", response_model=List[TranslationResponse])
-async def get_entry_translations(entry_id: str, db: Session = Depends(get_db)):
+async def get_entry_translations(entry_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Get all translations for an entry.
     """
     # Check if entry exists
-    entry = crud_entries.get_entry(db, entry_id=entry_id)
+    entry = await crud_entries.aget_entry(db, entry_id=entry_id)
     if not entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Entry not found"
         )
 
-    translations = db.query(Translation).filter(Translation.entry_id == entry_id).all()
+    translations = await crud_translations.aget_entry_translations(db, entry_id=entry_id)
     return [TranslationResponse.model_validate(translation) for translation in translations]
 
 
 @router.post("/", response_model=TranslationResponse)
 async def create_translation(
     translation: TranslationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Create new translation.
     """
     # Check if entry exists
-    entry = crud_entries.get_entry(db, entry_id=translation.entry_id)
+    entry = await crud_entries.aget_entry(db, entry_id=translation.entry_id)
     if not entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Entry not found"
         )
 
-    db_translation = Translation(
-        id=uuid.uuid4(),
-        entry_id=translation.entry_id,
-        translated_name=translation.translated_name,
-        notes=translation.notes,
-        source_id=translation.source_id,
-        created_by=current_user.id,
-        updated_by=current_user.id
-    )
-
     try:
-        db.add(db_translation)
-        db.commit()
-        db.refresh(db_translation)
+        db_translation = await crud_translations.acreate_translation(
+            db, translation=translation, user_id=current_user.id
+        )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         if "unique constraint" in str(e).lower():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -84,15 +73,13 @@ async def create_translation(
 async def update_translation(
     translation_id: str,
     translation_update: TranslationUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Update translation. Only creator or admins can update.
     """
-    db_translation = db.query(Translation).filter(
-        Translation.id == translation_id
-    ).first()
+    db_translation = await crud_translations.aget_translation(db, translation_id=translation_id)
     if not db_translation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -107,17 +94,12 @@ async def update_translation(
             detail="Not enough permissions"
         )
 
-    update_data = translation_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_translation, field, value)
-
-    db_translation.updated_by = current_user.id
-
     try:
-        db.commit()
-        db.refresh(db_translation)
+        db_translation = await crud_translations.aupdate_translation(
+            db, db_translation, translation_update=translation_update, user_id=current_user.id
+        )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         if "unique constraint" in str(e).lower():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -134,15 +116,13 @@ async def update_translation(
 @router.delete("/{translation_id}")
 async def delete_translation(
     translation_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Delete translation. Only creator or admins can delete.
     """
-    db_translation = db.query(Translation).filter(
-        Translation.id == translation_id
-    ).first()
+    db_translation = await crud_translations.aget_translation(db, translation_id=translation_id)
     if not db_translation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -157,7 +137,6 @@ async def delete_translation(
             detail="Not enough permissions"
         )
 
-    db.delete(db_translation)
-    db.commit()
+    await crud_translations.adelete_translation(db, db_translation)
 
     return {"message": "Translation deleted successfully"}
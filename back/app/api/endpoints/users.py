@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict, Any
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.crud import users as crud_users
 from app.schemas.users import UserResponse, UserUpdate
 from app.schemas.auth import UserResponse as AuthUserResponse
@@ -14,7 +14,7 @@ router = APIRouter()
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AuthUserResponse = Depends(get_current_user)
 ):
     """
@@ -26,7 +26,7 @@ async def get_user(
             detail="Not enough permissions"
         )
 
-    user = crud_users.get_user(db, user_id=user_id)
+    user = await crud_users.aget_user(db, user_id=user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -40,7 +40,7 @@ async def get_user(
 async def update_user(
     user_id: str,
     user_update: UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AuthUserResponse = Depends(get_current_user)
 ):
     """
@@ -60,7 +60,7 @@ async def update_user(
             detail="Only admins can change user roles"
         )
 
-    updated_user = crud_users.update_user(db, user_id=user_id, user_update=user_update)
+    updated_user = await crud_users.aupdate_user(db, user_id=user_id, user_update=user_update)
     if not updated_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -74,32 +74,32 @@ async def update_user(
 async def list_users(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: AuthUserResponse = Depends(get_current_admin_user)  # Used for auth check only
 ):
     """
     List all users. Admin only.
     """
-    users = db.query(crud_users.User).offset(skip).limit(limit).all()
+    users = await crud_users.alist_users(db, skip=skip, limit=limit)
     return [UserResponse.model_validate(user) for user in users]
 
 
 @router.get("/me/metadata", response_model=Dict[str, Any])
 async def get_current_user_metadata(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AuthUserResponse = Depends(get_current_user)
 ):
     """
     Get current user's metadata including contributions, activity, and translated books.
     """
-    metadata = crud_users.get_user_metadata(db, user_id=current_user.id)
+    metadata = await crud_users.aget_user_metadata(db, user_id=current_user.id)
     return metadata
 
 
 @router.get("/{user_id}/metadata", response_model=Dict[str, Any])
 async def get_user_metadata(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AuthUserResponse = Depends(get_current_user)
 ):
     """
@@ -112,12 +112,12 @@ async def get_user_metadata(
         )
 
     # Check if user exists
-    user = crud_users.get_user(db, user_id=user_id)
+    user = await crud_users.aget_user(db, user_id=user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
 
-    metadata = crud_users.get_user_metadata(db, user_id=user_id)
+    metadata = await crud_users.aget_user_metadata(db, user_id=user_id)
     return metadata
@@ -0,0 +1,79 @@
+from array import array
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# Transitions are stored in one dict keyed by node << CHAR_BITS | ord(char),
+# which takes far less memory than a dict per trie node
+CHAR_BITS = 21
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over a fixed set of string keys.
+
+    find() reports every occurrence of every key in a text in one pass, in
+    O(len(text) + number of matches) regardless of the number of keys. The
+    automaton is immutable; build a new one to change the keys.
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        # Trie, node 0 is the root. Transitions are also kept per depth of
+        # the node they lead to, which is the order failure links are computed in.
+        goto: Dict[int, int] = {}
+        depth = array("i", [0])
+        terminal = bytearray(1)
+        levels: List[List[int]] = []
+        for key in keys:
+            if not key:
+                continue
+            node = 0
+            for char in key:
+                transition = node << CHAR_BITS | ord(char)
+                child = goto.get(transition)
+                if child is None:
+                    child = len(depth)
+                    goto[transition] = child
+                    depth.append(depth[node] + 1)
+                    terminal.append(0)
+                    if len(levels) < depth[child]:
+                        levels.append([])
+                    levels[depth[child] - 1].append(transition)
+                node = child
+            terminal[node] = 1
+
+        # fail[node]: node of the longest proper suffix that is also in the trie.
+        # output[node]: nearest node on the fail chain (node included) that ends
+        # a key, 0 if there is none.
+        fail = array("i", bytes(4 * len(depth)))
+        output = array("i", bytes(4 * len(depth)))
+        char_mask = (1 << CHAR_BITS) - 1
+        for level in levels:
+            for transition in level:
+                child = goto[transition]
+                node = transition >> CHAR_BITS
+                if node:
+                    char = transition & char_mask
+                    state = fail[node]
+                    while state and (state << CHAR_BITS | char) not in goto:
+                        state = fail[state]
+                    fail[child] = goto.get(state << CHAR_BITS | char, 0)
+                output[child] = child if terminal[child] else output[fail[child]]
+
+        self._goto = goto
+        self._depth = depth
+        self._fail = fail
+        self._output = output
+        self.key_count = sum(terminal)
+
+    def find(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) of every key occurrence in `text`, by end position."""
+        goto, fail, output, depth = self._goto, self._fail, self._output, self._depth
+        node = 0
+        for index, char in enumerate(text):
+            code = ord(char)
+            while node and (node << CHAR_BITS | code) not in goto:
+                node = fail[node]
+            node = goto.get(node << CHAR_BITS | code, 0)
+            match = output[node]
+            while match:
+                yield index + 1 - depth[match], index + 1
+                match = output[fail[match]]
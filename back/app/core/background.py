@@ -0,0 +1,72 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher:
+    """
+    Runs `refresh` in the background every `interval` seconds, and `debounce`
+    seconds after wake() was called, so that commits arriving in a burst
+    (e.g. a run of votes) are picked up together. A failed refresh is logged
+    under `name` and retried on the next round; whatever `refresh` maintains
+    keeps its previous value meanwhile.
+    """
+
+    def __init__(self, refresh: Callable[[], Awaitable[Any]], interval: float, debounce: float = 0.0, name: str = "Background refresh"):
+        self.refresh = refresh
+        self.interval = interval
+        self.debounce = debounce
+        self.name = name
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def wake(self) -> None:
+        """Ask for a refresh soon; safe to call from any thread."""
+        if self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def refresh_now(self) -> bool:
+        """Run `refresh` once; returns False (after logging) if it failed."""
+        try:
+            await self.refresh()
+        except Exception:
+            logger.exception("%s failed", self.name)
+            return False
+        return True
+
+    async def start(self, refresh_first: bool = False) -> None:
+        """
+        Start the loop. With `refresh_first`, refresh once before returning;
+        if that fails the loop retries, so a database that is down at boot
+        does not stop the app from starting.
+        """
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            if refresh_first:
+                await self.refresh_now()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._loop = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
+                await asyncio.sleep(self.debounce)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.refresh_now()
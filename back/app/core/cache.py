@@ -0,0 +1,122 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Tuple, Type
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries also expire after `ttl` seconds.
+    Used for per-process caches of query results that are invalidated on writes.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# model class -> callbacks run after a commit that wrote rows of that model
+_write_listeners: Dict[Type, List[Callable[[Session], None]]] = {}
+
+
+def on_commit_of(*models: Type) -> Callable:
+    """
+    Register a callback to run after any session commit that inserted, updated
+    or deleted rows of one of `models`, including bulk query.update/delete().
+    The callback receives the committed session.
+    """
+    def decorator(callback: Callable[[Session], None]) -> Callable[[Session], None]:
+        for model in models:
+            _write_listeners.setdefault(model, []).append(callback)
+        return callback
+    return decorator
+
+
+def _written_models(session: Session) -> set:
+    return session.info.setdefault("written_models", set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_models(session, flush_context):
+    written = _written_models(session)
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        written.add(type(obj))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_writes(orm_execute_state):
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            _written_models(orm_execute_state.session).add(mapper.class_)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_write_listeners(session):
+    written = session.info.pop("written_models", None)
+    if not written:
+        return
+    callbacks: List[Callable[[Session], None]] = []
+    for model in written:
+        for callback in _write_listeners.get(model, []):
+            if callback not in callbacks:
+                callbacks.append(callback)
+    for callback in callbacks:
+        callback(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_written_models(session):
+    session.info.pop("written_models", None)
+
+
+def mark_written(session: Session, *models: Type) -> None:
+    """Record writes made with raw SQL so that commit listeners still fire."""
+    _written_models(session).update(models)
+
+
+def cached_value(cache: TTLCache, key: Hashable, compute: Callable[[], Any]) -> Any:
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = compute()
+        cache.set(key, value)
+    return value
+
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import EmailStr, field_validator
+from typing import Optional
 import json
 
 class Settings(BaseSettings):
@@ -12,6 +13,8 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    # asyncpg URL for the async engine; derived from database_url when unset
+    async_database_url: Optional[str] = None
 
     # Security
     secret_key: str
@@ -29,6 +32,51 @@ class Settings(BaseSettings):
     environment: str = "development"
     debug: bool = False
 
+    # Caching (per worker process)
+    count_cache_size: int = 1024
+    count_cache_ttl_seconds: int = 300
+    # Authenticated users by id; a role/activation change made through another
+    # worker is seen here after at most principal_cache_ttl_seconds
+    principal_cache_size: int = 4096
+    principal_cache_ttl_seconds: int = 60
+    # Serialized GET /entries/{id} bodies; validated against the entry's
+    # version counter on every read, the TTL only bounds memory
+    entry_detail_cache_size: int = 2048
+    entry_detail_cache_ttl_seconds: int = 3600
+    # In-memory name index for POST /entries/annotate; entries changed through
+    # another worker are picked up after at most annotation_refresh_seconds
+    annotation_refresh_seconds: int = 30
+    annotation_delta_max_keys: int = 2000
+    # In-memory typeahead index for GET /entries/suggest, refreshed in the
+    # background; other workers' writes show up within suggest_refresh_seconds
+    suggest_refresh_seconds: int = 5
+    suggest_delta_max_entries: int = 1000
+    # In-memory snapshot of GET /entries/metadata, rebuilt in the background
+    # and after local writes; never served older than metadata_max_age_seconds
+    metadata_max_age_seconds: int = 60
+    # Per-user contribution counts (user_stats) are kept current by
+    # triggers, except the last-30-days counts, which are recomputed every
+    # user_stats_refresh_seconds and so may be that much behind.
+    user_stats_refresh_seconds: int = 300
+    # Aggregate endpoints (entry metadata) spread their independent
+    # queries over up to this many pooled connections at once; 1 runs them
+    # one after another. Requests in flight times this should stay within
+    # db_pool_size + db_max_overflow, or requests wait for connections.
+    aggregate_query_concurrency: int = 4
+    # Connection pool of the async engine (per worker)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+
+    # Write-behind voting: votes are stored immediately, but the counters on
+    # translations are updated in batches, every vote_flush_interval_ms or
+    # once vote_flush_max_votes votes are pending, whichever comes first.
+    # Vote counts then lag by up to that interval. Pending deltas are kept in
+    # the worker's memory and lost if it dies; POST
+    # /translations/recalculate-votes rebuilds the counters from the votes.
+    vote_write_behind: bool = False
+    vote_flush_interval_ms: int = 500
+    vote_flush_max_votes: int = 200
+
     # CORS - can be a JSON string or list
     backend_cors_origins: list[str] = [
         "http://localhost:3000",
@@ -49,4 +97,15 @@ class Settings(BaseSettings):
                 return [origin.strip() for origin in v.split(',') if origin.strip()]
         return v
 
+    @field_validator('async_database_url', mode='after')
+    @classmethod
+    def derive_async_database_url(cls, v, info):
+        if v:
+            return v
+        url = info.data.get('database_url', '')
+        for prefix in ('postgresql+psycopg2://', 'postgresql://', 'postgres://'):
+            if url.startswith(prefix):
+                return 'postgresql+asyncpg://' + url[len(prefix):]
+        return url
+
 settings = Settings()
@@ -1,6 +1,9 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Awaitable, Callable, Generator, Iterable, List, Optional, TypeVar
+import asyncio
+import functools
 from .config import settings
 
 engine = create_engine(
@@ -12,6 +15,21 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    settings.async_database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=300,
+    echo=settings.debug,
+)
+
+# Objects outlive the commit so responses can be built without lazy refreshes,
+# which would need an await outside of the session
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 # Dependency to get database session
 def get_db() -> Generator[Session, None, None]:
@@ -20,3 +38,54 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+# Dependency to get async database session
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+T = TypeVar("T")
+
+
+def to_async(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    Async version of a CRUD function written against a sync Session.
+
+    The function runs through AsyncSession.run_sync, so its queries go over the
+    asyncpg connection and the event loop keeps serving other requests while
+    they wait on the database.
+    """
+    @functools.wraps(func)
+    async def wrapper(db: AsyncSession, *args, **kwargs) -> T:
+        return await db.run_sync(func, *args, **kwargs)
+    return wrapper
+
+
+async def run_concurrently(
+    funcs: Iterable[Callable[[Session], T]], max_concurrency: Optional[int] = None
+) -> List[T]:
+    """
+    Run independent sync query functions concurrently and return their
+    results in order.
+
+    Up to `max_concurrency` (default settings.aggregate_query_concurrency)
+    workers each open their own AsyncSession, and so their own pooled
+    connection, and take functions from a shared queue until it is empty.
+    A request therefore holds at most that many connections, and pays one
+    checkout per worker rather than per query. Objects returned are
+    detached; anything read from them must be loaded by the function.
+    """
+    funcs = list(funcs)
+    results: List[T] = [None] * len(funcs)
+    pending = iter(enumerate(funcs))
+
+    async def worker() -> None:
+        async with AsyncSessionLocal() as db:
+            for index, func in pending:
+                results[index] = await db.run_sync(func)
+
+    workers = min(max_concurrency or settings.aggregate_query_concurrency, len(funcs))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return results
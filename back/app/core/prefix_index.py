@@ -0,0 +1,63 @@
+from array import array
+from bisect import bisect_left
+from heapq import heappop, heappush
+from typing import Any, Iterable, Iterator, List, Tuple
+
+# Sorts after every character that occurs in a key
+_MAX_CHAR = "\U0010ffff"
+
+
+class PrefixIndex:
+    """
+    Immutable index of (key, score, value) items for prefix queries.
+
+    Keys are kept sorted, so the items whose key starts with a prefix are one
+    contiguous range found by bisect. A sparse table of range maxima over the
+    scores then yields the items of that range best score first, in
+    O(log k) per item for the first k items, however large the range is.
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, float, Any]]):
+        items = sorted(items, key=lambda item: item[0])
+        self._keys: List[str] = [key for key, _, _ in items]
+        self._scores = array("d", (score for _, score, _ in items))
+        self._values: List[Any] = [value for _, _, value in items]
+
+        # _best_of[j][i]: position of the best score in [i, i + 2**j)
+        scores = self._scores
+        self._best_of = [array("i", range(len(items)))]
+        width = 1
+        while width * 2 <= len(items):
+            previous = self._best_of[-1]
+            self._best_of.append(array("i", (
+                a if scores[a] >= scores[b] else b
+                for a, b in zip(previous, previous[width:])
+            )))
+            width *= 2
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _best(self, lo: int, hi: int) -> int:
+        level = (hi - lo).bit_length() - 1
+        a = self._best_of[level][lo]
+        b = self._best_of[level][hi - (1 << level)]
+        return a if self._scores[a] >= self._scores[b] else b
+
+    def top(self, prefix: str) -> Iterator[Tuple[str, float, Any]]:
+        """Yield the items whose key starts with `prefix`, best score first."""
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + _MAX_CHAR, lo)
+        if lo >= hi:
+            return
+
+        # Max-heap of sub-ranges keyed by the best score each one holds
+        best = self._best(lo, hi)
+        heap = [(-self._scores[best], best, lo, hi)]
+        while heap:
+            _, position, lo, hi = heappop(heap)
+            yield self._keys[position], self._scores[position], self._values[position]
+            for sub_lo, sub_hi in ((lo, position), (position + 1, hi)):
+                if sub_lo < sub_hi:
+                    best = self._best(sub_lo, sub_hi)
+                    heappush(heap, (-self._scores[best], best, sub_lo, sub_hi))
@@ -0,0 +1,91 @@
+from functools import lru_cache
+from typing import List, Tuple
+import re
+import unicodedata
+
+from pypinyin import Style, lazy_pinyin
+
+
+@lru_cache(maxsize=65536)
+def _fold_char(char: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", char)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def fold_with_offsets(text: str) -> Tuple[str, List[int]]:
+    """
+    Case- and accent-folded form of `text` (Greek breathings, accents and
+    iota subscripts, Latin diacritics and macrons are dropped, final sigma
+    becomes σ), with runs of whitespace collapsed to one space.
+
+    Also returns, for every character of the folded text, the index of the
+    character of `text` it came from, so matches in the folded text can be
+    mapped back to the original.
+    """
+    chars: List[str] = []
+    offsets: List[int] = []
+    for index, char in enumerate(text):
+        if char.isspace():
+            if chars and chars[-1] != " ":
+                chars.append(" ")
+                offsets.append(index)
+            continue
+        for folded in _fold_char(char):
+            chars.append(folded)
+            offsets.append(index)
+    return "".join(chars), offsets
+
+
+def fold(text: str) -> str:
+    """Case- and accent-folded form of `text`, see fold_with_offsets."""
+    return fold_with_offsets(text)[0].strip()
+
+
+# The steps of the name_search_key() SQL function (migration 6f2c8e4a1d57),
+# applied in this order after folding
+_GREEK_DIGRAPHS = (
+    ("γγ", "ng"), ("γκ", "nk"), ("γχ", "nch"), ("γξ", "nx"),
+    ("θ", "th"), ("φ", "ph"), ("χ", "ch"), ("ψ", "ps"),
+)
+_NAME_KEY_LETTERS = ("αβγδεζηικλμνξοπρσςτυωjvy", "abgdezeiklmnxoprsstuoiuu")
+_SPELLING_MERGES = (("kh", "ch"), ("k", "c"), ("rh", "r"), ("ou", "u"))
+_INITIAL_H = re.compile(r"(^|[^a-z])h")
+
+
+def name_search_key(text: str) -> str:
+    """
+    Python counterpart of the name_search_key() SQL function: fold() plus
+    Greek-to-Latin transliteration and spelling merges, so that Ἀχιλλεύς,
+    Achilleus and Akhilleus all give "achilleus". Unlike the SQL function it
+    collapses whitespace, as fold() does.
+    """
+    key = fold(text)
+    for greek, latin in _GREEK_DIGRAPHS:
+        key = key.replace(greek, latin)
+    key = key.translate(str.maketrans(*_NAME_KEY_LETTERS))
+    for spelling, merged in _SPELLING_MERGES:
+        key = key.replace(spelling, merged)
+    return _INITIAL_H.sub(r"\1", key)
+
+
+_PINYIN_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def pinyin_keys(text: str) -> Tuple[str, str]:
+    """
+    Toneless pinyin reading of `text` as (full, initials), e.g. 阿喀琉斯 gives
+    ("a ka liu si", "akls"). Syllables are space-separated in `full`, so it
+    sorts syllable by syllable. Other words are folded and only their ASCII
+    letters and digits kept, so Greek or Cyrillic text contributes nothing.
+    """
+    tokens = [
+        token
+        for chunk in lazy_pinyin(text, style=Style.NORMAL)
+        for token in _PINYIN_TOKEN.findall(fold(chunk))
+    ]
+    return " ".join(tokens), "".join(token[0] for token in tokens)
+
+
+def pinyin_query(text: str) -> str:
+    """Search form of typed pinyin: folded (tone marks dropped), letters and digits only."""
+    return "".join(_PINYIN_TOKEN.findall(fold(text)))
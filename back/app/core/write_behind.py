@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+Deltas = Dict[Hashable, Tuple[int, ...]]
+
+
+class WriteBehindFlusher:
+    """
+    Sums counter deltas per key in process memory and hands them to `flush`
+    in one batch, at most `interval` seconds after one was added, or as soon
+    as `max_pending` were added. The deltas die with the process, so the
+    writes they come from must be stored durably and the counters be
+    rebuildable from them. `flush` returns None when it could not run (e.g.
+    another process is flushing); the deltas are then kept and retried.
+    """
+
+    def __init__(self, flush: Callable[[Deltas], Awaitable[Optional[int]]], interval: float, max_pending: int):
+        self.flush = flush
+        self.interval = interval
+        self.max_pending = max_pending
+        self._deltas: Deltas = {}
+        self._added = 0
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, key: Hashable, deltas: Tuple[int, ...]) -> Tuple[int, ...]:
+        """Add `deltas` to those pending for `key`; returns the pending sum."""
+        self._merge({key: deltas})
+        self._added += 1
+        if self._added >= self.max_pending:
+            self._wake.set()
+        return self._deltas[key]
+
+    def pending(self, key: Hashable) -> Optional[Tuple[int, ...]]:
+        return self._deltas.get(key)
+
+    async def flush_now(self) -> None:
+        await self._flush()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._deltas:
+            await self.flush_now()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if self._deltas:
+                await self.flush_now()
+
+    def _merge(self, deltas: Deltas) -> None:
+        for key, values in deltas.items():
+            current = self._deltas.get(key)
+            self._deltas[key] = values if current is None else tuple(a + b for a, b in zip(current, values))
+
+    async def _flush(self) -> None:
+        deltas, self._deltas = self._deltas, {}
+        added, self._added = self._added, 0
+        if not deltas:
+            return
+        try:
+            flushed = await self.flush(deltas)
+        except Exception:
+            # Deltas added meanwhile are merged with these for the next flush
+            logger.exception("Write-behind flush failed")
+            flushed = None
+        if flushed is None:
+            self._merge(deltas)
+            self._added += added
@@ -0,0 +1,80 @@
+from sqlalchemy import desc, tuple_
+from sqlalchemy.orm import Session
+from app.core.database import to_async
+from app.crud.entries import InvalidCursorError
+from app.models.models import ActivityEvent, Entry, User
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+import base64
+import binascii
+import json
+
+
+def _encode_cursor(created_at: datetime, event_id: int) -> str:
+    payload = json.dumps([created_at.isoformat(), event_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, event_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(event_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidCursorError("Malformed cursor")
+
+
+def get_activity(
+    db: Session,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    event_types: Optional[List[str]] = None,
+    entry_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Activity events newest first, with keyset pagination on (created_at, id).
+
+    Each page is a range scan of idx_activity_events_created_at (or of
+    idx_activity_events_entry_id for one entry), starting after the cursor,
+    so its cost does not depend on how far back the feed is read.
+    """
+    query = db.query(ActivityEvent, Entry.primary_name, User.username).join(
+        Entry, Entry.id == ActivityEvent.entry_id
+    ).outerjoin(
+        User, User.id == ActivityEvent.user_id
+    )
+    if event_types:
+        query = query.filter(ActivityEvent.event_type.in_(event_types))
+    if entry_id is not None:
+        query = query.filter(ActivityEvent.entry_id == entry_id)
+    if cursor:
+        query = query.filter(
+            tuple_(ActivityEvent.created_at, ActivityEvent.id) < tuple_(*_decode_cursor(cursor))
+        )
+
+    rows = query.order_by(
+        desc(ActivityEvent.created_at), desc(ActivityEvent.id)
+    ).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    items = []
+    for event, primary_name, username in rows:
+        event.primary_name = primary_name
+        event.username = username
+        items.append(event)
+
+    next_cursor = None
+    if has_more and items:
+        next_cursor = _encode_cursor(items[-1].created_at, items[-1].id)
+
+    return {
+        "limit": limit,
+        "items": items,
+        "has_more": has_more,
+        "next_cursor": next_cursor
+    }
+
+
+# Async versions for AsyncSession callers
+aget_activity = to_async(get_activity)
@@ -0,0 +1,67 @@
+from sqlalchemy.orm import Session, joinedload
+from app.core.database import to_async
+from app.models.models import Comment
+from app.schemas.comments import CommentCreate, CommentUpdate
+from typing import Optional, List
+import uuid
+
+
+def get_comment(db: Session, comment_id: str) -> Optional[Comment]:
+    return db.query(Comment).filter(Comment.id == comment_id).first()
+
+
+def get_entry_comments(db: Session, entry_id: uuid.UUID) -> List[Comment]:
+    # Eagerly load user information for CommentWithUser
+    return db.query(Comment).options(
+        joinedload(Comment.user)
+    ).filter(
+        Comment.entry_id == entry_id
+    ).order_by(Comment.created_at).all()
+
+
+def create_comment(db: Session, comment: CommentCreate, user_id: str) -> Comment:
+    db_comment = Comment(
+        id=uuid.uuid4(),
+        entry_id=comment.entry_id,
+        user_id=user_id,
+        parent_comment_id=comment.parent_comment_id,
+        content=comment.content
+    )
+
+    db.add(db_comment)
+    db.commit()
+    db.refresh(db_comment)
+    return db_comment
+
+
+def update_comment(db: Session, db_comment: Comment, comment_update: CommentUpdate) -> Comment:
+    # Store old content in edit history if updating content
+    if comment_update.content and comment_update.content != db_comment.content:
+        edit_history = db_comment.edit_history or {}
+        edit_history[str(len(edit_history))] = {
+            "old_content": db_comment.content,
+            "edited_at": str(uuid.uuid4())  # Using uuid as timestamp placeholder
+        }
+        db_comment.edit_history = edit_history
+        db_comment.is_edited = True
+
+    update_data = comment_update.model_dump(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(db_comment, field, value)
+
+    db.commit()
+    db.refresh(db_comment)
+    return db_comment
+
+
+def delete_comment(db: Session, db_comment: Comment) -> None:
+    db.delete(db_comment)
+    db.commit()
+
+
+# Async versions for AsyncSession callers
+aget_comment = to_async(get_comment)
+aget_entry_comments = to_async(get_entry_comments)
+acreate_comment = to_async(create_comment)
+aupdate_comment = to_async(update_comment)
+adelete_comment = to_async(delete_comment)
@@ -1,34 +1,584 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import text, desc, asc, func, or_
-from app.models.models import Entry, Translation, Comment
-from app.schemas.entries import BulkEntryUpdates, EntryCreate, EntryUpdate, PaginatedEntries
-from typing import Optional, List, Dict, Any
+from sqlalchemy.orm import Session, aliased, joinedload, load_only
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    text, desc, asc, func, or_, and_, tuple_, cast, literal, literal_column, select, true, false, union_all,
+    DateTime, REAL, String
+)
+from app.core.cache import TTLCache, cached_value, on_commit_of
+from app.core.config import settings
+from app.core.database import run_concurrently, to_async
+from app.core.text import pinyin_query
+from app.models.models import (
+    ActivityEvent, Comment, Entry, EntryAlternativeName, EntrySearchDocument, EntryVersion, Translation
+)
+from app.services.entry_annotator import entry_annotator
+from app.schemas.entries import (
+    BulkEntryUpdates, CountMode, EntryCreate, EntryUpdate, EntryWithTranslationsAndVotes, FuzzyMode,
+    PaginatedEntries, SearchMode, entry_fields_model
+)
+from typing import Optional, List, Dict, Any, Callable, FrozenSet, Iterable, NamedTuple, Set, Tuple
 from datetime import datetime, timedelta
+import base64
+import binascii
+import hashlib
+import json
 import uuid
 
 
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded or does not match the query."""
+
+
+allowed_sort_columns = {
+    "primary_name": Entry.primary_name,
+    "original_script": Entry.original_script,
+    "language_code": Entry.language_code,
+    "entry_type": Entry.entry_type,
+    "is_verified": Entry.is_verified,
+    "created_at": Entry.created_at,
+    "updated_at": Entry.updated_at,
+    # Pinyin of the first translation, compared byte-wise so syllables sort
+    # before longer ones ("a ka" < "ai")
+    "pinyin": EntrySearchDocument.preferred_pinyin.collate("C")
+}
+
+# Sort columns that may hold NULLs and therefore need explicit NULL handling
+# in keyset predicates (Postgres sorts NULLs last for ASC, first for DESC).
+nullable_sort_columns = {"original_script", "entry_type", "pinyin"}
+
+# Sort columns that live on entry_search_documents, which is joined for them
+search_document_sort_columns = {"pinyin"}
+
+
+def _encode_cursor(order_signature: str, values: List[Any]) -> str:
+    payload = json.dumps({"o": order_signature, "k": values}, default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, order_signature: str) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload["k"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursorError("Malformed cursor")
+
+    if payload.get("o") != order_signature or not isinstance(values, list):
+        raise InvalidCursorError("Cursor does not match the requested ordering")
+    return values
+
+
+def _cursor_value(expr, raw: Any) -> Any:
+    """Convert a JSON cursor value back to the Python type of its sort key."""
+    if raw is None:
+        return None
+    if expr is Entry.id:
+        return uuid.UUID(raw)
+    if isinstance(expr.type, DateTime):
+        return datetime.fromisoformat(raw)
+    if isinstance(expr.type, REAL):
+        # Compare as real, not float8, so ties on the score stay exact
+        return cast(raw, REAL)
+    return raw
+
+
+def _keyset_filter(order_keys: List[Tuple[Any, bool, bool]], values: List[Any]):
+    """
+    Build the "rows after the cursor" predicate for an ORDER BY whose last key
+    is Entry.id, sorted in the same direction as the key before it.
+
+    Non-nullable keys use a row comparison so Postgres can turn it into an
+    index condition on the matching composite (column, id) index.
+    """
+    if len(values) != len(order_keys):
+        raise InvalidCursorError("Cursor does not match the requested ordering")
+
+    try:
+        values = [_cursor_value(expr, raw) for (expr, _, _), raw in zip(order_keys, values)]
+    except (ValueError, TypeError, AttributeError):
+        raise InvalidCursorError("Malformed cursor")
+
+    if len(order_keys) == 1:
+        expr, descending, _ = order_keys[0]
+        return expr < values[0] if descending else expr > values[0]
+
+    (expr, descending, nullable), (id_expr, _, _) = order_keys
+    value, last_id = values
+
+    if value is None:
+        # ASC: only the remaining NULL rows; DESC: remaining NULL rows, then every non-NULL row
+        if descending:
+            return or_(and_(expr.is_(None), id_expr < last_id), expr.isnot(None))
+        return and_(expr.is_(None), id_expr > last_id)
+
+    if descending:
+        return tuple_(expr, id_expr) < tuple_(value, last_id)
+
+    after = tuple_(expr, id_expr) > tuple_(value, last_id)
+    return or_(after, expr.is_(None)) if nullable else after
+
+
+# ts_rank_cd weights for the {D, C, B, A} labels of entry_search_documents.document
+SEARCH_RANK_WEIGHTS = literal_column("'{0.1, 0.2, 0.4, 1.0}'::real[]")
+
+
+def _search_rank(tsquery, search_mode: SearchMode = SearchMode.ENGLISH):
+    """
+    Relevance of an entry for a full-text query. The search document already
+    carries the entry's own A/B/C labels plus its translated names (B) and
+    notes (D), so a translation hit is merged into the same ts_rank_cd.
+
+    In the normalized search mode only the entry's names are matched, by
+    their accent-folded and transliterated key; in the chinese mode the Han
+    bigrams of translated names (A) and notes (D).
+    """
+    if search_mode == SearchMode.NORMALIZED:
+        return func.ts_rank_cd(EntrySearchDocument.names_document, tsquery, type_=REAL)
+    if search_mode == SearchMode.CHINESE:
+        return func.ts_rank_cd(SEARCH_RANK_WEIGHTS, EntrySearchDocument.han_document, tsquery, type_=REAL)
+    return func.ts_rank_cd(SEARCH_RANK_WEIGHTS, EntrySearchDocument.document, tsquery, type_=REAL)
+
+
+# Alias of the per-entry fuzzy match subquery joined by _filter_entries
+FUZZY_MATCH = "fuzzy_match"
+
+
+def _fuzzy_matches(fuzzy_search: str, fuzzy_mode: Optional[FuzzyMode]):
+    """
+    Best trigram similarity per entry over primary_name, every alternative
+    name and every translated name. Each source is a separate scan of its
+    own trigram index (% or, in the word mode, <%); the matches are merged
+    by entry keeping the highest score.
+    """
+    word = fuzzy_mode == FuzzyMode.WORD
+    query = literal(fuzzy_search, String)
+
+    def candidates(entry_id, name):
+        if word:
+            return select(
+                entry_id.label("entry_id"), func.word_similarity(query, name, type_=REAL).label("score")
+            ).where(query.op('<%')(name))
+        return select(
+            entry_id.label("entry_id"), func.similarity(name, query, type_=REAL).label("score")
+        ).where(name.op('%')(query))
+
+    matches = union_all(
+        candidates(Entry.id, Entry.primary_name),
+        candidates(EntryAlternativeName.entry_id, EntryAlternativeName.name),
+        candidates(Translation.entry_id, Translation.translated_name),
+    ).subquery()
+    return select(
+        matches.c.entry_id, func.max(matches.c.score).label("score")
+    ).group_by(matches.c.entry_id).subquery(FUZZY_MATCH)
+
+
+def _fuzzy_score(fuzzy_search: str, search_mode: SearchMode = SearchMode.ENGLISH):
+    if search_mode == SearchMode.NORMALIZED:
+        return func.word_similarity(func.name_search_key(fuzzy_search), EntrySearchDocument.names_key, type_=REAL)
+    # Score of the subquery joined by _filter_entries
+    return literal_column(f"{FUZZY_MATCH}.score", REAL)
+
+
+def _fuzzy_distance(fuzzy_search: str):
+    """
+    Trigram distance (1 - similarity) of primary_name in the knn fuzzy mode.
+    Ordering by it ascending is a KNN scan of the GiST trigram index.
+    """
+    return Entry.primary_name.op('<->', return_type=REAL)(fuzzy_search)
+
+
+def _set_fuzzy_threshold(db: Session, fuzzy_threshold: Optional[float]) -> None:
+    """
+    Set the pg_trgm thresholds behind % and <% for the rest of the
+    transaction; the operators, unlike a comparison on similarity(), can
+    use the trigram indexes.
+    """
+    if fuzzy_threshold is not None:
+        db.execute(select(
+            func.set_config('pg_trgm.similarity_threshold', str(fuzzy_threshold), True),
+            func.set_config('pg_trgm.word_similarity_threshold', str(fuzzy_threshold), True),
+        ))
+
+
+def _search_document(search_mode: Optional[SearchMode] = SearchMode.ENGLISH):
+    if search_mode == SearchMode.NORMALIZED:
+        return EntrySearchDocument.names_document
+    if search_mode == SearchMode.CHINESE:
+        return EntrySearchDocument.han_document
+    return EntrySearchDocument.document
+
+
+def _search_query(search: str, search_mode: SearchMode = SearchMode.ENGLISH):
+    if search_mode == SearchMode.NORMALIZED:
+        return func.plainto_tsquery('simple', func.name_search_key(search))
+    if search_mode == SearchMode.CHINESE:
+        # NULL (matching nothing) when the search text has no Han characters
+        return func.han_tsquery(search)
+    return func.plainto_tsquery('english', search)
+
+
+def _pinyin_filter(search: str):
+    """Entries with a translation whose pinyin initials or full reading start with `search`."""
+    key = pinyin_query(search)
+    if not key:
+        return false()
+    pattern = f"{key}%"
+    # Literal arguments, so the expression matches idx_translations_pinyin_compact
+    # (bound parameters would not)
+    compact = func.replace(Translation.pinyin_full, literal_column("' '"), literal_column("''"))
+    return select(Translation.id).where(
+        Translation.entry_id == Entry.id,
+        or_(
+            Translation.pinyin_initials.like(pattern),
+            compact.like(pattern),
+        ),
+    ).exists()
+
+
+def _relevance_order(
+    search: Optional[str],
+    fuzzy_search: Optional[str],
+    search_mode: SearchMode = SearchMode.ENGLISH,
+    fuzzy_mode: FuzzyMode = FuzzyMode.SIMILARITY
+) -> Optional[Tuple[Any, List[Tuple[Any, bool, bool]], str]]:
+    """
+    (score, ordering keys, cursor signature) of a search or fuzzy search, or
+    None without either. Ordering keys are (expression, descending,
+    nullable), the last one always Entry.id; the score is None when the rows
+    are not ordered by one (knn and pinyin).
+    """
+    if fuzzy_search and search_mode != SearchMode.NORMALIZED and fuzzy_mode == FuzzyMode.KNN:
+        # Nearest names first, read in order from the GiST trigram index until
+        # LIMIT; the score is derived from the distance
+        return None, [(_fuzzy_distance(fuzzy_search), False, False), (Entry.id, False, False)], "distance"
+    if fuzzy_search:
+        score = _fuzzy_score(fuzzy_search, search_mode)
+        return score, [(score, True, False), (Entry.id, True, False)], f"similarity:{search_mode.value}:{fuzzy_mode.value}"
+    if search and search_mode == SearchMode.PINYIN:
+        # Prefix matches are all alike; list them by reading
+        return None, [(allowed_sort_columns["pinyin"], False, True), (Entry.id, False, False)], f"rank:{search_mode.value}"
+    if search:
+        # Best matches first; with LIMIT Postgres keeps a bounded top-N heap
+        # instead of sorting every match
+        score = _search_rank(_search_query(search, search_mode), search_mode)
+        return score, [(score, True, False), (Entry.id, True, False)], f"rank:{search_mode.value}"
+    return None
+
+
+def _filter_entries(
+    query,
+    search: Optional[str] = None,
+    fuzzy_search: Optional[str] = None,
+    language_code: Optional[str] = None,
+    other_language_code: Optional[str] = None,
+    entry_type: Optional[str] = None,
+    search_mode: Optional[SearchMode] = None,
+    fuzzy_mode: Optional[FuzzyMode] = None
+):
+    """
+    Apply the get_entries filters to a query over entries. Fuzzy matches use
+    the session's pg_trgm thresholds, see _set_fuzzy_threshold.
+    """
+    normalized = search_mode == SearchMode.NORMALIZED
+    if search or (fuzzy_search and normalized):
+        query = query.join(EntrySearchDocument, EntrySearchDocument.entry_id == Entry.id)
+
+    if search and search_mode == SearchMode.PINYIN:
+        # Prefix lookups on the translations' pinyin indexes ("akl", "akaliu")
+        query = query.filter(_pinyin_filter(search))
+    elif search:
+        # One GIN lookup on the denormalized per-entry document (entry + translations),
+        # or on the names-only / Han bigram document in the other modes
+        tsquery = _search_query(search, search_mode)
+        query = query.filter(_search_document(search_mode).op('@@')(tsquery))
+
+    if fuzzy_search and normalized:
+        # <% (word similarity above pg_trgm.word_similarity_threshold) can use the trigram index
+        query = query.filter(func.name_search_key(fuzzy_search).op('<%')(EntrySearchDocument.names_key))
+    elif fuzzy_search and fuzzy_mode == FuzzyMode.KNN:
+        query = query.filter(Entry.primary_name.op('%')(fuzzy_search))
+    elif fuzzy_search:
+        matches = _fuzzy_matches(fuzzy_search, fuzzy_mode)
+        query = query.join(matches, matches.c.entry_id == Entry.id)
+
+    if language_code:
+        query = query.filter(Entry.language_code == language_code)
+
+    if other_language_code:
+        query = query.filter(
+            text("other_language_codes @> CAST(ARRAY[:other_language_code] AS varchar[])").bindparams(
+                other_language_code=other_language_code
+            )
+        )
+
+    if entry_type:
+        query = query.filter(Entry.entry_type == entry_type)
+
+    return query
+
+
+def _filter_key(
+    search: Optional[str],
+    fuzzy_search: Optional[str],
+    language_code: Optional[str],
+    other_language_code: Optional[str],
+    entry_type: Optional[str],
+    search_mode: Optional[SearchMode] = None,
+    fuzzy_mode: Optional[FuzzyMode] = None,
+    fuzzy_threshold: Optional[float] = None
+) -> tuple:
+    """
+    Normalized filter set, used as cache key: the _filter_entries arguments
+    followed by the fuzzy threshold.
+    """
+    if search_mode == SearchMode.NORMALIZED and (search or fuzzy_search):
+        mode = SearchMode.NORMALIZED
+    elif search_mode in (SearchMode.CHINESE, SearchMode.PINYIN) and search:
+        mode = search_mode
+    else:
+        mode = None
+    return (
+        search.strip().lower() if search else None,
+        fuzzy_search.strip().lower() if fuzzy_search else None,
+        language_code or None,
+        other_language_code or None,
+        entry_type or None,
+        mode,
+        fuzzy_mode if fuzzy_search and mode is None and fuzzy_mode != FuzzyMode.SIMILARITY else None,
+        fuzzy_threshold if fuzzy_search else None,
+    )
+
+
+# Exact list totals and facet counts keyed by normalized filter set, dropped
+# on any entry/translation write
+_count_cache = TTLCache(maxsize=settings.count_cache_size, ttl=settings.count_cache_ttl_seconds)
+_facet_cache = TTLCache(maxsize=settings.count_cache_size, ttl=settings.count_cache_ttl_seconds)
+
+
+@on_commit_of(Entry, Translation)
+def _invalidate_count_cache(session: Session) -> None:
+    _count_cache.clear()
+    _facet_cache.clear()
+
+
+def _estimate_count(db: Session, query, filtered: bool) -> Optional[int]:
+    """
+    Cheap row count estimate: pg_class.reltuples for the unfiltered table,
+    otherwise the planner's row estimate for the filtered query.
+    Returns None when no statistics are available yet.
+    """
+    if not filtered:
+        reltuples = db.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = 'entries'::regclass")
+        ).scalar()
+        # reltuples is -1 until the table has been vacuumed or analyzed
+        return int(reltuples) if reltuples is not None and reltuples >= 0 else None
+
+    compiled = query.statement.compile(dialect=db.get_bind().dialect)
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    plan = db.connection().exec_driver_sql(
+        "EXPLAIN (FORMAT JSON) " + str(compiled), params
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _count_entries(db: Session, query, count: CountMode, filter_key: tuple) -> Optional[int]:
+    if count == CountMode.NONE:
+        return None
+
+    filtered = any(value is not None for value in filter_key)
+    if count == CountMode.ESTIMATE:
+        estimate = _estimate_count(db, query, filtered)
+        if estimate is not None:
+            return estimate
+
+    total = _count_cache.get(filter_key)
+    if total is None:
+        total = query.order_by(None).count()
+        _count_cache.set(filter_key, total)
+    return total
+
+
+def _entry_columns(fields: Optional[Iterable[str]]):
+    """
+    load_only() option for the Entry columns named in a sparse fieldset; the
+    other columns (notably the large text ones) are deferred. Names that are
+    not columns (score, translations) are ignored.
+    """
+    columns = Entry.__mapper__.column_attrs
+    return load_only(Entry.id, *[getattr(Entry, name) for name in fields if name in columns])
+
+
 def get_entry(db: Session, entry_id: str) -> Optional[Entry]:
     return db.query(Entry).filter(Entry.id == entry_id).first()
 
 
-def get_entry_with_translations(db: Session, entry_id: str) -> Optional[Entry]:
+def get_entry_with_translations(
+    db: Session, entry_id: str, fields: Optional[Iterable[str]] = None
+) -> Optional[Entry]:
+    query = db.query(Entry).filter(Entry.id == entry_id)
+    if fields is not None:
+        query = query.options(_entry_columns(fields))
     # Fetch entry and explicitly order translations
-    entry = db.query(Entry).filter(Entry.id == entry_id).first()
+    entry = query.first()
     if entry:
-        # Manually load and order translations to ensure proper sorting
-        ordered_translations = db.query(Translation).filter(
-            Translation.entry_id == entry_id
-        ).order_by(
-            desc(Translation.is_preferred),
-            asc(Translation.created_at)
-        ).all()
-
-        # Replace the lazy-loaded translations with our ordered list
-        entry.translations = ordered_translations
+        _load_translations(db, [entry])
 
     return entry
 
 
+class EntryDetail(NamedTuple):
+    """Anonymous GET /entries/{entry_id} body, as built for one entry version."""
+    version: int
+    counters: Tuple[Tuple[str, int, int, Optional[datetime]], ...]
+    etag: str
+    body: Dict[str, Any]
+    content: bytes
+
+
+# Entry detail bodies by (entry id, field set); each is checked against the
+# entry's entry_versions counter on read, so a committed write is never
+# served stale
+_detail_cache = TTLCache(maxsize=settings.entry_detail_cache_size, ttl=settings.entry_detail_cache_ttl_seconds)
+
+_datetime_adapter = TypeAdapter(datetime)
+
+
+def _entry_state(db: Session, entry_id: str) -> Optional[Tuple[int, Tuple[Tuple[str, int, int, Optional[datetime]], ...]]]:
+    """
+    The entry's entry_versions counter and the (id, upvotes, downvotes,
+    updated_at) of its translations, or None if the entry does not exist.
+    Triggers bump the counter with every write to the entry or its
+    translations except vote counter updates, which is why those columns are
+    read here on every request.
+    """
+    rows = db.query(
+        EntryVersion.version, Translation.id, Translation.upvotes,
+        Translation.downvotes, Translation.updated_at
+    ).outerjoin(
+        Translation, Translation.entry_id == EntryVersion.entry_id
+    ).filter(EntryVersion.entry_id == entry_id).all()
+    if not rows:
+        return None
+    counters = tuple(sorted(
+        (str(translation_id), upvotes, downvotes, updated_at)
+        for _, translation_id, upvotes, downvotes, updated_at in rows
+        if translation_id is not None
+    ))
+    return rows[0].version, counters
+
+
+def _render_entry_detail(
+    version: int, counters: Tuple[Tuple[str, int, int, Optional[datetime]], ...], body: Dict[str, Any]
+) -> EntryDetail:
+    """Overlay `counters` on the translations of `body` and encode it."""
+    if "translations" in body:
+        by_id = {translation_id: rest for translation_id, *rest in counters}
+        translations = []
+        for translation in body["translations"]:
+            current = by_id.get(translation.get("id"))
+            if current is not None:
+                upvotes, downvotes, updated_at = current
+                translation = dict(translation)
+                for name, value in (
+                    ("upvotes", upvotes),
+                    ("downvotes", downvotes),
+                    ("updated_at", _datetime_adapter.dump_python(updated_at, mode="json")),
+                ):
+                    if name in translation:
+                        translation[name] = value
+            translations.append(translation)
+        body = {**body, "translations": translations}
+    content = json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return EntryDetail(
+        version=version,
+        counters=counters,
+        etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+        body=body,
+        content=content,
+    )
+
+
+def get_entry_detail(
+    db: Session, entry_id: str, fields: Optional[FrozenSet[str]] = None
+) -> Optional[EntryDetail]:
+    """
+    The anonymous detail body of an entry (EntryWithTranslationsAndVotes with
+    every user_vote null, or only `fields`) as JSON-ready dict and encoded bytes, with a strong ETag.
+
+    A cache hit costs one small query for the version and the vote counters;
+    the entry and translations are only loaded and validated when the version
+    changed, and the body is only re-encoded when a counter changed.
+    """
+    state = _entry_state(db, entry_id)
+    if state is None:
+        return None
+    version, counters = state
+    key = (str(entry_id), fields)
+    detail = _detail_cache.get(key)
+    if detail is not None and detail.version == version:
+        if detail.counters != counters:
+            detail = _render_entry_detail(version, counters, detail.body)
+            _detail_cache.set(key, detail)
+        return detail
+
+    # Loaded after the version was read, so the body is never older than it
+    entry = get_entry_with_translations(db, entry_id=entry_id, fields=fields)
+    if entry is None:
+        return None
+    # With the votes schema the anonymous body carries user_vote: null, as
+    # the endpoint's response model declares
+    schema = EntryWithTranslationsAndVotes if fields is None else entry_fields_model(EntryWithTranslationsAndVotes, fields)
+    detail = _render_entry_detail(version, counters, schema.model_validate(entry).model_dump(mode="json"))
+    _detail_cache.set(key, detail)
+    return detail
+
+
+def _load_translations(db: Session, entries: List[Entry], per_entry: Optional[int] = None) -> None:
+    """
+    Load the translations of `entries` in one query, already in display order
+    (preferred first, then oldest), and set them as each entry's translations.
+    With `per_entry` only the first N per entry are loaded, through a LATERAL
+    subquery that reads each entry's top N from the
+    (entry_id, is_preferred DESC, created_at) index.
+    """
+    if not entries:
+        return
+    entry_ids = [entry.id for entry in entries]
+    display_order = (desc(Translation.is_preferred), asc(Translation.created_at), asc(Translation.id))
+
+    if per_entry is None:
+        translations = db.query(Translation).filter(
+            Translation.entry_id.in_(entry_ids)
+        ).order_by(*display_order).all()
+    else:
+        page = select(Entry.id).where(Entry.id.in_(entry_ids)).subquery()
+        top = (
+            select(Translation)
+            .where(Translation.entry_id == page.c.id)
+            .order_by(*display_order)
+            .limit(per_entry)
+            .lateral()
+        )
+        top_translation = aliased(Translation, top)
+        translations = db.query(top_translation).select_from(page).join(top, true()).order_by(
+            desc(top.c.is_preferred), asc(top.c.created_at), asc(top.c.id)
+        ).all()
+
+    by_entry: Dict[uuid.UUID, List[Translation]] = {entry_id: [] for entry_id in entry_ids}
+    for translation in translations:
+        by_entry[translation.entry_id].append(translation)
+    for entry in entries:
+        # Set without marking the relationship as modified
+        set_committed_value(entry, "translations", by_entry[entry.id])
+
+
 def get_entries(
     db: Session,
     skip: int = 0,
@@ -40,86 +590,287 @@ def get_entries(
     other_language_code: Optional[str] = None,
     sorted_by: Optional[str] = None,
     sort_direction: Optional[str] = "asc",
-    include_translations: bool = False
+    include_translations: bool = False,
+    cursor: Optional[str] = None,
+    count: CountMode = CountMode.EXACT,
+    translations_limit: Optional[int] = None,
+    fields: Optional[Iterable[str]] = None,
+    search_mode: SearchMode = SearchMode.ENGLISH,
+    fuzzy_mode: FuzzyMode = FuzzyMode.SIMILARITY,
+    fuzzy_threshold: Optional[float] = None
 ) -> PaginatedEntries:
-    query = db.query(Entry)
+    """
+    List entries with offset or keyset pagination.
 
-    # Always include translations when searching to search translation content
-    if search or include_translations:
-        query = query.options(joinedload(Entry.translations))
+    Every ordering ends with Entry.id as a unique tie-breaker, so the last row
+    of a page always identifies a position. That position is returned as an
+    opaque ``next_cursor``; passing it back as ``cursor`` continues from there
+    with a keyset predicate instead of OFFSET, and ``skip`` is ignored.
 
-    if search:
-        # Create a comprehensive search using EXISTS subqueries to avoid JOIN issues
-        translation_search_subquery = db.query(Translation.entry_id).filter(
-            Translation.entry_id == Entry.id,
-            text("translations.search_vector @@ plainto_tsquery('english', :search_term)").params(search_term=search)
-        ).exists()
-        
-        query = query.filter(
-            or_(
-                # Search in entry fields
-                text("entries.search_vector @@ plainto_tsquery('english', :search_term)").params(search_term=search),
-                # Search in translation fields using EXISTS
-                translation_search_subquery
-            )
-        )
+    ``count`` selects how ``total`` is computed: ``exact`` (cached per filter
+    set until the next entry/translation write), ``estimate`` (planner or
+    pg_class statistics) or ``none`` (no total, only ``has_more``).
 
-    if fuzzy_search:
-        sim_score = func.similarity(Entry.primary_name, fuzzy_search)
-        query = query.filter(sim_score > 0.3).order_by(sim_score.desc())
+    The page is selected as ids only (plus score or sort key), which the
+    pagination indexes can answer without touching other columns, and joined
+    back to entries by id. With ``include_translations`` the page's
+    translations (all, or the first ``translations_limit`` per entry) are
+    loaded by a second, already ordered query.
 
-    if language_code:
-        query = query.filter(Entry.language_code == language_code)
+    With ``fields`` only those entry columns (and id) are loaded; the rest are
+    deferred and must not be read from the returned entries.
 
-    if other_language_code:
-        query = query.filter(
-            text("other_language_codes @> ARRAY[:other_language_code]")
-        ).params(other_language_code=other_language_code)
-
-    allowed_sort_columns = {
-        "primary_name": Entry.primary_name,
-        "original_script": Entry.original_script,
-        "language_code": Entry.language_code,
-        "entry_type": Entry.entry_type,
-        "is_verified": Entry.is_verified,
-        "created_at": Entry.created_at,
-        "updated_at": Entry.updated_at
-    }
+    ``search_mode`` ``normalized`` matches ``search`` and ``fuzzy_search``
+    against the entry's names only, ignoring case, accents, breathings and
+    Greek vs Latin script (see name_search_key() in the database).
+    ``chinese`` matches ``search`` as a substring of the Han text of
+    translated names and notes, via character bigrams (see han_tsquery()).
+    ``pinyin`` matches toneless pinyin typed as initials ("akl") or in full
+    ("akaliu") against translations, listed in pinyin order.
 
-    # Apply manual sorting only if not using fuzzy search and not using search ranking
-    if not fuzzy_search and not search and sorted_by in allowed_sort_columns:
-        sort_column = allowed_sort_columns[sorted_by]
-        if sort_direction and sort_direction.lower() == "desc":
-            query = query.order_by(desc(sort_column))
-        else:
-            query = query.order_by(asc(sort_column))
+    ``fuzzy_mode`` ``similarity`` returns the entries whose primary_name,
+    an alternative name or a translated name is at least ``fuzzy_threshold``
+    (default 0.3) similar to ``fuzzy_search``, by best similarity. ``word``
+    does the same with word similarity, which matches runs of words within
+    longer names (default threshold 0.6). ``knn`` only looks at
+    primary_name, nearest first by trigram distance, which the GiST index
+    reads in order, so only about one page of names is ever scored. The
+    normalized search mode always uses word similarity on its name key.
+    """
+    _set_fuzzy_threshold(db, fuzzy_threshold if fuzzy_search else None)
+    query = _filter_entries(
+        db.query(Entry.id), search=search, fuzzy_search=fuzzy_search, language_code=language_code,
+        other_language_code=other_language_code, entry_type=entry_type, search_mode=search_mode,
+        fuzzy_mode=fuzzy_mode
+    )
 
-    if entry_type:
-        query = query.filter(Entry.entry_type == entry_type)
+    knn = bool(fuzzy_search) and search_mode != SearchMode.NORMALIZED and fuzzy_mode == FuzzyMode.KNN
+    score = None
+    # Ordering keys as (expression, descending, nullable); the last one is always Entry.id
+    descending = bool(sort_direction and sort_direction.lower() == "desc")
+    relevance = _relevance_order(search, fuzzy_search, search_mode, fuzzy_mode)
+    if relevance is not None:
+        score, order_keys, order_signature = relevance
+    elif sorted_by in allowed_sort_columns:
+        # Manual sorting is skipped when searching, as search results are relevance-driven
+        if sorted_by in search_document_sort_columns:
+            query = query.join(EntrySearchDocument, EntrySearchDocument.entry_id == Entry.id)
+        order_keys = [
+            (allowed_sort_columns[sorted_by], descending, sorted_by in nullable_sort_columns),
+            (Entry.id, descending, False),
+        ]
+        order_signature = f"{sorted_by}:{'desc' if descending else 'asc'}"
+    else:
+        order_keys = [(Entry.id, False, False)]
+        order_signature = "id"
 
-    total = query.count()
+    filter_key = _filter_key(
+        search, fuzzy_search, language_code, other_language_code, entry_type, search_mode,
+        fuzzy_mode, fuzzy_threshold
+    )
+    # Count on the bare filtered query, before ordering is added
+    total = _count_entries(db, query, count, filter_key)
+
+    if cursor:
+        query = query.filter(_keyset_filter(order_keys, _decode_cursor(cursor, order_signature)))
+        skip = 0
+
+    query = query.order_by(*[desc(expr) if is_desc else asc(expr) for expr, is_desc, _ in order_keys])
+    if score is not None:
+        # Select the score too, it is returned per item and the cursor needs the last one
+        query = query.add_columns(score.label("sort_key"))
+    elif len(order_keys) == 2:
+        # The cursor needs the sort key of the last row
+        query = query.add_columns(order_keys[0][0].label("sort_key"))
+
+    # The page of ids (one extra row to know whether another page exists) is
+    # selected on its own, so OFFSET skips index entries only; full entry rows
+    # are then joined in by primary key for just that page
+    page = query.offset(skip).limit(limit + 1).subquery()
+    page_order = [page.c.sort_key, page.c.id] if len(order_keys) == 2 else [page.c.id]
+    page_query = db.query(Entry, *page_order[:-1]).join(page, Entry.id == page.c.id).order_by(
+        *[desc(column) if is_desc else asc(column) for column, (_, is_desc, _) in zip(page_order, order_keys)]
+    )
+    if fields is not None:
+        page_query = page_query.options(_entry_columns(fields))
 
-    entries = query.offset(skip).limit(limit).all()
+    rows = page_query.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if len(order_keys) == 2:
+        entries = [entry for entry, _ in rows]
+        last_key = [rows[-1][1]] if rows else []
+        if score is not None:
+            for entry, entry_score in rows:
+                entry.score = entry_score
+        elif knn:
+            for entry, distance in rows:
+                entry.score = 1 - distance
+    else:
+        entries = rows
+        last_key = []
+
+    next_cursor = None
+    if has_more and entries:
+        next_cursor = _encode_cursor(order_signature, last_key + [str(entries[-1].id)])
 
     if include_translations:
-        for entry in entries:
-            if hasattr(entry, "translations") and entry.translations:
-                # Ensure ordering: preferred first, then oldest
-                entry.translations = sorted(
-                    entry.translations,
-                    key=lambda t: (-t.is_preferred, t.created_at)
-                )
+        _load_translations(db, entries, per_entry=translations_limit)
+
+    pages = None
+    if total is not None:
+        pages = (total + limit - 1) // limit if limit > 0 else 1
 
     return {
         "total": total,
         "skip": skip,
         "limit": limit,
         "page": (skip // limit) + 1 if limit > 0 else 1,
-        "pages": (total + limit - 1) // limit if limit > 0 else 1,
-        "items": entries
+        "pages": pages,
+        "items": entries,
+        "has_more": has_more,
+        "next_cursor": next_cursor
     }
 
 
+ENTRY_FACETS = ("language_code", "entry_type", "is_verified", "other_language_codes")
+
+
+def get_entry_facets(
+    db: Session,
+    search: Optional[str] = None,
+    fuzzy_search: Optional[str] = None,
+    language_code: Optional[str] = None,
+    other_language_code: Optional[str] = None,
+    entry_type: Optional[str] = None,
+    search_mode: SearchMode = SearchMode.ENGLISH,
+    fuzzy_mode: FuzzyMode = FuzzyMode.SIMILARITY,
+    fuzzy_threshold: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Entry counts per language_code, entry_type, is_verified and per element of
+    other_language_codes, for the entries matching the get_entries filters.
+
+    All facets come from one GROUPING SETS query. Entries are joined to the
+    unnested other_language_codes, so the entry-level facets only count the
+    first element row of each entry (or its only row when it has none).
+    Results are cached per filter set until the next entry/translation write.
+    """
+    filter_key = _filter_key(
+        search, fuzzy_search, language_code, other_language_code, entry_type, search_mode,
+        fuzzy_mode, fuzzy_threshold
+    )
+    return cached_value(_facet_cache, filter_key, lambda: _compute_entry_facets(db, filter_key))
+
+
+def _compute_entry_facets(db: Session, filter_key: tuple) -> Dict[str, Any]:
+    *filters, fuzzy_threshold = filter_key
+    _set_fuzzy_threshold(db, fuzzy_threshold)
+    filtered = _filter_entries(
+        db.query(Entry.language_code, Entry.entry_type, Entry.is_verified, Entry.other_language_codes),
+        *filters
+    ).subquery()
+    other = func.unnest(filtered.c.other_language_codes).table_valued(
+        "code", with_ordinality="position"
+    ).render_derived().lateral()
+    first_row = func.coalesce(other.c.position, 1) == 1
+
+    groups = (filtered.c.language_code, filtered.c.entry_type, filtered.c.is_verified, other.c.code)
+    rows = db.execute(
+        select(
+            *groups,
+            func.grouping(*groups).label("grouping"),
+            func.count().filter(first_row).label("entries"),
+            func.count(other.c.code).label("mentions"),
+        )
+        .select_from(filtered.outerjoin(other, true()))
+        .group_by(func.grouping_sets(*[tuple_(column) for column in groups], tuple_()))
+    ).all()
+
+    return _facet_buckets(rows)
+
+
+def _facet_buckets(rows: Iterable[Any]) -> Dict[str, Any]:
+    """
+    Turn the GROUPING SETS rows of _compute_entry_facets into the total and
+    the per-facet buckets, most frequent first. Each row holds the
+    ENTRY_FACETS columns in order, then grouping, entries and mentions.
+    """
+    # GROUPING() sets one bit per grouped-away column, the first column being the highest bit
+    facets: Dict[str, Any] = {"total": 0, **{name: {} for name in ENTRY_FACETS}}
+    for row in rows:
+        grouped_by = [i for i in range(len(ENTRY_FACETS)) if not row.grouping & (1 << (len(ENTRY_FACETS) - 1 - i))]
+        if not grouped_by:
+            facets["total"] = row.entries
+            continue
+        index = grouped_by[0]
+        name = ENTRY_FACETS[index]
+        if name == "other_language_codes":
+            if row[index] is not None:
+                facets[name][row[index]] = row.mentions
+        else:
+            facets[name][row[index]] = row.entries
+
+    return {
+        "total": facets["total"],
+        **{
+            name: [
+                {"value": value, "count": count}
+                for value, count in sorted(facets[name].items(), key=lambda item: (-item[1], str(item[0])))
+            ]
+            for name in ENTRY_FACETS
+        }
+    }
+
+
+def annotate_text(db: Session, text: str, spans: List[Tuple[int, int, Set[uuid.UUID]]]) -> List[Dict[str, Any]]:
+    """
+    Attach the matching entries and their first translation to the spans
+    EntryAnnotator.find() returned for `text`.
+    """
+    if not spans:
+        return []
+
+    entry_ids = set().union(*(entry_ids for _, _, entry_ids in spans))
+    entries = db.query(Entry).options(
+        load_only(Entry.id, Entry.primary_name, Entry.original_script, Entry.language_code, Entry.entry_type)
+    ).filter(Entry.id.in_(entry_ids)).order_by(Entry.primary_name, Entry.id).all()
+    _load_translations(db, entries, per_entry=1)
+    if len(entries) < len(entry_ids):
+        # Deleted since the index was refreshed
+        entry_annotator.wake()
+
+    # Span entries are listed in query order (by primary name)
+    position = {entry.id: index for index, entry in enumerate(entries)}
+    annotated = {
+        entry.id: {
+            "id": entry.id,
+            "primary_name": entry.primary_name,
+            "original_script": entry.original_script,
+            "language_code": entry.language_code,
+            "entry_type": entry.entry_type or None,
+            "preferred_translation": entry.translations[0].translated_name if entry.translations else None,
+        }
+        for entry in entries
+    }
+    result = []
+    for start, end, span_entry_ids in spans:
+        found = sorted((entry_id for entry_id in span_entry_ids if entry_id in annotated), key=position.get)
+        if found:
+            span_entries = [annotated[entry_id] for entry_id in found]
+            result.append({"start": start, "end": end, "text": text[start:end], "entries": span_entries})
+    return result
+
+
+async def aannotate_text(db: AsyncSession, text: str) -> List[Dict[str, Any]]:
+    """Find the names of entries in `text` (see EntryAnnotator) and annotate the spans."""
+    spans = await entry_annotator.afind(text)
+    if not spans:
+        return []
+    return await db.run_sync(annotate_text, text, spans)
+
+
 def create_entry(db: Session, entry: EntryCreate, user_id: str) -> Entry:
     db_entry = Entry(
         id=uuid.uuid4(),
@@ -187,6 +938,27 @@ def verify_entry(
     return db_entry
 
 
+def rebuild_search_documents(db: Session, after_id: Optional[uuid.UUID] = None, batch_size: int = 500) -> Optional[uuid.UUID]:
+    """
+    Rebuild entry_search_documents for the next `batch_size` entries ordered by
+    id after `after_id`, in its own transaction. Returns the last id processed,
+    or None when there is nothing left.
+    """
+    query = db.query(Entry.id)
+    if after_id is not None:
+        query = query.filter(Entry.id > after_id)
+    entry_ids = [row.id for row in query.order_by(Entry.id).limit(batch_size)]
+    if not entry_ids:
+        return None
+
+    db.execute(
+        text("SELECT refresh_entry_search_document(id) FROM unnest(CAST(:entry_ids AS uuid[])) AS id"),
+        {"entry_ids": [str(entry_id) for entry_id in entry_ids]}
+    )
+    db.commit()
+    return entry_ids[-1]
+
+
 def _get_translations_with_newest_comments(db: Session, limit: int = 20) -> List[Translation]:
     """
     Helper function to get translations with their newest comments efficiently.
@@ -222,41 +994,123 @@ def _get_translations_with_newest_comments(db: Session, limit: int = 20) -> List
     return translations_with_comments
 
 
+# Activity events read per round by _recently_active_entries
+ACTIVITY_SCAN_BATCH_SIZE = 200
+
+
+def _recently_active_entries(
+    db: Session, event_types: Tuple[str, ...], limit: int,
+    load: Callable[[Session, List[uuid.UUID]], Dict[uuid.UUID, Entry]]
+) -> List[Entry]:
+    """
+    Up to `limit` entries ordered by their newest activity event of
+    `event_types`, newest first. activity_events is read from the top of
+    idx_activity_events_created_at a batch at a time, so the cost follows
+    how far back the `limit` entries go rather than the size of the tables.
+
+    `load` loads the entries for a list of ids and may leave some out (e.g.
+    those without translations); further events are read until enough are found.
+    """
+    result: List[Entry] = []
+    pending: List[uuid.UUID] = []
+    seen = set()
+    after = None
+    exhausted = False
+    while len(result) < limit:
+        if not pending:
+            if exhausted:
+                break
+            query = db.query(ActivityEvent.entry_id, ActivityEvent.created_at, ActivityEvent.id).filter(
+                ActivityEvent.event_type.in_(event_types)
+            )
+            if after is not None:
+                query = query.filter(tuple_(ActivityEvent.created_at, ActivityEvent.id) < after)
+            events = query.order_by(
+                desc(ActivityEvent.created_at), desc(ActivityEvent.id)
+            ).limit(ACTIVITY_SCAN_BATCH_SIZE).all()
+            for entry_id, _, _ in events:
+                if entry_id not in seen:
+                    seen.add(entry_id)
+                    pending.append(entry_id)
+            exhausted = len(events) < ACTIVITY_SCAN_BATCH_SIZE
+            if events:
+                after = (events[-1].created_at, events[-1].id)
+            continue
+
+        # Only as many as are still missing, most entries qualify
+        batch, pending = pending[:limit - len(result)], pending[limit - len(result):]
+        loaded = load(db, batch)
+        result.extend(loaded[entry_id] for entry_id in batch if entry_id in loaded)
+    return result
+
+
+def _load_entries_with_newest_comment(db: Session, entry_ids: List[uuid.UUID]) -> Dict[uuid.UUID, Entry]:
+    """The given entries that have comments, with a dynamic 'newest_comment' attribute."""
+    newest_comments = db.query(Comment).options(
+        joinedload(Comment.user)
+    ).filter(
+        Comment.entry_id.in_(entry_ids)
+    ).distinct(Comment.entry_id).order_by(Comment.entry_id, desc(Comment.created_at), desc(Comment.id)).all()
+    entry_comment_map = {comment.entry_id: comment for comment in newest_comments}
+
+    entries = db.query(Entry).options(joinedload(Entry.translations)).filter(
+        Entry.id.in_(entry_comment_map.keys())
+    ).all()
+    for entry in entries:
+        entry.newest_comment = entry_comment_map[entry.id]
+    return {entry.id: entry for entry in entries}
+
+
 def _get_entries_with_newest_comments(db: Session, limit: int = 20) -> List[Entry]:
     """
     Helper function to get entries with their newest comments efficiently.
-    Returns Entry objects with a dynamic 'newest_comment' attribute.
+    Returns Entry objects with a dynamic 'newest_comment' attribute, ordered
+    by comment recency.
     """
-    # Get the most recent comments with their entry_ids
-    recent_comments_query = db.query(
-        Comment.entry_id,
-        func.max(Comment.created_at).label('max_created_at')
-    ).group_by(Comment.entry_id).subquery()
+    return _recently_active_entries(db, ('comment_created',), limit, _load_entries_with_newest_comment)
 
-    # Get actual comment objects for the most recent comments
-    newest_comments = db.query(Comment).join(
-        recent_comments_query,
-        (Comment.entry_id == recent_comments_query.c.entry_id) &
-        (Comment.created_at == recent_comments_query.c.max_created_at)
+
+def _count_all_entries(db: Session) -> int:
+    return db.query(Entry).count()
+
+
+def _count_recently_updated_entries(db: Session) -> int:
+    # Recently updated entries count (last 30 days)
+    thirty_days_ago = datetime.now() - timedelta(days=30)
+    return db.query(Entry).filter(
+        Entry.updated_at >= thirty_days_ago
+    ).count()
+
+
+def _load_entries_with_translations(db: Session, entry_ids: List[uuid.UUID]) -> Dict[uuid.UUID, Entry]:
+    """The given entries that have translations, with the translations loaded."""
+    entries = db.query(Entry).options(joinedload(Entry.translations)).filter(
+        Entry.id.in_(entry_ids), Entry.translations.any()
     ).all()
+    return {entry.id: entry for entry in entries}
 
-    # Create a mapping of entry_id -> newest_comment
-    entry_comment_map = {comment.entry_id: comment for comment in newest_comments}
 
-    # Get entries that have comments, ordered by comment recency
-    entries_with_comments = db.query(Entry).filter(
-        Entry.id.in_(entry_comment_map.keys())
-    ).options(
-        joinedload(Entry.translations)
-    ).order_by(
-        desc(Entry.updated_at)
-    ).limit(limit).all()
+def _get_newest_updated_entries(db: Session, limit: int = 20) -> List[Entry]:
+    return _recently_active_entries(
+        db, ('entry_created', 'entry_updated'), limit, _load_entries_with_translations
+    )
+
+
+def _get_entries_with_newest_translations(db: Session, limit: int = 20) -> List[Entry]:
+    # Entries that have translations, ordered by the newest translation write
+    return _recently_active_entries(
+        db, ('translation_created', 'translation_updated'), limit, _load_entries_with_translations
+    )
 
-    # Attach the newest comment to each entry
-    for entry in entries_with_comments:
-        entry.newest_comment = entry_comment_map.get(entry.id)
 
-    return entries_with_comments
+# Independent queries behind get_entries_metadata, by result key
+ENTRIES_METADATA_QUERIES = {
+    'total_entries': _count_all_entries,
+    'recently_updated_count': _count_recently_updated_entries,
+    'newest_updated_entries': _get_newest_updated_entries,
+    'entries_with_newest_translations': _get_entries_with_newest_translations,
+    'entries_with_newest_comments': _get_entries_with_newest_comments,
+}
 
 
 def get_entries_metadata(db: Session) -> Dict[str, Any]:
@@ -268,41 +1122,18 @@ def get_entries_metadata(db: Session) -> Dict[str, Any]:
     4. 20 entries with newest updated translations
     5. 20 entries with newest comments
     """
+    return {name: query(db) for name, query in ENTRIES_METADATA_QUERIES.items()}
 
-    # 1. Total number of entries
-    total_entries = db.query(Entry).count()
 
-    # 2. Recently updated entries count (last 30 days)
-    thirty_days_ago = datetime.now() - timedelta(days=30)
-    recently_updated_count = db.query(Entry).filter(
-        Entry.updated_at >= thirty_days_ago
-    ).count()
-
-    # 3. 20 newest updated entries
-    newest_updated_entries = db.query(Entry).join(Translation).options(
-        joinedload(Entry.translations)
-    ).order_by(
-        desc(Entry.updated_at)
-    ).limit(20).all()
-
-    # 4. 20 entries with newest updated translations
-    # Find entries that have translations, ordered by the newest translation update
-    entries_with_newest_translations = db.query(Entry).join(Translation).options(
-        joinedload(Entry.translations)
-    ).order_by(
-        desc(Translation.updated_at)
-    ).distinct().limit(20).all()
-
-    # 5. 20 entries with newest comments
-    entries_with_comments = _get_entries_with_newest_comments(db, limit=20)
+async def aget_entries_metadata() -> Dict[str, Any]:
+    """
+    get_entries_metadata with its queries run concurrently, each on its own
+    pooled connection (at most settings.aggregate_query_concurrency at once).
+    Returned entries are detached, with translations and newest comments loaded.
+    """
+    results = await run_concurrently(ENTRIES_METADATA_QUERIES.values())
+    return dict(zip(ENTRIES_METADATA_QUERIES, results))
 
-    return {
-        'total_entries': total_entries,
-        'recently_updated_count': recently_updated_count,
-        'newest_updated_entries': newest_updated_entries,
-        'entries_with_newest_translations': entries_with_newest_translations,
-        'entries_with_newest_comments': entries_with_comments
-    }
 
 def bulk_update_entries(db: Session, entry_ids: List[int], updates: BulkEntryUpdates, verify_user_id: Optional[str]) -> List[Entry]:
     query = db.query(Entry).filter(Entry.id.in_(entry_ids))
@@ -322,4 +1153,19 @@ def bulk_update_entries(db: Session, entry_ids: List[int], updates: BulkEntryUpd
             entry.is_verified = updates.is_verified
 
     db.commit()
+    for entry in entries_to_update:
+        db.refresh(entry)
     return entries_to_update
+
+
+# Async versions for AsyncSession callers
+aget_entry = to_async(get_entry)
+aget_entry_with_translations = to_async(get_entry_with_translations)
+aget_entry_detail = to_async(get_entry_detail)
+aget_entries = to_async(get_entries)
+aget_entry_facets = to_async(get_entry_facets)
+acreate_entry = to_async(create_entry)
+aupdate_entry = to_async(update_entry)
+adelete_entry = to_async(delete_entry)
+averify_entry = to_async(verify_entry)
+abulk_update_entries = to_async(bulk_update_entries)
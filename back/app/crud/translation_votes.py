@@ -1,8 +1,15 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, text
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from app.core.cache import mark_written
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, to_async
+from app.core.write_behind import WriteBehindFlusher
 from app.models.models import TranslationVote, Translation
 from app.schemas.translations import VoteCreate, VoteType, TranslationWithUserVote
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple, Union
 import uuid
 
 
@@ -16,125 +23,291 @@ def get_user_vote(db: Session, translation_id: str, user_id: str) -> Optional[Tr
     ).first()
 
 
+# Applies a vote in one statement: the existing vote (if any) is locked, then
+# either updated or inserted, and the resulting counter delta is computed in
+# the database. If another request by the same user inserts the vote
+# concurrently, the insert hits the conflict and returns no row; running the
+# statement again then sees and updates that vote.
+UPSERT_VOTE_CTES = """
+    WITH previous AS (
+        SELECT id, vote_type FROM translation_votes
+        WHERE translation_id = CAST(:translation_id AS uuid)
+          AND user_id = CAST(:user_id AS uuid)
+        FOR UPDATE
+    ),
+    updated AS (
+        UPDATE translation_votes v
+        SET vote_type = CAST(:vote_type AS varchar), updated_at = now()
+        FROM previous
+        WHERE v.id = previous.id
+        RETURNING v.*, previous.vote_type AS old_vote_type
+    ),
+    inserted AS (
+        INSERT INTO translation_votes (id, translation_id, user_id, vote_type)
+        SELECT CAST(:id AS uuid), CAST(:translation_id AS uuid),
+               CAST(:user_id AS uuid), CAST(:vote_type AS varchar)
+        WHERE NOT EXISTS (SELECT 1 FROM previous)
+        ON CONFLICT (translation_id, user_id) DO NOTHING
+        RETURNING *, NULL::varchar AS old_vote_type
+    ),
+    vote AS (
+        SELECT v.*,
+               (v.vote_type = 'up')::int
+                   - (v.old_vote_type IS NOT DISTINCT FROM 'up')::int AS upvotes_delta,
+               (v.vote_type = 'down')::int
+                   - (v.old_vote_type IS NOT DISTINCT FROM 'down')::int AS downvotes_delta
+        FROM (SELECT * FROM updated UNION ALL SELECT * FROM inserted) v
+    )
+"""
+
+DELETE_VOTE_CTES = """
+    WITH vote AS (
+        DELETE FROM translation_votes
+        WHERE translation_id = CAST(:translation_id AS uuid)
+          AND user_id = CAST(:user_id AS uuid)
+        RETURNING translation_id,
+                  -(vote_type = 'up')::int AS upvotes_delta,
+                  -(vote_type = 'down')::int AS downvotes_delta
+    )
+"""
+
+# Moves the translation counters by the vote's delta in the same statement
+APPLY_VOTE_DELTA = """,
+    counts AS (
+        UPDATE translations t
+        SET upvotes = GREATEST(0, t.upvotes + vote.upvotes_delta),
+            downvotes = GREATEST(0, t.downvotes + vote.downvotes_delta)
+        FROM vote
+        WHERE t.id = vote.translation_id
+        RETURNING t.upvotes, t.downvotes
+    )
+    SELECT {columns}counts.upvotes, counts.downvotes
+    FROM vote LEFT JOIN counts ON true
+"""
+
+# Write-behind: leaves the counters alone and returns the delta, which the
+# caller adds to vote_flusher, next to the stored counts
+DEFER_VOTE_DELTA = """
+    SELECT {columns}vote.upvotes_delta, vote.downvotes_delta, t.upvotes, t.downvotes
+    FROM vote JOIN translations t ON t.id = vote.translation_id
+"""
+
+VOTE_COLUMNS = "vote.id, vote.translation_id, vote.user_id, vote.vote_type, vote.created_at, vote.updated_at, "
+
+UPSERT_VOTE_SQL = text(UPSERT_VOTE_CTES + APPLY_VOTE_DELTA.format(columns=VOTE_COLUMNS))
+UPSERT_VOTE_DEFERRED_SQL = text(UPSERT_VOTE_CTES + DEFER_VOTE_DELTA.format(columns=VOTE_COLUMNS))
+DELETE_VOTE_SQL = text(DELETE_VOTE_CTES + APPLY_VOTE_DELTA.format(columns=""))
+DELETE_VOTE_DEFERRED_SQL = text(DELETE_VOTE_CTES + DEFER_VOTE_DELTA.format(columns=""))
+
+# Applies the summed deltas of many votes in one statement; rows are updated
+# in id order so concurrent flushes of different workers cannot deadlock
+APPLY_VOTE_DELTAS_SQL = """
+    UPDATE translations t
+    SET upvotes = GREATEST(0, t.upvotes + d.upvotes),
+        downvotes = GREATEST(0, t.downvotes + d.downvotes)
+    FROM (VALUES {values}) AS d(id, upvotes, downvotes)
+    WHERE t.id = d.id
+"""
+
+# Advisory lock held by flushes and reconciliation batches, which both
+# update counters
+VOTE_COUNTS_LOCK_KEY = 7_311_202
+
+
 def create_or_update_vote(
-    db: Session, 
-    translation_id: str, 
-    user_id: str, 
-    vote: VoteCreate
-) -> TranslationVote:
-    """Create a new vote or update an existing vote"""
-    # Check if user already voted on this translation
-    existing_vote = get_user_vote(db, translation_id, user_id)
-    
-    if existing_vote:
-        # Update existing vote
-        old_vote_type = existing_vote.vote_type
-        existing_vote.vote_type = vote.vote_type
-        db.commit()
-        db.refresh(existing_vote)
-        
-        # Update vote counts on translation
-        update_vote_counts_after_change(db, translation_id, old_vote_type, vote.vote_type)
-        
-        return existing_vote
-    else:
-        # Create new vote
-        db_vote = TranslationVote(
-            id=uuid.uuid4(),
-            translation_id=translation_id,
-            user_id=user_id,
-            vote_type=vote.vote_type
-        )
-        db.add(db_vote)
-        db.commit()
-        db.refresh(db_vote)
-        
-        # Update vote counts on translation
-        update_vote_counts_after_new(db, translation_id, vote.vote_type)
-        
-        return db_vote
-
-
-def delete_vote(db: Session, translation_id: str, user_id: str) -> bool:
-    """Delete a user's vote"""
-    existing_vote = get_user_vote(db, translation_id, user_id)
-    if not existing_vote:
-        return False
-    
-    vote_type = existing_vote.vote_type
-    db.delete(existing_vote)
+    db: Session,
+    translation_id: str,
+    user_id: str,
+    vote: VoteCreate,
+    deferred: bool = False
+) -> Optional[Union[Row, Dict[str, Any]]]:
+    """
+    Create a new vote or update an existing vote, adjusting the translation's
+    vote counts atomically. Returns the vote row (a dict when deferred) with
+    the new upvotes and downvotes, or None if the translation does not exist.
+
+    With `deferred` the counters are left to vote_flusher and the returned
+    counts are the stored ones plus this worker's pending deltas.
+    """
+    params = {
+        "id": str(uuid.uuid4()),
+        "translation_id": str(translation_id),
+        "user_id": str(user_id),
+        "vote_type": VoteType(vote.vote_type).value,
+    }
+    statement = UPSERT_VOTE_DEFERRED_SQL if deferred else UPSERT_VOTE_SQL
+    # A second attempt only happens when a concurrent insert of the same vote
+    # won the race, and then always finds the committed row
+    try:
+        for _ in range(2):
+            row = db.execute(statement, params).first()
+            if row is not None:
+                break
+    except IntegrityError:
+        # Foreign key violation: the translation does not exist
+        db.rollback()
+        return None
+    if row is None or row.upvotes is None:
+        db.rollback()
+        return None
+    mark_written(db, TranslationVote)
     db.commit()
-    
-    # Update vote counts on translation
-    update_vote_counts_after_delete(db, translation_id, vote_type)
-    
-    return True
+    if deferred:
+        upvotes, downvotes = _pending_counts(row, translation_id)
+        return {**row._asdict(), "upvotes": upvotes, "downvotes": downvotes}
+    return row
 
 
-def update_vote_counts_after_new(db: Session, translation_id: str, vote_type: str):
-    """Update vote counts after adding a new vote"""
-    translation = db.query(Translation).filter(Translation.id == translation_id).first()
-    if translation:
-        if vote_type == VoteType.UP:
-            translation.upvotes += 1
-        elif vote_type == VoteType.DOWN:
-            translation.downvotes += 1
-        db.commit()
+def delete_vote(
+    db: Session,
+    translation_id: str,
+    user_id: str,
+    deferred: bool = False
+) -> Optional[Tuple[int, int]]:
+    """
+    Delete a user's vote and adjust the translation's vote counts atomically.
+    Returns the new (upvotes, downvotes), or None if there was no vote.
 
+    With `deferred` the counters are left to vote_flusher and the returned
+    counts are the stored ones plus this worker's pending deltas.
+    """
+    row = db.execute(
+        DELETE_VOTE_DEFERRED_SQL if deferred else DELETE_VOTE_SQL,
+        {"translation_id": str(translation_id), "user_id": str(user_id)}
+    ).first()
+    if row is None:
+        db.rollback()
+        return None
+    mark_written(db, TranslationVote)
+    db.commit()
+    if deferred:
+        return _pending_counts(row, translation_id)
+    return row.upvotes, row.downvotes
 
-def update_vote_counts_after_change(db: Session, translation_id: str, old_vote_type: str, new_vote_type: str):
-    """Update vote counts after changing a vote"""
-    translation = db.query(Translation).filter(Translation.id == translation_id).first()
-    if translation:
-        # Remove old vote
-        if old_vote_type == VoteType.UP:
-            translation.upvotes = max(0, translation.upvotes - 1)
-        elif old_vote_type == VoteType.DOWN:
-            translation.downvotes = max(0, translation.downvotes - 1)
-        
-        # Add new vote
-        if new_vote_type == VoteType.UP:
-            translation.upvotes += 1
-        elif new_vote_type == VoteType.DOWN:
-            translation.downvotes += 1
-        
-        db.commit()
-
-
-def update_vote_counts_after_delete(db: Session, translation_id: str, vote_type: str):
-    """Update vote counts after deleting a vote"""
-    translation = db.query(Translation).filter(Translation.id == translation_id).first()
-    if translation:
-        if vote_type == VoteType.UP:
-            translation.upvotes = max(0, translation.upvotes - 1)
-        elif vote_type == VoteType.DOWN:
-            translation.downvotes = max(0, translation.downvotes - 1)
-        db.commit()
+
+def _pending_counts(row: Row, translation_id: str) -> Tuple[int, int]:
+    """Add the vote's delta to vote_flusher; returns the stored counts plus the pending sum."""
+    upvotes_delta, downvotes_delta = vote_flusher.add(
+        str(translation_id), (row.upvotes_delta, row.downvotes_delta)
+    )
+    return max(0, row.upvotes + upvotes_delta), max(0, row.downvotes + downvotes_delta)
+
+
+def flush_vote_deltas(db: Session, deltas: Dict[str, Tuple[int, int]]) -> Optional[int]:
+    """
+    Apply summed (upvotes, downvotes) deltas by translation id to the
+    counters in one UPDATE. Returns the number of translations updated, or
+    None without waiting if another flush or reconciliation batch is running.
+    """
+    values = [(translation_id, up, down) for translation_id, (up, down) in sorted(deltas.items()) if up or down]
+    if not values:
+        return 0
+    locked = db.execute(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": VOTE_COUNTS_LOCK_KEY}
+    ).scalar()
+    if not locked:
+        db.rollback()
+        return None
+    params = {}
+    rows = []
+    for i, (translation_id, up, down) in enumerate(values):
+        params.update({f"id_{i}": translation_id, f"up_{i}": up, f"down_{i}": down})
+        rows.append(f"(CAST(:id_{i} AS uuid), CAST(:up_{i} AS int), CAST(:down_{i} AS int))")
+    result = db.execute(text(APPLY_VOTE_DELTAS_SQL.format(values=", ".join(rows))), params)
+    mark_written(db, Translation)
+    db.commit()
+    return result.rowcount
+
+
+# Recomputes the counters of one id range of translations from the vote rows
+# with a single grouped aggregate, and only rewrites rows that drifted.
+# Write-behind deltas still pending in a worker's memory are not visible here;
+# the caller flushes its own worker's first.
+RECONCILE_VOTES_SQL = """
+    WITH actual AS (
+        SELECT t.id,
+               t.upvotes AS stored_upvotes,
+               t.downvotes AS stored_downvotes,
+               COUNT(v.id) FILTER (WHERE v.vote_type = 'up') AS upvotes,
+               COUNT(v.id) FILTER (WHERE v.vote_type = 'down') AS downvotes
+        FROM translations t
+        LEFT JOIN translation_votes v ON v.translation_id = t.id
+        WHERE t.id BETWEEN CAST(:first_id AS uuid) AND CAST(:last_id AS uuid)
+        GROUP BY t.id
+    ){update}
+    SELECT * FROM actual
+    WHERE (stored_upvotes, stored_downvotes) IS DISTINCT FROM (upvotes, downvotes)
+"""
+
+RECONCILE_VOTES_UPDATE = """,
+    fixed AS (
+        UPDATE translations t
+        SET upvotes = actual.upvotes, downvotes = actual.downvotes
+        FROM actual
+        WHERE t.id = actual.id
+          AND (t.upvotes, t.downvotes) IS DISTINCT FROM (actual.upvotes, actual.downvotes)
+    )"""
+
+
+def _reconcile_range(db: Session, first_id, last_id, dry_run: bool) -> List[Dict]:
+    params = {"first_id": str(first_id), "last_id": str(last_id)}
+    if dry_run:
+        statement = RECONCILE_VOTES_SQL.format(update="")
+    else:
+        # Wait for a running flush of pending deltas, then lock the range so the
+        # counts below are taken after every vote that already touched these
+        # counters has committed; votes arriving meanwhile wait for this short
+        # transaction instead of being overwritten
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": VOTE_COUNTS_LOCK_KEY})
+        db.execute(
+            text(
+                "SELECT id FROM translations "
+                "WHERE id BETWEEN CAST(:first_id AS uuid) AND CAST(:last_id AS uuid) "
+                "FOR NO KEY UPDATE"
+            ),
+            params
+        )
+        statement = RECONCILE_VOTES_SQL.format(update=RECONCILE_VOTES_UPDATE)
+
+    drifted = [dict(row._mapping) for row in db.execute(text(statement), params)]
+    if not dry_run:
+        mark_written(db, Translation)
+    db.commit()
+    return drifted
 
 
 def recalculate_vote_counts(db: Session, translation_id: str):
     """Recalculate vote counts from actual votes (for data integrity)"""
-    upvotes = db.query(TranslationVote).filter(
-        and_(
-            TranslationVote.translation_id == translation_id,
-            TranslationVote.vote_type == VoteType.UP
-        )
-    ).count()
-    
-    downvotes = db.query(TranslationVote).filter(
-        and_(
-            TranslationVote.translation_id == translation_id,
-            TranslationVote.vote_type == VoteType.DOWN
-        )
-    ).count()
-    
+    _reconcile_range(db, translation_id, translation_id, dry_run=False)
     translation = db.query(Translation).filter(Translation.id == translation_id).first()
-    if translation:
-        translation.upvotes = upvotes
-        translation.downvotes = downvotes
-        db.commit()
-        
-    return upvotes, downvotes
+    if not translation:
+        return 0, 0
+    return translation.upvotes, translation.downvotes
+
+
+def reconcile_vote_counts(
+    db: Session,
+    after_id: Optional[uuid.UUID] = None,
+    batch_size: int = 1000,
+    dry_run: bool = False
+) -> Tuple[Optional[uuid.UUID], int, List[Dict]]:
+    """
+    Recompute upvotes/downvotes from the vote rows for the next `batch_size`
+    translations ordered by id after `after_id`, in its own short transaction.
+
+    Returns (last id processed, number of translations checked, drifted rows),
+    where the last id is None when there is nothing left. With `dry_run` the
+    drift is only reported.
+    """
+    query = db.query(Translation.id)
+    if after_id is not None:
+        query = query.filter(Translation.id > after_id)
+    translation_ids = [row.id for row in query.order_by(Translation.id).limit(batch_size)]
+    if not translation_ids:
+        return None, 0, []
+
+    drifted = _reconcile_range(db, translation_ids[0], translation_ids[-1], dry_run)
+    return translation_ids[-1], len(translation_ids), drifted
 
 
 def get_user_votes_for_translations(db: Session, translation_ids: List[str], user_id: str) -> Dict[str, str]:
@@ -184,4 +357,39 @@ def enrich_translations_with_user_votes(
         }
         enriched_translations.append(TranslationWithUserVote(**translation_dict))
     
-    return enriched_translations
\ No newline at end of file
+    return enriched_translations
+
+
+# Async versions for AsyncSession callers
+aget_user_vote = to_async(get_user_vote)
+acreate_or_update_vote = to_async(create_or_update_vote)
+adelete_vote = to_async(delete_vote)
+arecalculate_vote_counts = to_async(recalculate_vote_counts)
+areconcile_vote_counts = to_async(reconcile_vote_counts)
+aget_user_votes_for_translations = to_async(get_user_votes_for_translations)
+aflush_vote_deltas = to_async(flush_vote_deltas)
+
+
+async def _flush_pending_vote_deltas(deltas: Dict[str, Tuple[int, int]]) -> Optional[int]:
+    async with AsyncSessionLocal() as db:
+        return await aflush_vote_deltas(db, deltas)
+
+
+# Write-behind voting (settings.vote_write_behind): started with the app.
+# Deltas not yet flushed when a worker dies are lost; the vote rows stay the
+# record, and POST /translations/recalculate-votes rebuilds the counters.
+vote_flusher = WriteBehindFlusher(
+    _flush_pending_vote_deltas,
+    interval=settings.vote_flush_interval_ms / 1000,
+    max_pending=settings.vote_flush_max_votes,
+)
+
+
+async def aenrich_translations_with_user_votes(
+    translations: List[Translation],
+    user_id: Optional[str],
+    db: AsyncSession
+) -> List[TranslationWithUserVote]:
+    return await db.run_sync(
+        lambda session: enrich_translations_with_user_votes(translations, user_id, session)
+    )
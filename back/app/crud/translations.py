@@ -0,0 +1,104 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.core.database import to_async
+from app.core.text import pinyin_keys
+from app.models.models import Translation
+from app.schemas.translations import TranslationCreate, TranslationUpdate
+from typing import Optional, List
+import uuid
+
+
+def get_translation(db: Session, translation_id: str) -> Optional[Translation]:
+    return db.query(Translation).filter(Translation.id == translation_id).first()
+
+
+def get_entry_translations(db: Session, entry_id: str) -> List[Translation]:
+    return db.query(Translation).filter(Translation.entry_id == entry_id).all()
+
+
+def create_translation(db: Session, translation: TranslationCreate, user_id: str) -> Translation:
+    pinyin_full, pinyin_initials = pinyin_keys(translation.translated_name)
+    db_translation = Translation(
+        id=uuid.uuid4(),
+        entry_id=translation.entry_id,
+        translated_name=translation.translated_name,
+        pinyin_full=pinyin_full,
+        pinyin_initials=pinyin_initials,
+        notes=translation.notes,
+        source_id=translation.source_id,
+        created_by=user_id,
+        updated_by=user_id
+    )
+    db.add(db_translation)
+    db.commit()
+    db.refresh(db_translation)
+    return db_translation
+
+
+def update_translation(
+    db: Session, db_translation: Translation, translation_update: TranslationUpdate, user_id: str
+) -> Translation:
+    update_data = translation_update.model_dump(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(db_translation, field, value)
+    if "translated_name" in update_data:
+        db_translation.pinyin_full, db_translation.pinyin_initials = pinyin_keys(db_translation.translated_name)
+
+    db_translation.updated_by = user_id
+    db.commit()
+    db.refresh(db_translation)
+    return db_translation
+
+
+def delete_translation(db: Session, db_translation: Translation) -> None:
+    db.delete(db_translation)
+    db.commit()
+
+
+def backfill_pinyin(db: Session, batch_size: int = 500) -> int:
+    """
+    Fill pinyin_full/pinyin_initials of the next `batch_size` translations
+    that have none yet, in its own transaction. Returns the number of rows
+    updated, 0 when there is nothing left.
+
+    Only the updated_at trigger is disabled, for the batch's transaction
+    (ALTER TABLE needs the table owner, not a superuser), so the backfill
+    does not bump updated_at; the search document and entry version
+    triggers still fire. The ALTER holds off other writes to translations
+    until the batch commits, so keep batches small on a live database.
+    """
+    rows = db.query(Translation.id, Translation.translated_name).filter(
+        Translation.pinyin_full.is_(None)
+    ).order_by(Translation.id).limit(batch_size).all()
+    if not rows:
+        return 0
+
+    ids, fulls, initials = [], [], []
+    for translation_id, translated_name in rows:
+        pinyin_full, pinyin_initials = pinyin_keys(translated_name)
+        ids.append(str(translation_id))
+        fulls.append(pinyin_full)
+        initials.append(pinyin_initials)
+
+    db.execute(text("ALTER TABLE translations DISABLE TRIGGER update_translations_updated_at"))
+    db.execute(
+        text("""
+            UPDATE translations t
+            SET pinyin_full = v.pinyin_full, pinyin_initials = v.pinyin_initials
+            FROM unnest(CAST(:ids AS uuid[]), CAST(:fulls AS text[]), CAST(:initials AS text[]))
+                AS v(id, pinyin_full, pinyin_initials)
+            WHERE t.id = v.id
+        """),
+        {"ids": ids, "fulls": fulls, "initials": initials}
+    )
+    db.execute(text("ALTER TABLE translations ENABLE TRIGGER update_translations_updated_at"))
+    db.commit()
+    return len(rows)
+
+
+# Async versions for AsyncSession callers
+aget_translation = to_async(get_translation)
+aget_entry_translations = to_async(get_entry_translations)
+acreate_translation = to_async(create_translation)
+aupdate_translation = to_async(update_translation)
+adelete_translation = to_async(delete_translation)
@@ -1,8 +1,14 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
-from app.models.models import User, VerificationCode, Entry, Translation, Source
+from sqlalchemy import JSON, String, and_, func, literal, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from app.core.cache import TTLCache, on_commit_of
+from app.core.config import settings
+from app.core.database import to_async
+from app.models.models import User, UserStats, VerificationCode, Entry, Translation, Source
+from app.schemas.auth import UserResponse
 from app.schemas.users import UserCreate, UserUpdate
-from typing import Optional, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone, timedelta
 import uuid
 
@@ -11,10 +17,38 @@ def get_user(db: Session, user_id: str) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
 
 
+# Validated principals for authenticated requests, keyed by user id. Dropped on
+# any user write in this process (update_user, activate_user, ...)
+_principal_cache = TTLCache(
+    maxsize=settings.principal_cache_size, ttl=settings.principal_cache_ttl_seconds
+)
+
+
+@on_commit_of(User)
+def _invalidate_principal_cache(session: Session) -> None:
+    _principal_cache.clear()
+
+
+def get_principal(db: Session, user_id: str) -> Optional[UserResponse]:
+    """Authenticated user for a token's user id, cached per process"""
+    principal = _principal_cache.get(str(user_id))
+    if principal is None:
+        user = get_user(db, user_id)
+        if user is None:
+            return None
+        principal = UserResponse.model_validate(user)
+        _principal_cache.set(str(user_id), principal)
+    return principal
+
+
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
 
+def list_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
+    return db.query(User).offset(skip).limit(limit).all()
+
+
 def create_user(db: Session, user: UserCreate) -> User:
     db_user = User(
         id=uuid.uuid4(),
@@ -102,6 +136,87 @@ def cleanup_expired_codes(db: Session) -> int:
     return result
 
 
+# Counts kept in user_stats
+USER_COUNT_FIELDS = (
+    'entries_created',
+    'entries_updated',
+    'translations_created',
+    'translations_updated',
+    'entries_created_last_30_days',
+    'translations_created_last_30_days',
+)
+
+
+def _isoformat(column):
+    """`column` (a timestamptz) as text in the format of datetime.isoformat() for UTC."""
+    return func.to_char(func.timezone('UTC', column), 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"')
+
+
+def _json_list(query, *fields: Tuple[str, Any], order_by=()):
+    """Rows of `query` (a subquery) as one JSON array of objects, `[]` when empty."""
+    pairs = [part for name, column in fields for part in (literal(name), column)]
+    row = func.json_build_object(*pairs)
+    return select(func.coalesce(
+        func.json_agg(aggregate_order_by(row, *order_by) if order_by else row),
+        literal_column("'[]'::json"),
+        type_=JSON,
+    )).select_from(query).scalar_subquery()
+
+
+def _user_metadata_statement(user_id: str):
+    """
+    The user's user_stats row with their translated books and five newest
+    entries and translations as JSON arrays, in one statement: a primary key
+    lookup per table plus three subqueries over the created_by and
+    translator indexes.
+    """
+    entries = select(Entry).where(Entry.created_by == user_id).order_by(Entry.created_at.desc()).limit(5).subquery()
+    translations = select(Translation).where(
+        Translation.created_by == user_id
+    ).order_by(Translation.created_at.desc()).limit(5).subquery()
+    books = select(Source).where(Source.translator_id == user_id).subquery()
+
+    recent_entries = _json_list(
+        entries,
+        ('id', func.cast(entries.c.id, String)),
+        ('primary_name', entries.c.primary_name),
+        ('language_code', entries.c.language_code),
+        ('entry_type', entries.c.entry_type),
+        ('created_at', _isoformat(entries.c.created_at)),
+        ('updated_at', _isoformat(entries.c.updated_at)),
+        order_by=(entries.c.created_at.desc(),),
+    )
+    recent_translations = _json_list(
+        translations,
+        ('id', func.cast(translations.c.id, String)),
+        ('translated_name', translations.c.translated_name),
+        ('entry_id', func.cast(translations.c.entry_id, String)),
+        ('created_at', _isoformat(translations.c.created_at)),
+        ('updated_at', _isoformat(translations.c.updated_at)),
+        order_by=(translations.c.created_at.desc(),),
+    )
+    translated_books = _json_list(
+        books,
+        ('id', func.cast(books.c.id, String)),
+        ('title', books.c.title),
+        ('author', books.c.author),
+        ('publisher', books.c.publisher),
+        ('publication_year', books.c.publication_year),
+        ('language_code', books.c.language_code),
+        ('isbn', books.c.isbn),
+        ('description', books.c.description),
+        ('created_at', _isoformat(books.c.created_at)),
+        ('updated_at', _isoformat(books.c.updated_at)),
+    )
+    return select(
+        *[func.coalesce(getattr(UserStats, field), 0).label(field) for field in USER_COUNT_FIELDS],
+        translated_books.label('translated_books'),
+        recent_entries.label('recent_entries'),
+        recent_translations.label('recent_translations'),
+        func.now().label('counted_at'),
+    ).select_from(User).outerjoin(UserStats, UserStats.user_id == User.id).where(User.id == user_id)
+
+
 def get_user_metadata(db: Session, user_id: str) -> Dict[str, Any]:
     """
     Get comprehensive metadata about a user including:
@@ -111,99 +226,57 @@ def get_user_metadata(db: Session, user_id: str) -> Dict[str, Any]:
     4. Number of translations updated
     5. Books they translated (from sources.translator_id)
     6. Recent activity statistics
+
+    All of it comes from one statement over the user's user_stats row. The
+    counts are current as of counts_as_of, except the last-30-days ones,
+    which may be up to settings.user_stats_refresh_seconds behind.
     """
-    
-    # Count entries created by user
-    entries_created = db.query(Entry).filter(Entry.created_by == user_id).count()
-    
-    # Count entries updated by user (but not created by them)
-    entries_updated = db.query(Entry).filter(
-        and_(Entry.updated_by == user_id, Entry.created_by != user_id)
-    ).count()
-    
-    # Count translations created by user
-    translations_created = db.query(Translation).filter(
-        Translation.created_by == user_id
-    ).count()
-    
-    # Count translations updated by user (but not created by them)
-    translations_updated = db.query(Translation).filter(
-        and_(Translation.updated_by == user_id, Translation.created_by != user_id)
-    ).count()
-    
-    # Get books/sources the user has translated
-    translated_books_query = db.query(Source).filter(
-        Source.translator_id == user_id
-    ).all()
-    
-    # Convert to dictionaries for serialization
-    translated_books = [
-        {
-            'id': str(book.id),
-            'title': book.title,
-            'author': book.author,
-            'publisher': book.publisher,
-            'publication_year': book.publication_year,
-            'language_code': book.language_code,
-            'isbn': book.isbn,
-            'description': book.description,
-            'created_at': book.created_at.isoformat(),
-            'updated_at': book.updated_at.isoformat()
-        } for book in translated_books_query
-    ]
-    
-    # Recent activity (last 30 days)
-    thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
-    
-    recent_entries_created = db.query(Entry).filter(
-        and_(Entry.created_by == user_id, Entry.created_at >= thirty_days_ago)
-    ).count()
-    
-    recent_translations_created = db.query(Translation).filter(
-        and_(Translation.created_by == user_id, Translation.created_at >= thirty_days_ago)
-    ).count()
-    
-    # Get user's most recent entries and translations
-    recent_entries_query = db.query(Entry).filter(
-        Entry.created_by == user_id
-    ).order_by(Entry.created_at.desc()).limit(5).all()
-    
-    recent_translations_query = db.query(Translation).filter(
-        Translation.created_by == user_id
-    ).order_by(Translation.created_at.desc()).limit(5).all()
-    
-    # Convert to dictionaries for serialization
-    recent_entries = [
-        {
-            'id': str(entry.id),
-            'primary_name': entry.primary_name,
-            'language_code': entry.language_code,
-            'entry_type': entry.entry_type,
-            'created_at': entry.created_at.isoformat(),
-            'updated_at': entry.updated_at.isoformat()
-        } for entry in recent_entries_query
-    ]
-    
-    recent_translations = [
-        {
-            'id': str(translation.id),
-            'translated_name': translation.translated_name,
-            'entry_id': str(translation.entry_id),
-            'created_at': translation.created_at.isoformat(),
-            'updated_at': translation.updated_at.isoformat()
-        } for translation in recent_translations_query
-    ]
-    
+    row = db.execute(_user_metadata_statement(user_id)).one_or_none()
+    if row is None:
+        counts = dict.fromkeys(USER_COUNT_FIELDS, 0)
+        lists = {'translated_books': [], 'recent_entries': [], 'recent_translations': []}
+        counted_at = datetime.now(timezone.utc)
+    else:
+        counts = {field: getattr(row, field) for field in USER_COUNT_FIELDS}
+        lists = {
+            'translated_books': row.translated_books,
+            'recent_entries': row.recent_entries,
+            'recent_translations': row.recent_translations,
+        }
+        counted_at = row.counted_at
     return {
-        'entries_created': entries_created,
-        'entries_updated': entries_updated,
-        'translations_created': translations_created,
-        'translations_updated': translations_updated,
-        'translated_books': translated_books,
+        'entries_created': counts['entries_created'],
+        'entries_updated': counts['entries_updated'],
+        'translations_created': counts['translations_created'],
+        'translations_updated': counts['translations_updated'],
+        'translated_books': lists['translated_books'],
         'recent_activity': {
-            'entries_created_last_30_days': recent_entries_created,
-            'translations_created_last_30_days': recent_translations_created,
+            'entries_created_last_30_days': counts['entries_created_last_30_days'],
+            'translations_created_last_30_days': counts['translations_created_last_30_days'],
         },
-        'recent_entries': recent_entries,
-        'recent_translations': recent_translations
+        'recent_entries': lists['recent_entries'],
+        'recent_translations': lists['recent_translations'],
+        'counts_as_of': counted_at.isoformat()
     }
+
+
+# Async versions for AsyncSession callers
+aget_user = to_async(get_user)
+aget_user_by_email = to_async(get_user_by_email)
+alist_users = to_async(list_users)
+acreate_user = to_async(create_user)
+aupdate_user = to_async(update_user)
+aactivate_user = to_async(activate_user)
+aget_user_metadata = to_async(get_user_metadata)
+acreate_verification_code = to_async(create_verification_code)
+aget_valid_verification_code = to_async(get_valid_verification_code)
+amark_verification_code_used = to_async(mark_verification_code_used)
+acleanup_expired_codes = to_async(cleanup_expired_codes)
+
+
+async def aget_principal(db: AsyncSession, user_id: str) -> Optional[UserResponse]:
+    # Cache hits return without touching the session, so no connection is used
+    principal = _principal_cache.get(str(user_id))
+    if principal is not None:
+        return principal
+    return await db.run_sync(get_principal, user_id)
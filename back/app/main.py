@@ -1,7 +1,34 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.api.endpoints import users, entries, translations, comments, auth, translation_votes
+from app.api.endpoints import users, entries, translations, comments, auth, translation_votes, activity
+from app.crud import translation_votes as crud_votes
+from app.services.entry_annotator import entry_annotator
+from app.services.entry_suggester import entry_suggester
+from app.services.metadata_snapshot import metadata_snapshot
+from app.services.user_stats import user_stats_refresher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.vote_write_behind:
+        await crud_votes.vote_flusher.start()
+    # Load the typeahead index and keep it current in the background
+    await entry_suggester.start()
+    # Likewise the entry name index behind /entries/annotate
+    await entry_annotator.start()
+    # Build the dashboard metadata snapshot and keep it current
+    await metadata_snapshot.start()
+    # Recompute user contribution counts periodically
+    await user_stats_refresher.start()
+    yield
+    await user_stats_refresher.stop()
+    await metadata_snapshot.stop()
+    await entry_annotator.stop()
+    await entry_suggester.stop()
+    await crud_votes.vote_flusher.stop()
+
 
 app = FastAPI(
     title="Ancient Lexicon CN API",
@@ -34,6 +61,7 @@ app = FastAPI(
         "**Development Mode**: Use code `123456` for any email address."
     ),
     version="1.0.0",
+    lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
     contact={
@@ -94,6 +122,9 @@ app.include_router(
 app.include_router(
     translation_votes.router, prefix="/api/v1", tags=["votes"]
 )
+app.include_router(
+    activity.router, prefix="/api/v1/activity", tags=["activity"]
+)
 # app.include_router(backup.router, prefix="/api/v1/backup", tags=["backup"])
 
 
@@ -1,4 +1,5 @@
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -69,6 +70,29 @@ class User(Base):
     translation_votes = relationship("TranslationVote", back_populates="user")
 
 
+class UserStats(Base):
+    """
+    Contribution counts of a user, moved by triggers on every insert and
+    delete of the user's entries and translations (see
+    add_user_contribution() in the database). The last-30-days counts are
+    recomputed periodically by refresh_user_recent_stats(), as rows age out.
+    A user without contributions may have no row.
+    """
+    __tablename__ = "user_stats"
+
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    entries_created = Column(Integer, nullable=False, server_default="0")
+    # Rows last updated by the user but created by someone else
+    entries_updated = Column(Integer, nullable=False, server_default="0")
+    translations_created = Column(Integer, nullable=False, server_default="0")
+    translations_updated = Column(Integer, nullable=False, server_default="0")
+    entries_created_last_30_days = Column(Integer, nullable=False, server_default="0")
+    translations_created_last_30_days = Column(Integer, nullable=False, server_default="0")
+
+
 class VerificationCode(Base):
     __tablename__ = "verification_codes"
 
@@ -140,6 +164,7 @@ class Entry(Base):
         Index('idx_entries_type', 'entry_type'),
         Index('idx_entries_search_vector', 'search_vector', postgresql_using='gin'),
         Index('idx_entries_created_by', 'created_by'),
+        Index('idx_entries_updated_by', 'updated_by'),
         Index('idx_entries_created_at', 'created_at'),
         Index(
             'idx_entries_primary_name_trgm',
@@ -147,11 +172,26 @@ class Entry(Base):
             postgresql_using='gin',
             postgresql_ops={'primary_name': 'gin_trgm_ops'}
         ),
+        # Distance-ordered (KNN) trigram scans
+        Index(
+            'idx_entries_primary_name_trgm_gist',
+            'primary_name',
+            postgresql_using='gist',
+            postgresql_ops={'primary_name': 'gist_trgm_ops'}
+        ),
         Index(
             'idx_entries_other_language_codes',
             'other_language_codes',
             postgresql_using='gin'
         ),
+        # Composite (sort column, id) indexes for keyset pagination
+        Index('idx_entries_primary_name_id', 'primary_name', 'id'),
+        Index('idx_entries_original_script_id', 'original_script', 'id'),
+        Index('idx_entries_language_code_id', 'language_code', 'id'),
+        Index('idx_entries_entry_type_id', 'entry_type', 'id'),
+        Index('idx_entries_is_verified_id', 'is_verified', 'id'),
+        Index('idx_entries_created_at_id', 'created_at', 'id'),
+        Index('idx_entries_updated_at_id', 'updated_at', 'id'),
     )
 
     # Relationships
@@ -178,6 +218,78 @@ class Entry(Base):
     history = relationship("EntryHistory", back_populates="entry")
 
 
+class EntryAlternativeName(Base):
+    """
+    One row per element of entries.alternative_names, maintained by a trigger
+    on entries, so that every alternative name has its own trigram index entry.
+    """
+    __tablename__ = "entry_alternative_names"
+
+    entry_id = Column(
+        UUID(as_uuid=True), ForeignKey("entries.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    name = Column(Text, primary_key=True)
+
+    __table_args__ = (
+        Index(
+            'idx_entry_alternative_names_name_trgm', 'name',
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+        ),
+    )
+
+
+class EntrySearchDocument(Base):
+    """
+    Denormalized full-text document per entry: the entry's own weighted
+    search_vector plus all of its translated names and notes. Maintained by
+    triggers on entries and translations so search is a single GIN lookup.
+    """
+    __tablename__ = "entry_search_documents"
+
+    entry_id = Column(
+        UUID(as_uuid=True), ForeignKey("entries.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    document = Column(TSVECTOR, nullable=False)
+    # name_search_key() of the entry's names (accent-folded, Greek transliterated)
+    # and the same as a 'simple' tsvector, for the normalized search mode
+    names_key = Column(Text, nullable=False, server_default='')
+    names_document = Column(TSVECTOR, nullable=False, server_default=text("''::tsvector"))
+    # Character bigrams of the Han text in translated names (A) and notes (D),
+    # Traditional folded to Simplified, for the chinese search mode
+    han_document = Column(TSVECTOR, nullable=False, server_default=text("''::tsvector"))
+    # pinyin_full of the entry's first translation in display order, for sorting
+    preferred_pinyin = Column(Text)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index('idx_entry_search_documents_document', 'document', postgresql_using='gin'),
+        Index('idx_entry_search_documents_names_document', 'names_document', postgresql_using='gin'),
+        Index('idx_entry_search_documents_han_document', 'han_document', postgresql_using='gin'),
+        Index('idx_entry_search_documents_preferred_pinyin', text('preferred_pinyin COLLATE "C"'), 'entry_id'),
+        Index(
+            'idx_entry_search_documents_names_key_trgm', 'names_key',
+            postgresql_using='gin', postgresql_ops={'names_key': 'gin_trgm_ops'}
+        ),
+    )
+
+
+class EntryVersion(Base):
+    """
+    Counter bumped by triggers on every write to an entry or its translations
+    (vote counters included), committed with the write. Cached entry detail
+    bodies are valid as long as it is unchanged.
+    """
+    __tablename__ = "entry_versions"
+
+    entry_id = Column(
+        UUID(as_uuid=True), ForeignKey("entries.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    version = Column(BigInteger, nullable=False, server_default="0")
+
+
 class Translation(Base):
     __tablename__ = "translations"
 
@@ -197,17 +309,40 @@ class Translation(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now())
     search_vector = Column(TSVECTOR, nullable=False)
+    # Toneless pinyin of translated_name ("a ka liu si" / "akls"), set by the
+    # crud on write; NULL until scripts/backfill_pinyin.py has reached the row
+    pinyin_full = Column(Text)
+    pinyin_initials = Column(Text)
 
     __table_args__ = (
         UniqueConstraint(
             'entry_id', 'translated_name',
             name='translations_entry_name_unique'
         ),
-        Index('idx_translations_entry_id', 'entry_id'),
+        # Per-entry translations in display order (preferred first, then oldest)
+        Index(
+            'idx_translations_entry_display_order',
+            'entry_id', text('is_preferred DESC'), 'created_at', 'id'
+        ),
+        Index('idx_translations_created_by', 'created_by', 'created_at'),
+        Index('idx_translations_created_at', 'created_at'),
+        Index('idx_translations_updated_by', 'updated_by'),
         Index('idx_translations_source', 'source_id'),
         Index('idx_translations_name', 'translated_name'),
+        Index(
+            'idx_translations_name_trgm', 'translated_name',
+            postgresql_using='gin', postgresql_ops={'translated_name': 'gin_trgm_ops'}
+        ),
         Index('idx_translations_preferred', 'is_preferred'),
         Index('idx_translations_search_vector', 'search_vector', postgresql_using='gin'),
+        # Prefix search on typed pinyin, with or without syllable spaces
+        Index(
+            'idx_translations_pinyin_initials', 'pinyin_initials',
+            postgresql_ops={'pinyin_initials': 'text_pattern_ops'}
+        ),
+        Index(
+            'idx_translations_pinyin_compact', text("replace(pinyin_full, ' ', '') text_pattern_ops")
+        ),
     )
 
     # Relationships
@@ -358,3 +493,39 @@ class EntryHistory(Base):
     # Relationships
     entry = relationship("Entry", back_populates="history")
     changed_by_user = relationship("User", back_populates="entry_history")
+
+
+class ActivityEvent(Base):
+    """
+    Append-only feed of writes to entries, translations, comments and votes.
+    Rows are inserted by database triggers in the transaction of the write
+    they record; the application only reads them.
+    """
+    __tablename__ = "activity_events"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    event_type = Column(String(30), nullable=False)
+    entry_id = Column(
+        UUID(as_uuid=True), ForeignKey("entries.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    # No foreign keys: events outlive deleted translations, comments and users
+    translation_id = Column(UUID(as_uuid=True))
+    comment_id = Column(UUID(as_uuid=True))
+    user_id = Column(UUID(as_uuid=True))
+    # Name or excerpt of the written row at the time of the event
+    details = Column(JSONB)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        CheckConstraint(
+            "event_type IN ('entry_created', 'entry_updated', 'translation_created', "
+            "'translation_updated', 'comment_created', 'comment_updated', 'vote_cast')",
+            name="activity_events_event_type_check"
+        ),
+        Index('idx_activity_events_created_at', text('created_at DESC'), text('id DESC')),
+        Index('idx_activity_events_entry_id', 'entry_id', text('created_at DESC'), text('id DESC')),
+    )
+
+    # Relationships
+    entry = relationship("Entry")
@@ -0,0 +1,41 @@
+from pydantic import BaseModel
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+
+class ActivityEventType(str, Enum):
+    ENTRY_CREATED = "entry_created"
+    ENTRY_UPDATED = "entry_updated"
+    TRANSLATION_CREATED = "translation_created"
+    TRANSLATION_UPDATED = "translation_updated"
+    COMMENT_CREATED = "comment_created"
+    COMMENT_UPDATED = "comment_updated"
+    VOTE_CAST = "vote_cast"
+
+
+class ActivityEventResponse(BaseModel):
+    id: int
+    event_type: ActivityEventType
+    entry_id: UUID
+    # Current name of the entry, not the one at the time of the event
+    primary_name: str
+    translation_id: Optional[UUID] = None
+    comment_id: Optional[UUID] = None
+    user_id: Optional[UUID] = None
+    username: Optional[str] = None
+    # translated_name, comment excerpt or vote_type as written by the event
+    details: Optional[Dict[str, Any]] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class PaginatedActivity(BaseModel):
+    """One page of the activity feed, newest first"""
+    limit: int
+    items: List[ActivityEventResponse]
+    has_more: bool = False
+    next_cursor: Optional[str] = None
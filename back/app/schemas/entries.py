@@ -1,7 +1,8 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, create_model
+from typing import Optional, List, FrozenSet, Type, Union
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from uuid import UUID
 
 class EntryType(str, Enum):
@@ -12,6 +13,25 @@ class EntryType(str, Enum):
     CONCEPT = "concept"
 
 
+class SearchMode(str, Enum):
+    ENGLISH = "english"
+    NORMALIZED = "normalized"
+    CHINESE = "chinese"
+    PINYIN = "pinyin"
+
+
+class FuzzyMode(str, Enum):
+    SIMILARITY = "similarity"
+    KNN = "knn"
+    WORD = "word"
+
+
+class CountMode(str, Enum):
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
 class EntryBase(BaseModel):
     primary_name: str
     original_script: Optional[str] = None
@@ -48,6 +68,8 @@ class EntryResponse(EntryBase):
     verification_notes: Optional[str] = None
     created_at: datetime
     updated_at: datetime
+    # Relevance score, only set on ranked (search / fuzzy_search) listings
+    score: Optional[float] = None
 
     class Config:
         from_attributes = True
@@ -73,12 +95,14 @@ class EntryWithTranslations(EntryResponse):
         from_attributes = True
 
 class PaginatedEntries(BaseModel):
-    total: int
+    total: Optional[int] = None
     skip: int
     limit: int
     page: int
-    pages: int
+    pages: Optional[int] = None
     items: List[EntryWithTranslations]
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 class EntryWithTranslationsAndVotes(EntryResponse):
     """Entry with translations including user vote information"""
@@ -88,6 +112,20 @@ class EntryWithTranslationsAndVotes(EntryResponse):
         from_attributes = True
 
 
+@lru_cache(maxsize=256)
+def entry_fields_model(base: Type[EntryResponse], fields: FrozenSet[str]) -> Type[BaseModel]:
+    """
+    Trimmed copy of an entry response model with only `fields` (sparse
+    fieldsets). `id` and, if the base has them, `translations` are always kept.
+    """
+    keep = fields | {"id", "translations"}
+    return create_model(
+        f"{base.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (field.annotation, field) for name, field in base.model_fields.items() if name in keep}
+    )
+
+
 class EntryWithComment(EntryResponse):
     """Entry with its newest comment"""
     newest_comment: Optional[CommentWithUser] = None
@@ -96,6 +134,59 @@ class EntryWithComment(EntryResponse):
         from_attributes = True
 
 
+class FacetCount(BaseModel):
+    value: Optional[Union[bool, str]] = None
+    count: int
+
+
+class EntryFacets(BaseModel):
+    """Entry counts per filter value, most frequent first"""
+    total: int
+    language_code: List[FacetCount]
+    entry_type: List[FacetCount]
+    is_verified: List[FacetCount]
+    # Number of entries listing each code in other_language_codes
+    other_language_codes: List[FacetCount]
+
+
+class EntrySuggestion(BaseModel):
+    id: UUID
+    primary_name: str
+    language_code: str
+    entry_type: Optional[EntryType] = None
+    is_verified: bool
+    # The name the query matched: primary, original script, alternative or translated name
+    matched_name: str
+    # First translation in display order (preferred first)
+    translation: Optional[str] = None
+
+
+class AnnotateRequest(BaseModel):
+    text: str
+
+
+class AnnotatedEntry(BaseModel):
+    id: UUID
+    primary_name: str
+    original_script: Optional[str] = None
+    language_code: str
+    entry_type: Optional[EntryType] = None
+    # First translation in display order (preferred first)
+    preferred_translation: Optional[str] = None
+
+
+class AnnotationSpan(BaseModel):
+    """Entry name found in the text; start/end are character offsets"""
+    start: int
+    end: int
+    text: str
+    entries: List[AnnotatedEntry]
+
+
+class AnnotationResponse(BaseModel):
+    spans: List[AnnotationSpan]
+
+
 class EntryMetadata(BaseModel):
     """Comprehensive metadata about entries and activity"""
     total_entries: int
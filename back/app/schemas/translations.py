@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 from enum import Enum
@@ -32,6 +32,8 @@ class TranslationResponse(TranslationBase):
     entry_id: UUID
     upvotes: int = 0
     downvotes: int = 0
+    pinyin_full: Optional[str] = None
+    pinyin_initials: Optional[str] = None
     created_by: UUID
     updated_by: UUID
     created_at: datetime
@@ -53,11 +55,34 @@ class VoteResponse(BaseModel):
     vote_type: VoteType
     created_at: datetime
     updated_at: datetime
+    # Translation vote counts after the vote was applied
+    upvotes: Optional[int] = None
+    downvotes: Optional[int] = None
 
     class Config:
         from_attributes = True
 
 
+class VoteDrift(BaseModel):
+    """A translation whose stored vote counts differed from its vote rows"""
+    id: UUID
+    stored_upvotes: int
+    stored_downvotes: int
+    upvotes: int
+    downvotes: int
+
+
+class VoteReconciliationReport(BaseModel):
+    checked: int
+    # Number of drifted translations found; `drifted` lists at most the first
+    # MAX_DRIFT_SAMPLE of them
+    drifted_count: int
+    drifted: List[VoteDrift]
+    dry_run: bool
+    # Pass as after_id to continue; None once every translation was checked
+    next_after_id: Optional[UUID] = None
+
+
 class TranslationWithUserVote(TranslationResponse):
     """Translation response that includes the current user's vote (if any)"""
     user_vote: Optional[VoteType] = None
@@ -0,0 +1,224 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
+import uuid
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.aho_corasick import AhoCorasick
+from app.core.background import BackgroundRefresher
+from app.core.cache import on_commit_of
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.text import fold, fold_with_offsets
+from app.models.models import Entry
+
+# Entries updated this long before the newest change already seen are read
+# again on every refresh, to catch transactions that committed late
+# (updated_at is the transaction start time)
+REFRESH_OVERLAP = timedelta(minutes=1)
+
+# Single letters are not worth highlighting
+MIN_KEY_LENGTH = 2
+
+# Entry edits arriving in a burst are picked up together
+REFRESH_DEBOUNCE_SECONDS = 0.5
+
+# Texts at least this long are matched in a thread rather than on the event loop
+FIND_IN_THREAD_MIN_CHARS = 5000
+
+
+def _entry_keys(primary_name: str, original_script: Optional[str], alternative_names: Optional[List[str]]) -> FrozenSet[str]:
+    names = [primary_name, original_script, *(alternative_names or [])]
+    keys = (fold(name) for name in names if name)
+    return frozenset(key for key in keys if len(key) >= MIN_KEY_LENGTH)
+
+
+class AnnotatorState(NamedTuple):
+    # Folded name -> entries having it, and the reverse; every known entry
+    # is in entry_keys, those with no key long enough with an empty set, so
+    # its size is the entry count as of the last refresh
+    keys: Dict[str, FrozenSet[uuid.UUID]]
+    entry_keys: Dict[uuid.UUID, FrozenSet[str]]
+    main: AhoCorasick
+    main_keys: FrozenSet[str]
+    # Keys added since `main` was built
+    delta: Optional[AhoCorasick]
+    added: FrozenSet[str]
+    # Keys gone since `main` was built (still matched by it, mapping to no entry)
+    removed: int
+    watermark: datetime
+
+
+def _set_entry_keys(
+    keys: Dict[str, FrozenSet[uuid.UUID]], entry_keys: Dict[uuid.UUID, FrozenSet[str]],
+    main_keys: FrozenSet[str], added: Set[str], entry_id: uuid.UUID, new_keys: FrozenSet[str]
+) -> int:
+    """Update the key maps for one entry; returns how many keys of the main automaton it left without entries."""
+    removed = 0
+    old_keys = entry_keys.get(entry_id, frozenset())
+    for key in old_keys - new_keys:
+        remaining = keys[key] - {entry_id}
+        if remaining:
+            keys[key] = remaining
+        else:
+            del keys[key]
+            if key in main_keys:
+                removed += 1
+            else:
+                added.discard(key)
+    for key in new_keys - old_keys:
+        keys[key] = keys.get(key, frozenset()) | {entry_id}
+        if key not in main_keys:
+            added.add(key)
+    entry_keys[entry_id] = new_keys
+    return removed
+
+
+class EntryAnnotator:
+    """
+    In-memory index of the folded names of all entries (primary_name,
+    original_script and alternative_names) for finding them in a text.
+
+    Keys live in a main Aho-Corasick automaton plus a small delta automaton
+    holding only the keys added since the main one was built. A changed entry
+    only updates the key -> entries map and rebuilds the delta; keys that
+    are gone are still matched by the main automaton but map to no entry.
+    Once the delta (or the number of removed keys) exceeds `delta_max_keys`
+    the main automaton is rebuilt from the current keys.
+
+    A background task keeps the index current. It reads entries by
+    updated_at every `refresh_seconds`, and shortly after any local commit
+    that wrote entries. Automata are built in a thread, and the new state
+    replaces the old one in one assignment, so a find() never sees a
+    half-built index.
+    """
+
+    def __init__(self, refresh_seconds: float, delta_max_keys: int):
+        self.refresh_seconds = refresh_seconds
+        self.delta_max_keys = delta_max_keys
+        self._state: Optional[AnnotatorState] = None
+        self._refresher = BackgroundRefresher(
+            self.refresh, interval=refresh_seconds, debounce=REFRESH_DEBOUNCE_SECONDS,
+            name="Annotation index refresh",
+        )
+
+    def _load(self, db: Session) -> Dict[str, Any]:
+        """Read the entries changed since the current state, from one snapshot."""
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        state = self._state
+        columns = (Entry.id, Entry.primary_name, Entry.original_script, Entry.alternative_names, Entry.updated_at)
+        if state is None:
+            return {"rows": db.query(*columns).all(), "existing": None}
+
+        rows = db.query(*columns).filter(Entry.updated_at >= state.watermark - REFRESH_OVERLAP).all()
+        # Deletions leave no row behind; look for them only when the count is off
+        existing = None
+        known = len(state.entry_keys.keys() | {row[0] for row in rows})
+        if db.query(func.count(Entry.id)).scalar() != known:
+            existing = {entry_id for entry_id, in db.query(Entry.id)}
+        return {"rows": rows, "existing": existing}
+
+    def _apply(self, changes: Dict[str, Any]) -> AnnotatorState:
+        state = self._state
+        rows = changes["rows"]
+        seen = [row[4] for row in rows if row[4] is not None]
+        if state is not None:
+            seen.append(state.watermark)
+        watermark = max(seen, default=None) or datetime.now().astimezone()
+
+        if state is None:
+            keys, entry_keys, main_keys, added, removed = {}, {}, frozenset(), set(), 0
+        else:
+            # Copied, so the current state stays intact for concurrent find() calls
+            keys, entry_keys = dict(state.keys), dict(state.entry_keys)
+            main_keys, added, removed = state.main_keys, set(state.added), state.removed
+
+        for entry_id, primary_name, original_script, alternative_names, _ in rows:
+            new_keys = _entry_keys(primary_name, original_script, alternative_names)
+            removed += _set_entry_keys(keys, entry_keys, main_keys, added, entry_id, new_keys)
+        if changes["existing"] is not None:
+            for entry_id in set(entry_keys) - changes["existing"]:
+                removed += _set_entry_keys(keys, entry_keys, main_keys, added, entry_id, frozenset())
+                del entry_keys[entry_id]
+
+        if state is None or len(added) + removed > self.delta_max_keys:
+            main_keys = frozenset(keys)
+            return AnnotatorState(
+                keys=keys, entry_keys=entry_keys, main=AhoCorasick(main_keys), main_keys=main_keys,
+                delta=None, added=frozenset(), removed=0, watermark=watermark,
+            )
+        delta = state.delta
+        if added != state.added:
+            delta = AhoCorasick(added) if added else None
+        return AnnotatorState(
+            keys=keys, entry_keys=entry_keys, main=state.main, main_keys=main_keys,
+            delta=delta, added=frozenset(added), removed=removed, watermark=watermark,
+        )
+
+    async def refresh(self) -> None:
+        async with AsyncSessionLocal() as db:
+            changes = await db.run_sync(self._load)
+        self._state = await asyncio.to_thread(self._apply, changes)
+
+    def find(self, text: str) -> List[Tuple[int, int, Set[uuid.UUID]]]:
+        """
+        Entry names in `text` as (start, end, entry ids), with offsets into
+        `text`. Matches must start and end on word boundaries; overlapping
+        matches are resolved leftmost-longest.
+        """
+        state = self._state
+        if state is None:
+            return []
+        folded, offsets = fold_with_offsets(text)
+        candidates = set()
+        for automaton in (state.main, state.delta):
+            if automaton is None:
+                continue
+            for start, end in automaton.find(folded):
+                if start > 0 and folded[start - 1].isalnum():
+                    continue
+                if end < len(folded) and folded[end].isalnum():
+                    continue
+                candidates.add((start, end))
+
+        spans = []
+        last_end = 0
+        for start, end in sorted(candidates, key=lambda span: (span[0], -span[1])):
+            entry_ids = state.keys.get(folded[start:end])
+            if start < last_end or not entry_ids:
+                continue
+            # Extend the end over combining marks that folded away
+            original_end = offsets[end] if end < len(offsets) else len(text)
+            spans.append((offsets[start], original_end, set(entry_ids)))
+            last_end = end
+        return spans
+
+    async def afind(self, text: str) -> List[Tuple[int, int, Set[uuid.UUID]]]:
+        """find(), in a thread for long texts so other requests are not held up."""
+        if len(text) >= FIND_IN_THREAD_MIN_CHARS:
+            return await asyncio.to_thread(self.find, text)
+        return self.find(text)
+
+    def wake(self) -> None:
+        """Ask for a refresh soon; safe to call from any thread."""
+        self._refresher.wake()
+
+    async def start(self) -> None:
+        # Until a first refresh succeeds, find() returns nothing
+        await self._refresher.start(refresh_first=True)
+
+    async def stop(self) -> None:
+        await self._refresher.stop()
+
+
+entry_annotator = EntryAnnotator(
+    refresh_seconds=settings.annotation_refresh_seconds,
+    delta_max_keys=settings.annotation_delta_max_keys,
+)
+
+
+@on_commit_of(Entry)
+def _refresh_annotator(session: Session) -> None:
+    entry_annotator.wake()
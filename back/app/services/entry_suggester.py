@@ -0,0 +1,261 @@
+import asyncio
+import heapq
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+import uuid
+
+from sqlalchemy import asc, desc, func, select
+from sqlalchemy.orm import Session
+
+from app.core.background import BackgroundRefresher
+from app.core.cache import on_commit_of
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.prefix_index import PrefixIndex
+from app.core.text import fold
+from app.models.models import ActivityEvent, Entry, Translation
+
+# Events this long before the newest one already seen are read again on
+# every refresh, to catch transactions that committed late (created_at is
+# the transaction start time)
+REFRESH_OVERLAP = timedelta(minutes=1)
+
+# Short, so an edited name shows up in typeahead almost at once
+REFRESH_DEBOUNCE_SECONDS = 0.5
+
+
+class SuggestEntry(NamedTuple):
+    primary_name: str
+    language_code: str
+    entry_type: Optional[str]
+    is_verified: bool
+    translation: Optional[str]
+    translation_count: int
+    score: float
+    # (folded key, name as stored) of every suggestible name
+    names: FrozenSet[Tuple[str, str]]
+
+
+class SuggestState(NamedTuple):
+    entries: Dict[uuid.UUID, SuggestEntry]
+    main: PrefixIndex
+    # Entries changed since `main` was built; their names are served from `delta`
+    changed: FrozenSet[uuid.UUID]
+    delta: PrefixIndex
+    entry_count: int
+    translation_count: int
+    watermark: datetime
+
+
+def _popularity(is_verified: bool, translations: List[Tuple[str, bool, int, int]]) -> float:
+    """Verified entries first, then entries with a preferred translation, then by net upvotes."""
+    net_votes = sum(max(upvotes - downvotes, 0) for _, _, upvotes, downvotes in translations)
+    has_preferred = any(is_preferred for _, is_preferred, _, _ in translations)
+    return 4.0 * is_verified + 2.0 * has_preferred + math.log1p(net_votes)
+
+
+def _suggest_entry(row: Tuple, translations: List[Tuple[str, bool, int, int]]) -> SuggestEntry:
+    _, primary_name, original_script, alternative_names, language_code, entry_type, is_verified = row
+    names = [primary_name, original_script, *(alternative_names or []), *(t[0] for t in translations)]
+    return SuggestEntry(
+        primary_name=primary_name,
+        language_code=language_code,
+        entry_type=entry_type or None,
+        is_verified=bool(is_verified),
+        translation=translations[0][0] if translations else None,
+        translation_count=len(translations),
+        score=_popularity(bool(is_verified), translations),
+        names=frozenset((fold(name), name) for name in names if name and fold(name)),
+    )
+
+
+def _postings(entries: Dict[uuid.UUID, SuggestEntry], entry_ids: Iterable[uuid.UUID]) -> Iterable[Tuple[str, float, Any]]:
+    for entry_id in entry_ids:
+        entry = entries[entry_id]
+        for key, name in entry.names:
+            yield key, entry.score, (entry_id, name)
+
+
+ENTRY_COLUMNS = (
+    Entry.id, Entry.primary_name, Entry.original_script, Entry.alternative_names,
+    Entry.language_code, Entry.entry_type, Entry.is_verified,
+)
+
+
+def _load_entries(db: Session, entry_ids: Optional[List[uuid.UUID]] = None) -> Dict[uuid.UUID, SuggestEntry]:
+    """Suggest data of the given entries (all when None)."""
+    entries = db.query(*ENTRY_COLUMNS)
+    translations = db.query(
+        Translation.entry_id, Translation.translated_name, Translation.is_preferred,
+        Translation.upvotes, Translation.downvotes,
+    ).order_by(Translation.entry_id, desc(Translation.is_preferred), asc(Translation.created_at), asc(Translation.id))
+    if entry_ids is not None:
+        entries = entries.filter(Entry.id.in_(entry_ids))
+        translations = translations.filter(Translation.entry_id.in_(entry_ids))
+
+    by_entry: Dict[uuid.UUID, List[Tuple[str, bool, int, int]]] = {}
+    for entry_id, translated_name, is_preferred, upvotes, downvotes in translations:
+        by_entry.setdefault(entry_id, []).append(
+            (translated_name, bool(is_preferred), upvotes or 0, downvotes or 0)
+        )
+    return {row[0]: _suggest_entry(row, by_entry.get(row[0], [])) for row in entries}
+
+
+class EntrySuggester:
+    """
+    In-memory prefix index over entry names (primary_name, original_script,
+    alternative_names) and translated names, for typeahead without a
+    database round trip.
+
+    Names are case- and accent-folded and kept in a main PrefixIndex plus a
+    small delta index holding the names of entries changed since the main
+    one was built. Queries skip main postings of changed entries and merge
+    both by score. Once more than `delta_max_entries` entries changed, the
+    main index is rebuilt.
+
+    A background task keeps the index current. Every `refresh_seconds`, and
+    shortly after any local commit that wrote entries or translations, it
+    reloads the entries named in activity_events since the last refresh
+    (edits, new translations, votes). Deletions (seen as a changed row count)
+    cause a full reload; a retracted vote only changes the score then. Index builds run in a thread,
+    and the new state replaces the old one in one assignment, so queries
+    never see a half-built index.
+    """
+
+    def __init__(self, refresh_seconds: float, delta_max_entries: int):
+        self.refresh_seconds = refresh_seconds
+        self.delta_max_entries = delta_max_entries
+        self._state: Optional[SuggestState] = None
+        self._refresher = BackgroundRefresher(
+            self.refresh, interval=refresh_seconds, debounce=REFRESH_DEBOUNCE_SECONDS,
+            name="Suggest index refresh",
+        )
+
+    def suggest(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        state = self._state
+        prefix = fold(query)
+        if state is None or not prefix:
+            return []
+
+        main = (
+            posting for posting in state.main.top(prefix)
+            if posting[2][0] not in state.changed
+        )
+        suggestions: List[Dict[str, Any]] = []
+        seen: Set[uuid.UUID] = set()
+        for _, _, (entry_id, name) in heapq.merge(main, state.delta.top(prefix), key=lambda posting: -posting[1]):
+            if entry_id in seen:
+                continue
+            seen.add(entry_id)
+            entry = state.entries[entry_id]
+            suggestions.append({
+                "id": entry_id,
+                "primary_name": entry.primary_name,
+                "language_code": entry.language_code,
+                "entry_type": entry.entry_type,
+                "is_verified": entry.is_verified,
+                "matched_name": name,
+                "translation": entry.translation,
+            })
+            if len(suggestions) >= limit:
+                break
+        return suggestions
+
+    def _load(self, db: Session) -> Dict[str, Any]:
+        """Read what changed since the current state, from one snapshot."""
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        state = self._state
+        entry_count, translation_count = db.execute(
+            select(select(func.count()).select_from(Entry).scalar_subquery(),
+                   select(func.count()).select_from(Translation).scalar_subquery())
+        ).one()
+        watermark = db.query(func.max(ActivityEvent.created_at)).scalar()
+        changes = {
+            "entry_count": entry_count,
+            "translation_count": translation_count,
+            "watermark": watermark or datetime.now().astimezone(),
+        }
+
+        if state is not None:
+            changed_ids = {
+                row[0] for row in db.query(ActivityEvent.entry_id).filter(
+                    ActivityEvent.created_at >= state.watermark - REFRESH_OVERLAP
+                ).distinct()
+            }
+            entries = _load_entries(db, list(changed_ids)) if changed_ids else {}
+
+            # Deleted rows leave nothing to read: the counts show whether
+            # the state plus these changes still matches the tables
+            known_entries = len(state.entries.keys() | entries.keys())
+            known_translations = state.translation_count + sum(
+                entry.translation_count - state.entries[entry_id].translation_count
+                if entry_id in state.entries else entry.translation_count
+                for entry_id, entry in entries.items()
+            )
+            if known_entries == entry_count and known_translations == translation_count:
+                changes.update(entries=entries, full=False)
+                return changes
+
+        changes.update(entries=_load_entries(db), full=True)
+        return changes
+
+    def _apply(self, changes: Dict[str, Any]) -> SuggestState:
+        state = self._state
+        common = {
+            "entry_count": changes["entry_count"],
+            "translation_count": changes["translation_count"],
+            "watermark": changes["watermark"],
+        }
+        if changes["full"]:
+            entries = changes["entries"]
+            return SuggestState(
+                entries=entries, main=PrefixIndex(_postings(entries, entries)),
+                changed=frozenset(), delta=PrefixIndex([]), **common
+            )
+
+        updated = {
+            entry_id: entry for entry_id, entry in changes["entries"].items()
+            if state.entries.get(entry_id) != entry
+        }
+        if not updated:
+            return state._replace(**common)
+
+        entries = {**state.entries, **updated}
+        changed = state.changed | updated.keys()
+        if len(changed) > self.delta_max_entries:
+            return SuggestState(
+                entries=entries, main=PrefixIndex(_postings(entries, entries)),
+                changed=frozenset(), delta=PrefixIndex([]), **common
+            )
+        return SuggestState(
+            entries=entries, main=state.main, changed=frozenset(changed),
+            delta=PrefixIndex(_postings(entries, changed)), **common
+        )
+
+    async def refresh(self) -> None:
+        async with AsyncSessionLocal() as db:
+            changes = await db.run_sync(self._load)
+        self._state = await asyncio.to_thread(self._apply, changes)
+
+    def wake(self) -> None:
+        """Ask for a refresh soon; safe to call from any thread."""
+        self._refresher.wake()
+
+    async def start(self) -> None:
+        # Until a first refresh succeeds, suggest() returns nothing
+        await self._refresher.start(refresh_first=True)
+
+    async def stop(self) -> None:
+        await self._refresher.stop()
+
+
+entry_suggester = EntrySuggester(
+    refresh_seconds=settings.suggest_refresh_seconds,
+    delta_max_entries=settings.suggest_delta_max_entries,
+)
+
+
+@on_commit_of(Entry, Translation)
+def _refresh_suggester(session: Session) -> None:
+    entry_suggester.wake()
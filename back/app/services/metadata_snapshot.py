@@ -0,0 +1,131 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.background import BackgroundRefresher
+from app.core.cache import on_commit_of
+from app.core.config import settings
+from app.crud import entries as crud_entries
+from app.models.models import Comment, Entry, Translation
+from app.schemas.comments import CommentWithUser
+from app.schemas.entries import EntryMetadata, EntryWithComment, EntryWithTranslations
+
+# Every rebuild runs all the aggregates, so let a burst of writes settle first
+REFRESH_DEBOUNCE_SECONDS = 2.0
+
+
+def _map_entry_with_comment(entry) -> EntryWithComment:
+    """
+    Helper function to map Entry model with dynamic comment to EntryWithComment schema.
+    """
+    # Convert entry to dict first
+    entry_data = {
+        'id': entry.id,
+        'primary_name': entry.primary_name,
+        'original_script': entry.original_script,
+        'language_code': entry.language_code,
+        'entry_type': entry.entry_type,
+        'alternative_names': entry.alternative_names,
+        'other_language_codes': entry.other_language_codes,
+        'etymology': entry.etymology,
+        'definition': entry.definition,
+        'historical_context': entry.historical_context,
+        'created_by': entry.created_by,
+        'updated_by': entry.updated_by,
+        'is_verified': entry.is_verified,
+        'verification_notes': entry.verification_notes,
+        'created_at': entry.created_at,
+        'updated_at': entry.updated_at,
+        'newest_comment': CommentWithUser.model_validate(entry.newest_comment) if hasattr(entry, 'newest_comment') and entry.newest_comment else None
+    }
+    return EntryWithComment.model_validate(entry_data)
+
+
+def serialize_entries_metadata(metadata: Dict[str, Any]) -> bytes:
+    """Serialize get_entries_metadata() results as the EntryMetadata payload."""
+    return EntryMetadata(
+        total_entries=metadata['total_entries'],
+        recently_updated_count=metadata['recently_updated_count'],
+        newest_updated_entries=[
+            EntryWithTranslations.model_validate(entry)
+            for entry in metadata['newest_updated_entries']
+        ],
+        entries_with_newest_translations=[
+            EntryWithTranslations.model_validate(entry)
+            for entry in metadata['entries_with_newest_translations']
+        ],
+        entries_with_newest_comments=[
+            _map_entry_with_comment(entry)
+            for entry in metadata['entries_with_newest_comments']
+        ]
+    ).model_dump_json().encode("utf-8")
+
+
+class MetadataSnapshot:
+    """
+    Serialized GET /entries/metadata payload kept in memory, so requests
+    cost the same however large the tables grow.
+
+    A background task rebuilds it every `max_age_seconds / 2`, and shortly
+    after any local commit that wrote entries, translations or comments.
+    A request that finds the snapshot older than `max_age_seconds` (the
+    background task failed or is not running) rebuilds it first, so the
+    payload served is never older than that. Concurrent requests share one
+    rebuild.
+    """
+
+    def __init__(self, max_age_seconds: float):
+        self.max_age_seconds = max_age_seconds
+        self._content: Optional[bytes] = None
+        self._built_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._refresher = BackgroundRefresher(
+            self.refresh, interval=max_age_seconds / 2, debounce=REFRESH_DEBOUNCE_SECONDS,
+            name="Metadata snapshot refresh",
+        )
+
+    def _is_fresh(self) -> bool:
+        return self._content is not None and time.monotonic() - self._built_at <= self.max_age_seconds
+
+    async def get(self) -> bytes:
+        if not self._is_fresh():
+            if self._lock is None:
+                self._lock = asyncio.Lock()
+            async with self._lock:
+                # Another request may have rebuilt it while this one waited
+                if not self._is_fresh():
+                    await self._rebuild()
+        return self._content
+
+    async def refresh(self) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            await self._rebuild()
+
+    async def _rebuild(self) -> None:
+        # Age counts from before the queries, so it covers their duration
+        started_at = time.monotonic()
+        metadata = await crud_entries.aget_entries_metadata()
+        self._content, self._built_at = serialize_entries_metadata(metadata), started_at
+
+    def wake(self) -> None:
+        """Ask for a refresh soon; safe to call from any thread."""
+        self._refresher.wake()
+
+    async def start(self) -> None:
+        # If the first build fails, get() builds the snapshot on demand
+        await self._refresher.start(refresh_first=True)
+
+    async def stop(self) -> None:
+        await self._refresher.stop()
+
+
+metadata_snapshot = MetadataSnapshot(max_age_seconds=settings.metadata_max_age_seconds)
+
+
+@on_commit_of(Entry, Translation, Comment)
+def _refresh_metadata_snapshot(session: Session) -> None:
+    metadata_snapshot.wake()
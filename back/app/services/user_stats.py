@@ -0,0 +1,50 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.background import BackgroundRefresher
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+
+# Advisory lock key held while refresh_user_recent_stats() runs, so that of
+# several workers only one recomputes at a time
+REFRESH_LOCK_KEY = 0x75736572  # "user"
+
+
+class UserStatsRefresher:
+    """
+    Keeps the last-30-days counts of user_stats current by running
+    refresh_user_recent_stats() every `refresh_seconds` in the background;
+    triggers keep the other counts current.
+
+    Every worker runs the loop; a transaction-scoped advisory lock makes
+    sure that no two of them recompute at once. A run only reads the rows
+    created in the last 30 days and only writes users whose counts changed.
+    """
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._refresher = BackgroundRefresher(
+            self.refresh, interval=refresh_seconds, name="User stats refresh"
+        )
+
+    def _refresh(self, db: Session) -> bool:
+        if not db.execute(select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_KEY))).scalar():
+            return False
+        db.execute(select(func.refresh_user_recent_stats()))
+        db.commit()
+        return True
+
+    async def refresh(self) -> bool:
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(self._refresh)
+
+    async def start(self) -> None:
+        await self._refresher.start()
+        # First refresh right away, in the background
+        self._refresher.wake()
+
+    async def stop(self) -> None:
+        await self._refresher.stop()
+
+
+user_stats_refresher = UserStatsRefresher(refresh_seconds=settings.user_stats_refresh_seconds)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Fill translations.pinyin_full and pinyin_initials in batches.
+
+New and edited translations get their pinyin on write; run this once after
+the add_translation_pinyin migration for the existing rows. Each batch
+commits separately, so it can run against a live database. The updated_at
+trigger is disabled per batch so updated_at is left alone; run it as the
+owner of the translations table.
+
+Usage: uv run python scripts/backfill_pinyin.py [--batch-size 500]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.database import SessionLocal
+from app.crud import translations as crud_translations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        total = 0
+        while True:
+            updated = crud_translations.backfill_pinyin(db, batch_size=args.batch_size)
+            if not updated:
+                break
+            total += updated
+            print(f"Filled pinyin of {total} translations")
+        print(f"Done ({total} translations)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
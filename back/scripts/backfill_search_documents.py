@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Rebuild entry_search_documents in batches.
+
+The table is kept current by triggers; run this after changing the document
+definition or to repair drift. Each batch commits separately, so it can run
+against a live database without holding long locks.
+
+Usage: uv run python scripts/backfill_search_documents.py [--batch-size 500]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.database import SessionLocal
+from app.crud import entries as crud_entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        last_id = None
+        batches = 0
+        while True:
+            last_id = crud_entries.rebuild_search_documents(
+                db, after_id=last_id, batch_size=args.batch_size
+            )
+            if last_id is None:
+                break
+            batches += 1
+            print(f"Rebuilt documents up to entry {last_id}")
+        print(f"Done ({batches} batches)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
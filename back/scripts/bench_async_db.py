@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the sync vs async database layer on one event loop,
+i.e. what a single uvicorn worker sees.
+
+A mix of slow requests (pg_sleep) and fast requests (GET /entries/{id} style
+lookups) is started concurrently. With the sync Session every query blocks the
+loop, so fast requests queue behind slow ones; with AsyncSession they overlap.
+
+Usage: uv run python scripts/bench_async_db.py [--slow 10] [--fast 200] [--sleep 0.2]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import text
+
+from app.core.database import SessionLocal, AsyncSessionLocal, async_engine
+from app.crud import entries as crud_entries
+from app.models.models import Entry
+
+
+async def sync_request(entry_id, sleep):
+    # What an `async def` handler using the sync Session does today
+    db = SessionLocal()
+    try:
+        if sleep:
+            db.execute(text("SELECT pg_sleep(:s)"), {"s": sleep})
+        else:
+            crud_entries.get_entry(db, entry_id=entry_id)
+    finally:
+        db.close()
+
+
+async def async_request(entry_id, sleep):
+    async with AsyncSessionLocal() as db:
+        if sleep:
+            await db.execute(text("SELECT pg_sleep(:s)"), {"s": sleep})
+        else:
+            await crud_entries.aget_entry(db, entry_id=entry_id)
+
+
+async def run(request, entry_id, slow, fast, sleep):
+    fast_latencies = []
+    started = time.perf_counter()
+
+    async def staggered_fast(i):
+        # Fast requests keep arriving while the slow ones are running. Latency
+        # is measured from the scheduled arrival, so time spent waiting for a
+        # blocked event loop counts as well.
+        arrival = started + sleep * i / fast
+        await asyncio.sleep(max(0, arrival - time.perf_counter()))
+        await request(entry_id, 0)
+        fast_latencies.append(time.perf_counter() - arrival)
+
+    await asyncio.gather(
+        *[request(entry_id, sleep) for _ in range(slow)],
+        *[staggered_fast(i) for i in range(fast)],
+    )
+    elapsed = time.perf_counter() - started
+    fast_latencies.sort()
+    return {
+        "throughput": (slow + fast) / elapsed,
+        "p50": statistics.median(fast_latencies) * 1000,
+        "p95": fast_latencies[int(len(fast_latencies) * 0.95) - 1] * 1000,
+        "elapsed": elapsed,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async DB access on one event loop")
+    parser.add_argument("--slow", type=int, default=10, help="concurrent slow requests")
+    parser.add_argument("--fast", type=int, default=200, help="fast requests")
+    parser.add_argument("--sleep", type=float, default=0.2, help="seconds per slow request")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    entry_id = str(db.query(Entry.id).limit(1).scalar())
+    db.close()
+
+    # Warm up both pools so connection setup is not measured
+    await run(sync_request, entry_id, 1, 5, 0.01)
+    await run(async_request, entry_id, 1, 5, 0.01)
+
+    print(f"{args.slow} slow ({args.sleep}s) + {args.fast} fast requests on one event loop")
+    for name, request in (("sync Session", sync_request), ("AsyncSession", async_request)):
+        result = await run(request, entry_id, args.slow, args.fast, args.sleep)
+        print(
+            f"  {name:<13} {result['throughput']:>7.0f} req/s  "
+            f"fast p50 {result['p50']:>7.1f} ms  p95 {result['p95']:>7.1f} ms  "
+            f"total {result['elapsed']:.2f}s"
+        )
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
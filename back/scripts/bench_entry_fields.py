@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Measure what sparse fieldsets save on GET /entries.
+
+Calls the default listing (limit=100, include_translations=true) through the
+app, once with every field and once with `fields=` set to the columns the
+entries table shows by default, and reports response size and latency.
+
+Read-only; run it against a database whose entries have realistic
+etymology/definition/historical_context texts.
+
+Usage: uv run python scripts/bench_entry_fields.py [--limit 100] [--repeat 30] [--fields primary_name,language_code]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+# DEFAULT_VISIBLE_COLUMNS of the frontend entries table with source 'entry'
+DEFAULT_TABLE_FIELDS = "primary_name,language_code,entry_type,updated_at"
+
+
+def measure(client, params, repeat):
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get("/api/v1/entries/", params=params)
+        timings.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        size = len(response.content)
+    return size, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure sparse fieldsets on the entry listing")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--fields", default=DEFAULT_TABLE_FIELDS)
+    args = parser.parse_args()
+
+    base = {"limit": args.limit, "include_translations": "true"}
+    variants = {
+        "all fields": base,
+        "fields": {**base, "fields": args.fields},
+        "fields + top 1": {**base, "fields": args.fields, "translations_limit": 1},
+    }
+
+    with TestClient(app) as client:
+        # Warm up connections and the count cache
+        for params in variants.values():
+            measure(client, params, 3)
+
+        print(f"GET /entries limit={args.limit} include_translations=true, median of {args.repeat} runs")
+        baseline = None
+        for name, params in variants.items():
+            size, latency = measure(client, params, args.repeat)
+            baseline = baseline or (size, latency)
+            print(
+                f"  {name:<15} {size / 1024:>8.1f} KiB ({size / baseline[0]:>4.0%})  "
+                f"{latency:>7.1f} ms ({latency / baseline[1]:>4.0%})"
+            )
+
+
+if __name__ == "__main__":
+    main()
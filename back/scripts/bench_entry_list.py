@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark the GET /entries listing query with translations.
+
+Compares the previous single-query plan (joinedload of Entry.translations
+with OFFSET/LIMIT, which SQLAlchemy wraps in a subquery and which returns one
+row per translation, then re-sorted in Python) against the two-phase plan in
+crud.entries.get_entries (page of ids, entries by id, translations in one
+ordered IN query or top-N per entry through LATERAL).
+
+Read-only; run it against a database with a realistic number of entries
+(e.g. 100k).
+
+Usage: uv run python scripts/bench_entry_list.py [--limit 100] [--repeat 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import asc
+from sqlalchemy.orm import joinedload
+
+from app.core.database import SessionLocal
+from app.crud import entries as crud_entries
+from app.models.models import Entry
+from app.schemas.entries import CountMode
+
+
+def joined_page(db, skip, limit, sorted_by):
+    """The previous plan of get_entries(include_translations=True)"""
+    column = crud_entries.allowed_sort_columns[sorted_by]
+    entries = (
+        db.query(Entry)
+        .options(joinedload(Entry.translations))
+        .order_by(asc(column), asc(Entry.id))
+        .offset(skip)
+        .limit(limit + 1)
+        .all()
+    )[:limit]
+    for entry in entries:
+        if entry.translations:
+            entry.translations = sorted(
+                entry.translations, key=lambda t: (-t.is_preferred, t.created_at)
+            )
+    return entries
+
+
+def two_phase_page(db, skip, limit, sorted_by, translations_limit=None):
+    return crud_entries.get_entries(
+        db, skip=skip, limit=limit, sorted_by=sorted_by,
+        include_translations=True, translations_limit=translations_limit,
+        count=CountMode.NONE
+    )["items"]
+
+
+def measure(run, repeat):
+    timings = []
+    for _ in range(repeat):
+        db = SessionLocal()
+        try:
+            started = time.perf_counter()
+            run(db)
+            timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            db.rollback()
+            db.close()
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark entry listing with translations")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    total = db.query(Entry).count()
+    db.close()
+    print(f"{total} entries, page size {args.limit}, median of {args.repeat} runs")
+
+    for sorted_by in ("primary_name", "created_at"):
+        for skip in (0, total // 10, total // 2):
+            variants = {
+                "joinedload": lambda db: joined_page(db, skip, args.limit, sorted_by),
+                "two-phase": lambda db: two_phase_page(db, skip, args.limit, sorted_by),
+                "two-phase top 1": lambda db: two_phase_page(db, skip, args.limit, sorted_by, 1),
+            }
+            results = "  ".join(
+                f"{name} {measure(run, args.repeat):>7.1f} ms" for name, run in variants.items()
+            )
+            print(f"  {sorted_by:<13} skip={skip:<7} {results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark for the entries metadata aggregate: all queries one after
+another on one session (before) vs run_concurrently over pooled connections
+(after). The user metadata is a single statement and not measured here.
+
+Each variant is measured with `--clients` requests in flight at a time, so
+the effect of the per-request concurrency cap on a shared pool shows too.
+Caps to compare are given with --caps. Against a database on the same host
+the queries mostly compete for the same CPUs; --rtt-ms adds a pg_sleep per
+query to stand in for the network round trips of a remote database.
+
+Usage: uv run python scripts/bench_metadata_queries.py [--requests 50] [--clients 1] [--caps 2,4,8] [--rtt-ms 0]
+"""
+
+import argparse
+import asyncio
+import functools
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import text
+
+from app.core.database import AsyncSessionLocal, async_engine, run_concurrently
+from app.crud import entries as crud_entries
+
+
+def with_rtt(query, rtt):
+    if not rtt:
+        return query
+
+    def run(db, **kwargs):
+        db.execute(text("SELECT pg_sleep(:s)"), {"s": rtt})
+        return query(db, **kwargs)
+    return run
+
+
+async def sequential(queries, **kwargs):
+    # What the endpoints did before: every query on the request's one session
+    def run_all(db):
+        return {name: query(db, **kwargs) for name, query in queries.items()}
+    async with AsyncSessionLocal() as db:
+        return await db.run_sync(run_all)
+
+
+async def concurrent(queries, cap, **kwargs):
+    results = await run_concurrently(
+        (functools.partial(query, **kwargs) for query in queries.values()), max_concurrency=cap
+    )
+    return dict(zip(queries, results))
+
+
+async def measure(request, requests, clients):
+    latencies = []
+    semaphore = asyncio.Semaphore(clients)
+
+    async def timed():
+        async with semaphore:
+            started = time.perf_counter()
+            await request()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[max(int(len(latencies) * 0.95) - 1, 0)] * 1000,
+        "throughput": requests / elapsed,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark sequential vs concurrent metadata queries")
+    parser.add_argument("--requests", type=int, default=50, help="requests per variant")
+    parser.add_argument("--clients", type=int, default=1, help="requests in flight at a time")
+    parser.add_argument("--caps", default="2,4,8", help="comma separated per-request concurrency caps")
+    parser.add_argument("--rtt-ms", type=float, default=0, help="emulated round trip per query")
+    args = parser.parse_args()
+    caps = [int(cap) for cap in args.caps.split(",")]
+
+    aggregates = {
+        "entries metadata": (crud_entries.ENTRIES_METADATA_QUERIES, {}),
+    }
+
+    print(
+        f"{args.requests} requests per variant, {args.clients} in flight, "
+        f"{args.rtt_ms:g} ms emulated round trip, pool size {async_engine.pool.size()}"
+    )
+    for name, (queries, kwargs) in aggregates.items():
+        queries = {key: with_rtt(query, args.rtt_ms / 1000) for key, query in queries.items()}
+        variants = [("sequential", functools.partial(sequential, queries, **kwargs))]
+        variants += [
+            (f"concurrent cap={cap}", functools.partial(concurrent, queries, cap, **kwargs)) for cap in caps
+        ]
+        print(f"{name} ({len(queries)} queries)")
+        for label, request in variants:
+            # Warm up so connection setup and plan caching are not measured
+            await measure(request, 3, 1)
+            result = await measure(request, args.requests, args.clients)
+            print(
+                f"  {label:<18} p50 {result['p50']:>8.1f} ms  p95 {result['p95']:>8.1f} ms  "
+                f"{result['throughput']:>6.1f} req/s"
+            )
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark write amplification of non-text updates with the legacy
+(fire on every UPDATE) and the column-aware search_vector triggers.
+
+For each variant it runs vote-style counter updates on translations and
+flag updates on entries, then reports elapsed time, WAL bytes written and
+how many updates were HOT. Every variant runs in its own transaction that
+is rolled back, so the database is left unchanged.
+
+Usage: uv run python scripts/bench_search_vector_writes.py [--updates 2000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import text
+
+from app.core.database import engine
+
+
+LEGACY_TRIGGERS = """
+CREATE FUNCTION bench_legacy_translation_search_vector() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', COALESCE(NEW.translated_name, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(NEW.notes, '')), 'B');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION bench_legacy_entry_search_vector() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', COALESCE(NEW.primary_name, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(NEW.original_script, '')), 'B') ||
+        setweight(to_tsvector('english', COALESCE(array_to_string(NEW.alternative_names, ' '), '')), 'B') ||
+        setweight(to_tsvector('english', COALESCE(NEW.etymology, '')), 'C') ||
+        setweight(to_tsvector('english', COALESCE(NEW.definition, '')), 'C') ||
+        setweight(to_tsvector('english', COALESCE(NEW.historical_context, '')), 'C');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER update_translation_search_vector_trigger ON translations;
+CREATE TRIGGER update_translation_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON translations
+    FOR EACH ROW EXECUTE FUNCTION bench_legacy_translation_search_vector();
+
+DROP TRIGGER update_entry_search_vector_trigger ON entries;
+CREATE TRIGGER update_entry_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON entries
+    FOR EACH ROW EXECUTE FUNCTION bench_legacy_entry_search_vector();
+"""
+
+WORKLOADS = {
+    "translations": "UPDATE translations SET upvotes = upvotes + 1 WHERE id = :id",
+    "entries": "UPDATE entries SET is_verified = NOT is_verified WHERE id = :id",
+}
+
+
+def run_variant(name, updates, legacy):
+    results = {}
+    for table, statement in WORKLOADS.items():
+        with engine.connect() as conn:
+            transaction = conn.begin()
+            try:
+                if legacy:
+                    conn.exec_driver_sql(LEGACY_TRIGGERS)
+                ids = conn.execute(text(f"SELECT id FROM {table}")).scalars().all()
+                if not ids:
+                    continue
+                targets = [random.choice(ids) for _ in range(updates)]
+
+                start_lsn = conn.execute(text("SELECT pg_current_wal_insert_lsn()")).scalar()
+                started = time.perf_counter()
+                for target in targets:
+                    conn.execute(text(statement), {"id": target})
+                elapsed = time.perf_counter() - started
+                wal_bytes = conn.execute(
+                    text("SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), :start)"),
+                    {"start": start_lsn}
+                ).scalar()
+                stats = conn.execute(
+                    text("SELECT n_tup_upd, n_tup_hot_upd FROM pg_stat_xact_user_tables WHERE relname = :table"),
+                    {"table": table}
+                ).one()
+                results[table] = (elapsed, int(wal_bytes), stats.n_tup_upd, stats.n_tup_hot_upd)
+            finally:
+                transaction.rollback()
+
+    print(f"\n{name}")
+    for table, (elapsed, wal_bytes, updated, hot) in results.items():
+        print(
+            f"  {table:<13} {updates / elapsed:>9.0f} updates/s  "
+            f"{wal_bytes / updates:>8.0f} WAL bytes/update  "
+            f"{hot}/{updated} HOT"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark search_vector trigger write amplification")
+    parser.add_argument("--updates", type=int, default=2000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    run_variant("Before: trigger fires on every UPDATE", args.updates, legacy=True)
+    random.seed(0)
+    run_variant("After: column-aware trigger", args.updates, legacy=False)
+
+
+if __name__ == "__main__":
+    main()
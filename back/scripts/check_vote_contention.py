@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Contention check for translation voting.
+
+Creates a throwaway translation and a set of voters, then has every voter
+concurrently cast, flip and remove votes on that one translation (including
+duplicate concurrent requests from the same voter). Afterwards the stored
+upvotes/downvotes must equal the counts of the vote rows. Everything created
+here is removed again at the end.
+
+With --write-behind the votes leave their counter deltas in memory and a
+background flusher applies them, as with VOTE_WRITE_BEHIND=true.
+
+Usage: uv run python scripts/check_vote_contention.py [--voters 50] [--rounds 20] [--write-behind]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import func
+
+from app.core.database import SessionLocal, AsyncSessionLocal, async_engine
+from app.crud import translation_votes as crud_votes
+from app.models.models import User, Entry, Translation, TranslationVote
+from app.schemas.translations import VoteCreate, VoteType
+
+
+def create_fixtures(voters):
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        users = [
+            User(id=uuid.uuid4(), email=f"vote-contention-{tag}-{i}@example.com", is_activated=True)
+            for i in range(voters)
+        ]
+        db.add_all(users)
+        db.flush()
+        entry = Entry(
+            id=uuid.uuid4(), primary_name=f"vote contention {tag}", language_code="la",
+            created_by=users[0].id, updated_by=users[0].id
+        )
+        db.add(entry)
+        db.flush()
+        translation = Translation(
+            id=uuid.uuid4(), entry_id=entry.id, translated_name=f"vote contention {tag}",
+            created_by=users[0].id, updated_by=users[0].id
+        )
+        db.add(translation)
+        db.commit()
+        return str(translation.id), str(entry.id), [str(user.id) for user in users]
+    finally:
+        db.close()
+
+
+def remove_fixtures(translation_id, entry_id, user_ids):
+    db = SessionLocal()
+    try:
+        db.query(Translation).filter(Translation.id == translation_id).delete()
+        db.query(Entry).filter(Entry.id == entry_id).delete()
+        db.query(User).filter(User.id.in_(user_ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+async def apply(translation_id, user_id, action, deferred):
+    async with AsyncSessionLocal() as db:
+        if action == "delete":
+            await crud_votes.adelete_vote(
+                db, translation_id=translation_id, user_id=user_id, deferred=deferred
+            )
+        else:
+            await crud_votes.acreate_or_update_vote(
+                db, translation_id=translation_id, user_id=user_id,
+                vote=VoteCreate(vote_type=action), deferred=deferred
+            )
+
+
+async def voter(translation_id, user_id, rounds, deferred):
+    for _ in range(rounds):
+        action = random.choice([VoteType.UP, VoteType.UP, VoteType.DOWN, "delete"])
+        if random.random() < 0.2:
+            # Double submit: the same voter sends two requests at once
+            await asyncio.gather(
+                apply(translation_id, user_id, action, deferred),
+                apply(translation_id, user_id, random.choice([VoteType.UP, VoteType.DOWN]), deferred),
+            )
+        else:
+            await apply(translation_id, user_id, action, deferred)
+
+
+def check_counts(translation_id):
+    db = SessionLocal()
+    try:
+        translation = db.query(Translation).filter(Translation.id == translation_id).one()
+        actual = dict(
+            db.query(TranslationVote.vote_type, func.count())
+            .filter(TranslationVote.translation_id == translation_id)
+            .group_by(TranslationVote.vote_type)
+            .all()
+        )
+        return (translation.upvotes, translation.downvotes), (actual.get("up", 0), actual.get("down", 0))
+    finally:
+        db.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Check vote counters under concurrent voting")
+    parser.add_argument("--voters", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--write-behind", action="store_true", help="keep counter deltas in memory and flush in batches")
+    args = parser.parse_args()
+
+    translation_id, entry_id, user_ids = create_fixtures(args.voters)
+    try:
+        if args.write_behind:
+            await crud_votes.vote_flusher.start()
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            voter(translation_id, user_id, args.rounds, args.write_behind) for user_id in user_ids
+        ])
+        elapsed = time.perf_counter() - started
+        if args.write_behind:
+            # Applies whatever is still pending
+            await crud_votes.vote_flusher.stop()
+
+        stored, actual = check_counts(translation_id)
+        print(f"{args.voters} voters x {args.rounds} rounds in {elapsed:.2f}s")
+        print(f"  stored counts (up, down): {stored}")
+        print(f"  vote rows     (up, down): {actual}")
+        if stored != actual:
+            print("FAILED: vote counters drifted from the vote rows")
+            return 1
+        print("OK")
+        return 0
+    finally:
+        remove_fixtures(translation_id, entry_id, user_ids)
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
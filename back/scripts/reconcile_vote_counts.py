@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Recompute translation vote counts from the vote rows.
+
+Walks all translations in id order, one batch per transaction, and fixes
+upvotes/downvotes that drifted from translation_votes. Each batch holds its
+row locks only briefly, so this can run nightly against a live database.
+
+Usage: uv run python scripts/reconcile_vote_counts.py [--batch-size 1000] [--dry-run]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.database import SessionLocal
+from app.crud import translation_votes as crud_votes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="only report drifted translations")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        last_id = None
+        checked = 0
+        drifted = 0
+        while True:
+            last_id, batch_checked, batch_drifted = crud_votes.reconcile_vote_counts(
+                db, after_id=last_id, batch_size=args.batch_size, dry_run=args.dry_run
+            )
+            if last_id is None:
+                break
+            checked += batch_checked
+            drifted += len(batch_drifted)
+            for row in batch_drifted:
+                print(
+                    f"Translation {row['id']}: "
+                    f"up {row['stored_upvotes']} -> {row['upvotes']}, "
+                    f"down {row['stored_downvotes']} -> {row['downvotes']}"
+                )
+        action = "found" if args.dry_run else "fixed"
+        print(f"Done: checked {checked} translations, {action} {drifted} drifted")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
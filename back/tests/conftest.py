@@ -0,0 +1,13 @@
+import os
+
+# app.core.config reads these at import; the unit tests never connect
+for name, value in {
+    "DATABASE_URL": "postgresql://postgres@localhost/alcn_test",
+    "SECRET_KEY": "test",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "10",
+    "EMAIL_HOST": "localhost",
+    "EMAIL_USERNAME": "test@example.com",
+    "EMAIL_PASSWORD": "test",
+    "EMAIL_FROM": "test@example.com",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,39 @@
+import random
+
+from app.core.aho_corasick import AhoCorasick
+
+
+def _oracle(keys, text):
+    return sorted(
+        (start, start + len(key))
+        for key in set(keys) if key
+        for start in range(len(text) - len(key) + 1)
+        if text.startswith(key, start)
+    )
+
+
+def test_find_reports_every_occurrence():
+    keys = ["he", "she", "his", "hers", "h"]
+    text = "ushers and his sheep"
+    assert sorted(AhoCorasick(keys).find(text)) == _oracle(keys, text)
+
+
+def test_find_matches_brute_force():
+    rng = random.Random(11)
+    keys = ["".join(rng.choice("abα") for _ in range(rng.randint(1, 4))) for _ in range(30)]
+    automaton = AhoCorasick(keys)
+    assert automaton.key_count == len(set(keys))
+    for _ in range(50):
+        text = "".join(rng.choice("abαc") for _ in range(rng.randint(0, 40)))
+        assert sorted(automaton.find(text)) == _oracle(keys, text)
+
+
+def test_find_orders_by_end_position():
+    ends = [end for _, end in AhoCorasick(["abc", "bc", "c", "ab"]).find("abcab")]
+    assert ends == sorted(ends)
+
+
+def test_empty_keys_and_texts():
+    assert list(AhoCorasick([]).find("abc")) == []
+    assert list(AhoCorasick(["", "a"]).find("")) == []
+    assert AhoCorasick(["", "a"]).key_count == 1
@@ -0,0 +1,41 @@
+import uuid
+from datetime import datetime, timezone
+
+from app.services.entry_annotator import EntryAnnotator
+
+WATERMARK = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+
+def _row(entry_id, name):
+    return (entry_id, name, None, None, WATERMARK)
+
+
+def test_entries_without_keys_are_known():
+    # "X" folds to a key shorter than MIN_KEY_LENGTH, so it has no keys but
+    # must still count as known, or every refresh would scan all entry ids
+    achilles, x = uuid.uuid4(), uuid.uuid4()
+    annotator = EntryAnnotator(refresh_seconds=60, delta_max_keys=10)
+    annotator._state = annotator._apply({"rows": [_row(achilles, "Achilles"), _row(x, "X")], "existing": None})
+
+    assert annotator._state.entry_keys == {achilles: frozenset({"achilles"}), x: frozenset()}
+    assert [entry_ids for _, _, entry_ids in annotator.find("Achilles and X")] == [{achilles}]
+
+
+def test_deleted_entries_are_forgotten():
+    achilles, x = uuid.uuid4(), uuid.uuid4()
+    annotator = EntryAnnotator(refresh_seconds=60, delta_max_keys=10)
+    annotator._state = annotator._apply({"rows": [_row(achilles, "Achilles"), _row(x, "X")], "existing": None})
+    annotator._state = annotator._apply({"rows": [], "existing": {x}})
+
+    assert annotator._state.entry_keys == {x: frozenset()}
+    assert annotator.find("Achilles") == []
+
+
+def test_renamed_entry_without_keys_stays_known():
+    achilles = uuid.uuid4()
+    annotator = EntryAnnotator(refresh_seconds=60, delta_max_keys=10)
+    annotator._state = annotator._apply({"rows": [_row(achilles, "Achilles")], "existing": None})
+    annotator._state = annotator._apply({"rows": [_row(achilles, "A")], "existing": None})
+
+    assert annotator._state.entry_keys == {achilles: frozenset()}
+    assert annotator._state.keys == {}
@@ -0,0 +1,109 @@
+import pytest
+
+from app.crud import entries as crud_entries
+from app.crud.entries import _count_entries, _filter_key
+from app.schemas.entries import CountMode, FuzzyMode, SearchMode
+
+
+class CountingQuery:
+    """Stands in for the entries Query; only order_by(None).count() is used."""
+
+    def __init__(self, total):
+        self.total = total
+        self.counted = 0
+
+    def order_by(self, *_):
+        return self
+
+    def count(self):
+        self.counted += 1
+        return self.total
+
+
+@pytest.fixture(autouse=True)
+def empty_count_cache():
+    crud_entries._count_cache.clear()
+    yield
+    crud_entries._count_cache.clear()
+
+
+class Estimates(list):
+    """Records the `filtered` flag of every _estimate_count call."""
+    value = 42
+
+    def __call__(self, db, query, filtered):
+        self.append(filtered)
+        return self.value
+
+
+@pytest.fixture
+def estimates(monkeypatch):
+    estimate = Estimates()
+    monkeypatch.setattr(crud_entries, "_estimate_count", estimate)
+    return estimate
+
+
+def test_filter_key_normalizes_search_text():
+    assert _filter_key("  Achilles ", None, "", None, None) == _filter_key("achilles", None, None, None, None)
+
+
+@pytest.mark.parametrize("changed", [
+    dict(search="hector"),
+    dict(fuzzy_search="achilles"),
+    dict(language_code="grc"),
+    dict(other_language_code="la"),
+    dict(entry_type="person"),
+    dict(search="achilles", search_mode=SearchMode.NORMALIZED),
+    dict(search="achilles", search_mode=SearchMode.PINYIN),
+])
+def test_filter_key_differs_across_filters(changed):
+    base = dict(search="achilles", fuzzy_search=None, language_code=None, other_language_code=None, entry_type=None)
+    assert _filter_key(**{**base, **changed}) != _filter_key(**base)
+
+
+def test_filter_key_ignores_modes_without_their_search():
+    plain = _filter_key(None, None, "la", None, None)
+    assert _filter_key(None, None, "la", None, None, search_mode=SearchMode.CHINESE) == plain
+    assert _filter_key(None, None, "la", None, None, fuzzy_mode=FuzzyMode.KNN, fuzzy_threshold=0.5) == plain
+
+
+def test_filter_key_tracks_fuzzy_mode_and_threshold():
+    base = _filter_key(None, "achiles", None, None, None, fuzzy_mode=FuzzyMode.SIMILARITY, fuzzy_threshold=0.3)
+    assert _filter_key(None, "achiles", None, None, None, fuzzy_mode=FuzzyMode.KNN, fuzzy_threshold=0.3) != base
+    assert _filter_key(None, "achiles", None, None, None, fuzzy_mode=FuzzyMode.SIMILARITY, fuzzy_threshold=0.5) != base
+
+
+def test_count_none_runs_nothing(estimates):
+    query = CountingQuery(7)
+    assert _count_entries(None, query, CountMode.NONE, _filter_key("a", None, None, None, None)) is None
+    assert query.counted == 0
+    assert estimates == []
+
+
+def test_count_exact_is_cached_per_filter_set(estimates):
+    query = CountingQuery(7)
+    key = _filter_key("a", None, None, None, None)
+    assert _count_entries(None, query, CountMode.EXACT, key) == 7
+    assert _count_entries(None, query, CountMode.EXACT, key) == 7
+    assert query.counted == 1
+    assert _count_entries(None, query, CountMode.EXACT, _filter_key("b", None, None, None, None)) == 7
+    assert query.counted == 2
+    assert estimates == []
+
+
+@pytest.mark.parametrize("key, filtered", [
+    (_filter_key(None, None, None, None, None), False),
+    (_filter_key(None, None, "la", None, None), True),
+])
+def test_count_estimate_skips_the_count(estimates, key, filtered):
+    query = CountingQuery(7)
+    assert _count_entries(None, query, CountMode.ESTIMATE, key) == 42
+    assert estimates == [filtered]
+    assert query.counted == 0
+
+
+def test_count_estimate_falls_back_to_exact_without_statistics(estimates):
+    estimates.value = None
+    query = CountingQuery(7)
+    assert _count_entries(None, query, CountMode.ESTIMATE, _filter_key(None, None, None, None, None)) == 7
+    assert query.counted == 1
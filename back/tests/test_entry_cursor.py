@@ -0,0 +1,72 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.crud.entries import (
+    InvalidCursorError, _decode_cursor, _encode_cursor, _keyset_filter, allowed_sort_columns
+)
+from app.models.models import Entry
+
+
+def _sql(clause):
+    compiled = clause.compile(dialect=postgresql.dialect())
+    return " ".join(str(compiled).split()), compiled.params
+
+
+def test_cursor_round_trip():
+    entry_id = uuid.uuid4()
+    updated_at = datetime(2026, 10, 17, 12, 30, tzinfo=timezone.utc)
+    cursor = _encode_cursor("updated_at:desc", [updated_at, entry_id])
+    assert "=" not in cursor
+    assert _decode_cursor(cursor, "updated_at:desc") == [updated_at.isoformat(sep=" "), str(entry_id)]
+
+
+@pytest.mark.parametrize("cursor", ["", "not base64!", "bm90IGpzb24", _encode_cursor("x", [])[:-2] + "**"])
+def test_malformed_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        _decode_cursor(cursor, "x")
+
+
+def test_cursor_of_another_ordering():
+    with pytest.raises(InvalidCursorError, match="ordering"):
+        _decode_cursor(_encode_cursor("primary_name:asc", ["a", str(uuid.uuid4())]), "primary_name:desc")
+
+
+def test_keyset_filter_uses_row_comparison():
+    entry_id = uuid.uuid4()
+    order_keys = [(Entry.primary_name, False, False), (Entry.id, False, False)]
+    sql, params = _sql(_keyset_filter(order_keys, ["Achilles", str(entry_id)]))
+    assert sql == "(entries.primary_name, entries.id) > (%(param_1)s, %(param_2)s::UUID)"
+    assert params == {"param_1": "Achilles", "param_2": entry_id}
+
+    order_keys = [(Entry.created_at, True, False), (Entry.id, True, False)]
+    sql, params = _sql(_keyset_filter(order_keys, ["2026-10-17T12:30:00+00:00", str(entry_id)]))
+    assert sql == "(entries.created_at, entries.id) < (%(param_1)s, %(param_2)s::UUID)"
+    assert params["param_1"] == datetime(2026, 10, 17, 12, 30, tzinfo=timezone.utc)
+
+
+def test_keyset_filter_nullable_keys():
+    entry_id = uuid.uuid4()
+    column = allowed_sort_columns["entry_type"]
+
+    # Ascending: NULLs sort last, so they always follow a non-NULL cursor value
+    sql, _ = _sql(_keyset_filter([(column, False, True), (Entry.id, False, False)], ["deity", str(entry_id)]))
+    assert sql == "(entries.entry_type, entries.id) > (%(param_1)s, %(param_2)s::UUID) OR entries.entry_type IS NULL"
+    sql, _ = _sql(_keyset_filter([(column, False, True), (Entry.id, False, False)], [None, str(entry_id)]))
+    assert sql == "entries.entry_type IS NULL AND entries.id > %(id_1)s::UUID"
+
+    # Descending: NULLs sort first, every non-NULL row follows a NULL cursor value
+    sql, _ = _sql(_keyset_filter([(column, True, True), (Entry.id, True, False)], [None, str(entry_id)]))
+    assert sql == "entries.entry_type IS NULL AND entries.id < %(id_1)s::UUID OR entries.entry_type IS NOT NULL"
+
+
+def test_keyset_filter_rejects_mismatched_values():
+    order_keys = [(Entry.created_at, False, False), (Entry.id, False, False)]
+    with pytest.raises(InvalidCursorError):
+        _keyset_filter(order_keys, ["2026-10-17"])
+    with pytest.raises(InvalidCursorError, match="Malformed"):
+        _keyset_filter(order_keys, ["yesterday", str(uuid.uuid4())])
+    with pytest.raises(InvalidCursorError, match="Malformed"):
+        _keyset_filter(order_keys, ["2026-10-17", "not-a-uuid"])
@@ -0,0 +1,59 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.api.endpoints.entries import _etag_matches
+from app.crud.entries import _render_entry_detail
+
+ETAG = '"0123456789abcdef0123456789abcdef"'
+
+
+@pytest.mark.parametrize("header", [
+    ETAG,
+    f"W/{ETAG}",
+    f'"other", {ETAG}',
+    f'  "other" ,W/{ETAG} ',
+    "*",
+])
+def test_matches(header):
+    assert _etag_matches(header, ETAG)
+
+
+@pytest.mark.parametrize("header", [None, "", '"other"', ETAG.strip('"'), f'"{ETAG}"', "W/*x"])
+def test_does_not_match(header):
+    assert not _etag_matches(header, ETAG)
+
+
+TRANSLATION_ID = "0a5e67b7-5e93-4e9b-99a1-ed1fe1e2f976"
+UPDATED_AT = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+BODY = {
+    "id": "entry",
+    "translations": [{
+        "id": TRANSLATION_ID, "translated_name": "乌", "upvotes": 0, "downvotes": 0,
+        "updated_at": "2026-10-17T11:00:00Z", "user_vote": None,
+    }],
+}
+
+
+def test_counters_are_overlaid_on_the_cached_body():
+    detail = _render_entry_detail(1, ((TRANSLATION_ID, 3, 1, UPDATED_AT),), BODY)
+    translation = json.loads(detail.content)["translations"][0]
+    assert (translation["upvotes"], translation["downvotes"]) == (3, 1)
+    assert translation["updated_at"] == "2026-10-17T12:00:00Z"
+    assert translation["translated_name"] == "乌"
+    assert BODY["translations"][0]["upvotes"] == 0
+
+
+def test_etag_changes_with_the_counters():
+    first = _render_entry_detail(1, ((TRANSLATION_ID, 3, 1, UPDATED_AT),), BODY)
+    same = _render_entry_detail(1, ((TRANSLATION_ID, 3, 1, UPDATED_AT),), BODY)
+    voted = _render_entry_detail(1, ((TRANSLATION_ID, 4, 1, UPDATED_AT),), BODY)
+    assert first.etag == same.etag
+    assert first.etag != voted.etag
+
+
+def test_fields_left_out_of_the_body_stay_out():
+    body = {"id": "entry", "translations": [{"id": TRANSLATION_ID, "translated_name": "乌"}]}
+    detail = _render_entry_detail(1, ((TRANSLATION_ID, 3, 1, UPDATED_AT),), body)
+    assert json.loads(detail.content)["translations"][0] == {"id": TRANSLATION_ID, "translated_name": "乌"}
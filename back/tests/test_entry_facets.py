@@ -0,0 +1,60 @@
+from collections import namedtuple
+
+from app.crud.entries import ENTRY_FACETS, _facet_buckets
+
+Row = namedtuple("Row", [*ENTRY_FACETS[:3], "code", "grouping", "entries", "mentions"])
+
+# GROUPING() of (language_code, entry_type, is_verified, code) for each
+# grouping set: only the grouped-by column's bit is clear
+BY_LANGUAGE, BY_TYPE, BY_VERIFIED, BY_CODE, TOTAL = 0b0111, 0b1011, 0b1101, 0b1110, 0b1111
+
+
+def _row(grouping, value=None, entries=0, mentions=0):
+    values = [None] * 4
+    if grouping != TOTAL:
+        values[[BY_LANGUAGE, BY_TYPE, BY_VERIFIED, BY_CODE].index(grouping)] = value
+    return Row(*values, grouping=grouping, entries=entries, mentions=mentions)
+
+
+def test_rows_map_to_their_facet():
+    facets = _facet_buckets([
+        _row(TOTAL, entries=5, mentions=3),
+        _row(BY_LANGUAGE, "la", entries=3, mentions=2),
+        _row(BY_LANGUAGE, "grc", entries=2, mentions=1),
+        _row(BY_TYPE, "person", entries=4),
+        _row(BY_TYPE, None, entries=1),
+        _row(BY_VERIFIED, True, entries=1),
+        _row(BY_VERIFIED, False, entries=4),
+        _row(BY_CODE, "en", entries=2, mentions=2),
+        _row(BY_CODE, "fr", entries=1, mentions=1),
+    ])
+    assert facets == {
+        "total": 5,
+        "language_code": [{"value": "la", "count": 3}, {"value": "grc", "count": 2}],
+        "entry_type": [{"value": "person", "count": 4}, {"value": None, "count": 1}],
+        "is_verified": [{"value": False, "count": 4}, {"value": True, "count": 1}],
+        "other_language_codes": [{"value": "en", "count": 2}, {"value": "fr", "count": 1}],
+    }
+
+
+def test_null_grouping_values_are_told_apart_from_the_total():
+    # language_code NULL grouped by language_code is a bucket, not the total
+    facets = _facet_buckets([_row(TOTAL, entries=2), _row(BY_LANGUAGE, None, entries=2)])
+    assert facets["total"] == 2
+    assert facets["language_code"] == [{"value": None, "count": 2}]
+
+
+def test_entries_without_other_codes_get_no_code_bucket():
+    facets = _facet_buckets([_row(TOTAL, entries=1), _row(BY_CODE, None, entries=1, mentions=0)])
+    assert facets["other_language_codes"] == []
+
+
+def test_other_codes_count_mentions_not_entries():
+    facets = _facet_buckets([_row(BY_CODE, "en", entries=1, mentions=3)])
+    assert facets["other_language_codes"] == [{"value": "en", "count": 3}]
+
+
+def test_ties_are_ordered_by_value():
+    facets = _facet_buckets([_row(BY_LANGUAGE, "la", entries=1), _row(BY_LANGUAGE, "grc", entries=1)])
+    assert [bucket["value"] for bucket in facets["language_code"]] == ["grc", "la"]
+    assert facets["total"] == 0
@@ -0,0 +1,89 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from app.crud.entries import _filter_entries, _fuzzy_matches, _relevance_order
+from app.models.models import Entry
+from app.schemas.entries import FuzzyMode, SearchMode
+
+
+def _sql(clause):
+    compiled = clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    # The psycopg2 paramstyle escapes % as %%
+    return str(compiled).replace("%%", "%")
+
+
+def _filtered(**filters):
+    return _sql(_filter_entries(Query(Entry.id), **filters).statement)
+
+
+def test_similarity_candidates_come_from_every_name_index():
+    sql = _sql(_fuzzy_matches("achiles", FuzzyMode.SIMILARITY))
+    assert sql.count("UNION ALL") == 2
+    for name in ("entries.primary_name", "entry_alternative_names.name", "translations.translated_name"):
+        assert f"{name} % 'achiles'" in sql
+    assert "max(" in sql and "GROUP BY" in sql
+    assert "<%" not in sql
+
+
+def test_word_candidates_use_word_similarity():
+    sql = _sql(_fuzzy_matches("achil", FuzzyMode.WORD))
+    assert "'achil' <% entries.primary_name" in sql
+    assert "word_similarity('achil', translations.translated_name)" in sql
+    assert " % " not in sql
+
+
+def test_knn_candidates_are_only_primary_names():
+    sql = _filtered(fuzzy_search="achiles", fuzzy_mode=FuzzyMode.KNN)
+    assert "entries.primary_name % 'achiles'" in sql
+    assert "fuzzy_match" not in sql
+
+
+def test_knn_orders_by_distance_without_a_score():
+    score, order_keys, signature = _relevance_order(None, "achiles", SearchMode.ENGLISH, FuzzyMode.KNN)
+    assert score is None
+    assert signature == "distance"
+    (distance, descending, nullable), (tie_breaker, tie_descending, _) = order_keys
+    assert _sql(distance) == "entries.primary_name <-> 'achiles'"
+    assert (descending, nullable, tie_descending) == (False, False, False)
+    assert tie_breaker is Entry.id
+
+
+@pytest.mark.parametrize("fuzzy_mode", [FuzzyMode.SIMILARITY, FuzzyMode.WORD])
+def test_fuzzy_orders_by_best_score_first(fuzzy_mode):
+    score, order_keys, signature = _relevance_order(None, "achiles", SearchMode.ENGLISH, fuzzy_mode)
+    assert _sql(score) == "fuzzy_match.score"
+    assert order_keys[0] == (score, True, False)
+    assert signature == f"similarity:english:{fuzzy_mode.value}"
+
+
+def test_normalized_fuzzy_ignores_knn():
+    score, order_keys, signature = _relevance_order(None, "Akhilleus", SearchMode.NORMALIZED, FuzzyMode.KNN)
+    assert _sql(score) == "word_similarity(name_search_key('Akhilleus'), entry_search_documents.names_key)"
+    assert order_keys[0] == (score, True, False)
+    assert signature == "similarity:normalized:knn"
+
+
+def test_chinese_search_matches_han_bigrams():
+    sql = _filtered(search="阿喀琉", search_mode=SearchMode.CHINESE)
+    assert "entry_search_documents.han_document @@ han_tsquery('阿喀琉')" in sql
+
+
+def test_chinese_search_ranks_by_han_document():
+    score, order_keys, signature = _relevance_order("阿喀琉", None, SearchMode.CHINESE)
+    assert "ts_rank_cd(" in _sql(score)
+    assert "entry_search_documents.han_document, han_tsquery('阿喀琉')" in _sql(score)
+    assert order_keys[0] == (score, True, False)
+    assert signature == "rank:chinese"
+
+
+def test_pinyin_search_lists_by_reading():
+    score, order_keys, signature = _relevance_order("akl", None, SearchMode.PINYIN)
+    assert score is None
+    assert "preferred_pinyin" in _sql(order_keys[0][0])
+    assert order_keys[0][1:] == (False, True)
+    assert signature == "rank:pinyin"
+
+
+def test_no_search_has_no_relevance_order():
+    assert _relevance_order(None, None) is None
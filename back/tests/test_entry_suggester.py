@@ -0,0 +1,98 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.entry_suggester import EntrySuggester, _suggest_entry
+
+WATERMARK = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+
+def _entry(name, translations=(), is_verified=False):
+    row = (None, name, None, None, "la", None, is_verified)
+    return _suggest_entry(row, [(translated, False, 0, 0) for translated in translations])
+
+
+def _changes(entries, full, minutes=0):
+    return {
+        "entries": entries,
+        "full": full,
+        "entry_count": len(entries),
+        "translation_count": sum(entry.translation_count for entry in entries.values()),
+        "watermark": WATERMARK + timedelta(minutes=minutes),
+    }
+
+
+@pytest.fixture
+def ids():
+    return [uuid.uuid4() for _ in range(4)]
+
+
+@pytest.fixture
+def suggester(ids):
+    suggester = EntrySuggester(refresh_seconds=60, delta_max_entries=2)
+    suggester._state = suggester._apply(_changes({
+        ids[0]: _entry("Achilles", ["阿喀琉斯"]),
+        ids[1]: _entry("Agamemnon", is_verified=True),
+        ids[2]: _entry("Ajax"),
+    }, full=True))
+    return suggester
+
+
+def _names(suggester, query):
+    return [suggestion["primary_name"] for suggestion in suggester.suggest(query)]
+
+
+def test_full_load_builds_main_only(suggester):
+    state = suggester._state
+    assert len(state.entries) == 3 and state.changed == frozenset() and len(state.delta) == 0
+    assert _names(suggester, "a") == ["Agamemnon", "Achilles", "Ajax"]
+    assert _names(suggester, "阿") == ["Achilles"]
+
+
+def test_delta_serves_changed_entries(suggester, ids):
+    main = suggester._state.main
+    changes = _changes({ids[2]: _entry("Aias"), ids[3]: _entry("Antenor")}, full=False, minutes=1)
+    suggester._state = suggester._apply(changes)
+    state = suggester._state
+
+    assert state.main is main
+    assert state.changed == {ids[2], ids[3]}
+    assert state.watermark == WATERMARK + timedelta(minutes=1)
+    # The old name is still in main but skipped; the new one comes from the delta
+    assert _names(suggester, "aj") == []
+    assert _names(suggester, "aia") == ["Aias"]
+    assert _names(suggester, "an") == ["Antenor"]
+
+
+def test_unchanged_entries_keep_the_indexes(suggester, ids):
+    state = suggester._state
+    new_state = suggester._apply(_changes({ids[0]: _entry("Achilles", ["阿喀琉斯"])}, full=False, minutes=2))
+    assert new_state.main is state.main and new_state.delta is state.delta
+    assert new_state.changed == frozenset()
+    assert new_state.watermark == WATERMARK + timedelta(minutes=2)
+
+
+def test_too_many_changes_rebuild_main(suggester, ids):
+    suggester._state = suggester._apply(_changes({ids[2]: _entry("Aias")}, full=False))
+    main = suggester._state.main
+    suggester._state = suggester._apply(_changes({
+        ids[0]: _entry("Achilleus"), ids[1]: _entry("Agamemnon", ["阿伽门农"], is_verified=True),
+    }, full=False))
+    state = suggester._state
+
+    assert state.main is not main
+    assert state.changed == frozenset() and len(state.delta) == 0
+    assert _names(suggester, "achilleu") == ["Achilleus"]
+    assert _names(suggester, "阿") == ["Agamemnon"]
+
+
+def test_full_reload_replaces_delta(suggester, ids):
+    suggester._state = suggester._apply(_changes({ids[3]: _entry("Antenor")}, full=False))
+    suggester._state = suggester._apply(_changes({ids[0]: _entry("Achilles")}, full=True))
+    state = suggester._state
+
+    assert set(state.entries) == {ids[0]}
+    assert state.changed == frozenset() and len(state.delta) == 0
+    assert _names(suggester, "an") == []
+    assert _names(suggester, "a") == ["Achilles"]
@@ -0,0 +1,50 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from app.core import text
+from app.core.text import name_search_key
+
+MIGRATION = Path(__file__).parents[1] / "alembic" / "versions" / "6f2c8e4a1d57_add_normalized_name_search.py"
+
+
+def _sql_steps():
+    """The quoted (from, to) argument pairs of name_search_key() in the migration, in order."""
+    source = MIGRATION.read_text(encoding="utf-8")
+    body = source[source.index("FUNCTION name_search_key"):]
+    body = body[:body.index("$$ LANGUAGE")]
+    return re.findall(r"'([^']*)',\s*'([^']*)'", body)
+
+
+def test_python_steps_match_the_sql_function():
+    steps = _sql_steps()
+    digraphs = len(text._GREEK_DIGRAPHS)
+    merges = len(text._SPELLING_MERGES)
+    assert tuple(steps[:digraphs]) == text._GREEK_DIGRAPHS
+    assert steps[digraphs] == text._NAME_KEY_LETTERS
+    assert tuple(steps[digraphs + 1:digraphs + 1 + merges]) == text._SPELLING_MERGES
+    assert steps[digraphs + 1 + merges:] == [(text._INITIAL_H.pattern, "\\1")]
+
+
+def test_letter_mapping_is_one_to_one():
+    greek, latin = text._NAME_KEY_LETTERS
+    assert len(greek) == len(latin)
+
+
+@pytest.mark.parametrize("names, key", [
+    (["Ἀχιλλεύς", "Αχιλλευς", "Achilleus", "Akhilleus", "ACHILLEUS"], "achilleus"),
+    (["Ἡρακλῆς", "Herakles", "Hēraklēs"], "eracles"),
+    (["Ῥόδος", "Rhodos"], "rodos"),
+    (["Ἄγγελος", "Angelos"], "angelos"),
+    (["Σφίγξ", "Sphinx"], "sphinx"),
+    (["Ψυχή", "Psyche"], "psuche"),
+    (["Οὐρανός", "Ouranos", "Uranos"], "uranos"),
+    (["Iūlius  Caesar", "Julius Caesar"], "iulius caesar"),
+])
+def test_spellings_share_a_key(names, key):
+    assert {name_search_key(name) for name in names} == {key}
+
+
+def test_h_is_only_dropped_word_initially():
+    assert name_search_key("Hermes Thales") == "ermes thales"
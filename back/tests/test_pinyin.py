@@ -0,0 +1,46 @@
+import pytest
+
+from app.core.text import pinyin_keys, pinyin_query
+
+
+@pytest.mark.parametrize("name, full, initials", [
+    ("阿喀琉斯", "a ka liu si", "akls"),
+    ("普罗米修斯", "pu luo mi xiu si", "plmxs"),
+    ("宙斯", "zhou si", "zs"),
+])
+def test_full_pinyin_and_initials(name, full, initials):
+    assert pinyin_keys(name) == (full, initials)
+
+
+@pytest.mark.parametrize("name, full, initials", [
+    ("阿喀琉斯 Achilles", "a ka liu si achilles", "aklsa"),
+    ("Zeus宙斯", "zeus zhou si", "zzs"),
+    ("阿波罗2号", "a bo luo 2 hao", "abl2h"),
+    ("Ēōs 厄俄斯", "eos e e si", "eees"),
+])
+def test_mixed_han_and_latin(name, full, initials):
+    assert pinyin_keys(name) == (full, initials)
+
+
+@pytest.mark.parametrize("name", ["Ἀχιλλεύς", "", "  ", "——"])
+def test_text_without_latin_letters_or_han_has_no_keys(name):
+    assert pinyin_keys(name) == ("", "")
+
+
+@pytest.mark.parametrize("typed, query", [
+    ("akls", "akls"),
+    ("AKL", "akl"),
+    ("a ka liu si", "akaliusi"),
+    ("ā kā liú sī", "akaliusi"),
+    ("ākèliú", "akeliu"),
+    ("a-ka'liu", "akaliu"),
+    ("Ἀχ akl", "akl"),
+])
+def test_query_strips_tones_case_and_separators(typed, query):
+    assert pinyin_query(typed) == query
+
+
+def test_query_of_full_pinyin_matches_the_stored_key_without_spaces():
+    full, initials = pinyin_keys("阿喀琉斯")
+    assert pinyin_query("Ā kā liú sī") == full.replace(" ", "")
+    assert pinyin_query("AKLS") == initials
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from app.core.prefix_index import PrefixIndex
+
+
+def _oracle(items, prefix):
+    return sorted((item for item in items if item[0].startswith(prefix)), key=lambda item: -item[1])
+
+
+@pytest.fixture
+def items():
+    rng = random.Random(7)
+    keys = ["".join(rng.choice("abcσ") for _ in range(rng.randint(1, 5))) for _ in range(400)]
+    return [(key, float(rng.randint(0, 50)), index) for index, key in enumerate(keys)]
+
+
+def test_top_matches_brute_force(items):
+    index = PrefixIndex(items)
+    prefixes = {key[:length] for key, _, _ in items for length in range(1, len(key) + 1)}
+    for prefix in sorted(prefixes) + ["", "d", "abcabc"]:
+        got = list(index.top(prefix))
+        expected = _oracle(items, prefix)
+        assert sorted(got, key=lambda item: item[2]) == sorted(expected, key=lambda item: item[2])
+        assert [score for _, score, _ in got] == [score for _, score, _ in expected]
+
+
+def test_top_respects_prefix_bounds():
+    index = PrefixIndex([("ab", 1.0, 1), ("abc", 2.0, 2), ("abd", 3.0, 3), ("ac", 9.0, 4), ("a", 0.5, 5), ("b", 8.0, 6)])
+    assert [value for _, _, value in index.top("ab")] == [3, 2, 1]
+    assert [value for _, _, value in index.top("abc")] == [2]
+    assert [value for _, _, value in index.top("a")] == [4, 3, 2, 1, 5]
+    assert list(index.top("abe")) == []
+    assert list(index.top("c")) == []
+
+
+def test_top_is_lazy_and_empty_index():
+    index = PrefixIndex((str(n), float(n), n) for n in range(1000))
+    top = index.top("")
+    assert [next(top)[2] for _ in range(3)] == [999, 998, 997]
+    assert len(index) == 1000
+    assert list(PrefixIndex([]).top("a")) == []
@@ -0,0 +1,25 @@
+from app.core.text import fold, fold_with_offsets
+
+
+def test_fold_drops_accents_case_and_breathings():
+    assert fold("Ἀχιλλεύς") == "αχιλλευσ"
+    assert fold("  Mārcus   Tullius ") == "marcus tullius"
+    assert fold("ᾠδή") == "ωδη"
+
+
+def test_offsets_point_back_into_the_original():
+    text = "  Ἀχιλλεύς\t\tand  Hector"
+    folded, offsets = fold_with_offsets(text)
+    assert len(folded) == len(offsets)
+    assert offsets == sorted(offsets)
+    start = folded.index("hector")
+    assert text[offsets[start]:offsets[start] + len("hector")] == "Hector"
+    # Collapsed whitespace maps to the first character of the run
+    assert folded[offsets.index(10)] == " "
+
+
+def test_offsets_of_expanded_characters():
+    # "ﬁ" folds to two characters, both from the same source index
+    folded, offsets = fold_with_offsets("ﬁne")
+    assert folded == "fine"
+    assert offsets == [0, 0, 1, 2]
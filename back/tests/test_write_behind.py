@@ -0,0 +1,56 @@
+import asyncio
+
+from app.core.write_behind import WriteBehindFlusher
+
+
+def _flusher(results):
+    flushed = []
+
+    async def flush(deltas):
+        flushed.append(dict(deltas))
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return WriteBehindFlusher(flush, interval=60, max_pending=100), flushed
+
+
+def test_add_sums_deltas_per_key():
+    flusher, _ = _flusher([])
+    assert flusher.add("a", (1, 0)) == (1, 0)
+    assert flusher.add("a", (-1, 1)) == (0, 1)
+    assert flusher.add("b", (1, 0)) == (1, 0)
+    assert flusher.pending("a") == (0, 1)
+    assert flusher.pending("c") is None
+
+
+def test_flush_hands_over_every_delta_once():
+    flusher, flushed = _flusher([2])
+    flusher.add("a", (1, 0))
+    flusher.add("b", (0, 1))
+    asyncio.run(flusher.flush_now())
+    asyncio.run(flusher.flush_now())
+    assert flushed == [{"a": (1, 0), "b": (0, 1)}]
+    assert flusher.pending("a") is None
+
+
+def test_deltas_are_kept_when_flush_cannot_run():
+    flusher, flushed = _flusher([None, RuntimeError("down"), 1])
+    flusher.add("a", (1, 0))
+    asyncio.run(flusher.flush_now())
+    flusher.add("a", (1, 0))
+    asyncio.run(flusher.flush_now())
+    assert flusher.pending("a") == (2, 0)
+    asyncio.run(flusher.flush_now())
+    assert flushed[-1] == {"a": (2, 0)}
+    assert flusher.pending("a") is None
+
+
+def test_max_pending_wakes_the_flusher():
+    flusher, _ = _flusher([])
+    flusher.max_pending = 2
+    flusher.add("a", (1, 0))
+    assert not flusher._wake.is_set()
+    flusher.add("b", (1, 0))
+    assert flusher._wake.is_set()
@@ -15,6 +15,7 @@ export interface Entry {
   verification_notes?: string;
   created_at: string;
   updated_at: string;
+  score?: number | null;
 }
 
 export interface Translation {
@@ -27,6 +28,8 @@ export interface Translation {
   is_preferred: boolean;
   upvotes: number;
   downvotes: number;
+  pinyin_full?: string | null;
+  pinyin_initials?: string | null;
   created_at: string;
   updated_at: string;
 }
@@ -53,6 +56,8 @@ export interface Pagination {
 
 export interface PaginatedEntries extends Pagination {
   items: EntryWithTranslations[];
+  has_more?: boolean;
+  next_cursor?: string | null;
 }
 
 export interface EntrySearchParams {
@@ -60,10 +65,73 @@ export interface EntrySearchParams {
   limit?: number;
   search?: string;
   fuzzy_search?: string;
+  search_mode?: 'english' | 'normalized' | 'chinese' | 'pinyin';
+  fuzzy_mode?: 'similarity' | 'knn' | 'word';
+  fuzzy_threshold?: number;
   language_code?: string;
+  other_language_code?: string;
   entry_type?: string;
   sorted_by?: string;
   sort_direction?: 'asc' | 'desc';
+  cursor?: string;
+  count?: 'exact' | 'estimate' | 'none';
+  translations_limit?: number;
+  fields?: string;
+}
+
+export type EntryFacetParams = Pick<
+  EntrySearchParams,
+  | 'search'
+  | 'fuzzy_search'
+  | 'search_mode'
+  | 'fuzzy_mode'
+  | 'fuzzy_threshold'
+  | 'language_code'
+  | 'other_language_code'
+  | 'entry_type'
+>;
+
+export interface FacetCount {
+  value: string | boolean | null;
+  count: number;
+}
+
+export interface EntrySuggestion {
+  id: string;
+  primary_name: string;
+  language_code: string;
+  entry_type?: string | null;
+  is_verified: boolean;
+  matched_name: string;
+  translation?: string | null;
+}
+
+export interface AnnotatedEntry {
+  id: string;
+  primary_name: string;
+  original_script?: string | null;
+  language_code: string;
+  entry_type?: string | null;
+  preferred_translation?: string | null;
+}
+
+export interface AnnotationSpan {
+  start: number;
+  end: number;
+  text: string;
+  entries: AnnotatedEntry[];
+}
+
+export interface AnnotationResponse {
+  spans: AnnotationSpan[];
+}
+
+export interface EntryFacets {
+  total: number;
+  language_code: FacetCount[];
+  entry_type: FacetCount[];
+  is_verified: FacetCount[];
+  other_language_codes: FacetCount[];
 }
 
 export interface TrigramSearchParams {
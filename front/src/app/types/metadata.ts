@@ -8,3 +8,32 @@ export interface EntryMetadata {
   entries_with_newest_translations: EntryWithTranslations[];
   entries_with_newest_comments: EntryWithComment[];
 }
+
+export type ActivityEventType =
+  | 'entry_created'
+  | 'entry_updated'
+  | 'translation_created'
+  | 'translation_updated'
+  | 'comment_created'
+  | 'comment_updated'
+  | 'vote_cast';
+
+export interface ActivityEvent {
+  id: number;
+  event_type: ActivityEventType;
+  entry_id: string;
+  primary_name: string;
+  translation_id?: string;
+  comment_id?: string;
+  user_id?: string;
+  username?: string;
+  details?: Record<string, unknown>;
+  created_at: string;
+}
+
+export interface PaginatedActivity {
+  limit: number;
+  items: ActivityEvent[];
+  has_more: boolean;
+  next_cursor?: string;
+}
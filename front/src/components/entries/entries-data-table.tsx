@@ -111,6 +111,12 @@ export default function EntriesDataTable({ }: EntriesDataTableProps) {
         limit: pageSize,
         sorted_by: sortBy,
         sort_direction: sortDirection,
+        // Only load the entry fields of the visible columns; the table shows the first translation only
+        fields: AVAILABLE_COLUMNS
+          .filter(col => col.source === 'entry' && visibleColumns.has(col.key))
+          .map(col => col.key)
+          .join(','),
+        translations_limit: 1,
       };
 
       // Add search params
@@ -140,7 +146,7 @@ export default function EntriesDataTable({ }: EntriesDataTableProps) {
     } finally {
       setLoading(false);
     }
-  }, [currentPage, pageSize, sortBy, sortDirection, debouncedSearchQuery, languageFilter, typeFilter]);
+  }, [currentPage, pageSize, sortBy, sortDirection, debouncedSearchQuery, languageFilter, typeFilter, visibleColumns]);
 
   // Ref to track processed updates to prevent duplicate executions
   const processedUpdatesRef = useRef(new Set<string>());
@@ -3,6 +3,10 @@ import type {
   EntryMetadata,
   EntryWithTranslations,
   EntrySearchParams,
+  EntryFacetParams,
+  EntryFacets,
+  AnnotationResponse,
+  EntrySuggestion,
   CreateEntryRequest,
   UpdateEntryRequest,
   BulkUpdateRequest,
@@ -47,8 +51,19 @@ export const entriesService = {
     return response.data;
   },
 
-  async getEntryStats() {
-    const response = await api.get('/api/v1/entries/stats');
+  async getEntryStats(params?: EntryFacetParams) {
+    const response = await api.get<EntryFacets>('/api/v1/entries/stats', { params });
+    return response.data;
+  },
+
+  async suggestEntries(q: string, limit = 10) {
+    const response = await api.get<EntrySuggestion[]>('/api/v1/entries/suggest', { params: { q, limit } });
+    return response.data;
+  },
+
+  // Span offsets are code point indices; they equal JS string indices unless the text has astral characters
+  async annotateText(text: string) {
+    const response = await api.post<AnnotationResponse>('/api/v1/entries/annotate', { text });
     return response.data;
   },
 };
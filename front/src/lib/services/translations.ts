@@ -18,6 +18,8 @@ export interface VoteResponse {
   vote_type: VoteType;
   created_at: string;
   updated_at: string;
+  upvotes?: number | null;
+  downvotes?: number | null;
 }
 
 export const translationsService = {
@@ -12,6 +12,8 @@ export interface UserMetadata {
   };
   recent_entries: RecentEntry[];
   recent_translations: RecentTranslation[];
+  // When the counts above were computed (they may lag writes by a few minutes)
+  counts_as_of: string;
 }
 
 export interface TranslatedBook {